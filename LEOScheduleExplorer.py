@@ -0,0 +1,21 @@
+import streamlit as st
+from leosched.app import cache_report, sidebar
+
+# One app for every term: FA24 (root scripts), W25/, SS25/ and Summer25/.
+# Terms load on first selection and the least recently used ones are evicted
+# once the cache passes its memory budget (LEOSCHED_TERM_BUDGET_MB).
+
+page = st.navigation([
+    st.Page('explorer/day_view.py', title='Day - Campus - Building', default=True),
+    st.Page('explorer/instructor_week.py', title='Instructor week'),
+    st.Page('explorer/live.py', title='In session now'),
+    st.Page('explorer/transitions.py', title='Building transitions'),
+    st.Page('explorer/patterns.py', title='Meeting patterns'),
+    st.Page('explorer/workload.py', title='Contact minutes vs FTE'),
+    st.Page('explorer/filter_builder.py', title='Custom filter'),
+    st.Page('explorer/workload_cube.py', title='Workload summary'),
+    st.Page('explorer/sql.py', title='SQL query'),
+])
+sidebar()
+page.run()
+cache_report()
@@ -1,21 +1,30 @@
-import json 
-import requests
 import streamlit as st
 import pandas as pd
+from leosched.buildings import FACILITY_COLUMNS, building_registry
+from leosched.fetch import fetch_all, parse_csv, parse_json
+from leosched.prune import describe, prune
+from leosched.roster import lecturer_ids, semi_join
 
 
 url = "https://raw.githubusercontent.com/umsi-amadaman/LEOcourseschedules/main/UMICHbuildings_dict.json"
-response = requests.get(url)
-new_Bldgs = json.loads(response.text)
 
 
 
 DATA = 'https://github.com/umsi-amadaman/LEOcourseschedules/raw/main/LEOAug24Schedule.csv'
 
-sched = pd.read_csv(DATA)
-
 monthlydata = 'https://raw.githubusercontent.com/umsi-amadaman/LEOcourseschedules/refs/heads/main/LEO_Oct24Monthly.csv'
-monthly = pd.read_csv(monthlydata)
+
+# fetch every source concurrently; falls back to the last good copy if GitHub is slow or down
+fetched = fetch_all({
+    'buildings': (url, parse_json),
+    'sched': (DATA, parse_csv),
+    'monthly': (monthlydata, parse_csv),
+})
+new_Bldgs, sched, monthly = fetched['buildings'], fetched['sched'], fetched['monthly']
+
+# drop placeholder and instructor-less rows no day view can show, before any other work
+sched, pruned, prune_counts = prune(sched)
+
 
 
 # Convert 'Class Instr ID' in sched to numeric, setting errors='coerce' to handle non-numeric values
@@ -30,6 +39,9 @@ monthly = monthly.dropna(subset=['UM ID']).copy()
 sched.loc[:, 'Class Instr ID'] = sched['Class Instr ID'].astype(float)
 monthly.loc[:, 'UM ID'] = monthly['UM ID'].astype(float)
 
+# Semi-join on the roster's LEO lecturer IDs so the merge only sees lecturer rows
+sched = semi_join(sched, 'Class Instr ID', lecturer_ids(monthly))
+
 # Perform an inner join, matching 'Class Instr ID' from sched with 'UM ID' from monthly
 merged_df = sched.merge(
     monthly[['UM ID', 'Job Title', 'Appointment Start Date', 'FTE', 'Department Name', 'Deduction']],
@@ -43,38 +55,8 @@ sched = merged_df.drop(columns=['Class Instr ID'])
 sched['UM ID'] = sched['UM ID'].apply(lambda x: f"{x:.0f}")
 
 
-def find_longest_match(string, key_list):
-    matches = [key for key in key_list if string in key or key in string]
-    return max(matches, key=len, default=None)
-
-# Create new columns with default values
-sched['RoomPrediction'] = ''
-sched['BldgPrediction'] = ''
-sched['CampusPrediction'] = ''
-
-# Iterate through unique Facility IDs
-for x in sched['Facility ID'].unique():
-    # Check if x is a string AND not just whitespace
-    if isinstance(x, str) and x.strip():  # Added .strip() check here
-        match = find_longest_match(x, new_Bldgs.keys())
-        if match:
-            # Remove the matched part from the original string
-            remaining = x.replace(match, '').strip()
-            
-            # Update the DataFrame for all rows with this Facility ID
-            mask = sched['Facility ID'] == x
-            sched.loc[mask, 'RoomPrediction'] = remaining
-            sched.loc[mask, 'BldgPrediction'] = match
-            sched.loc[mask, 'CampusPrediction'] = new_Bldgs[match][-1]
-        else:
-            # If no match, set only RoomPrediction to the original string
-            mask = sched['Facility ID'] == x
-            sched.loc[mask, 'BldgPrediction'] = x
-
-# After the loop, fill NaN values if any
-sched['RoomPrediction'] = sched['RoomPrediction'].fillna('')
-sched['BldgPrediction'] = sched['BldgPrediction'].fillna('')
-sched['CampusPrediction'] = sched['CampusPrediction'].fillna('')
+# Resolve each Facility ID to room / building / campus through the compiled building registry
+sched[FACILITY_COLUMNS] = building_registry(new_Bldgs).split_facility(sched['Facility ID'])
 
 
 # Title of the app
@@ -146,3 +128,5 @@ st.write(f"Buildings used: {', '.join(unique_buildings)}")
 
 #st.write("Columns right before display:", final_df.columns)
 #st.write("Sample of UM ID values:", final_df['UM ID'].head())
+
+st.caption(f"Rows pruned at ingest: {describe(prune_counts)}")
@@ -1,9 +1,14 @@
 import streamlit as st
 import pandas as pd
-import json
-import requests
+import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from leosched.buildings import DEARBORN, building_registry
+from leosched.fetch import parse_json, remote
+from leosched.prune import describe, prune
+from leosched.roster import lecturer_ids, lecturer_mask, semi_join
+
 # ------------------ Paths / Constants ------------------
 BASE_DIR = Path(__file__).resolve().parent
 AA_FILE      = BASE_DIR / "AASchedSum25.csv"
@@ -13,33 +18,37 @@ MONTHLY_FILE = BASE_DIR / "MonthlyJuly25.csv"
 LEO_PREFIX   = "leo"  # case‑insensitive prefix for lecturers
 
 # ------------------ Helpers ------------------
-@st.cache_data
 def load_buildings():
+    # served from memory; a corrected upstream file is picked up in the background
     url = "https://raw.githubusercontent.com/umsi-amadaman/LEOcourseschedules/main/UMICHbuildings_dict.json"
-    return requests.get(url).json()
+    return remote(url, parse_json).get()[1]
 
 @st.cache_data
 def load_monthly():
     return pd.read_csv(MONTHLY_FILE, dtype=str)
 
+@st.cache_data
+def load_lecturers():
+    """Sorted UM IDs of LEO lecturers, built once per monthly file."""
+    return lecturer_ids(load_monthly(), LEO_PREFIX)
+
 def merge_monthly(df: pd.DataFrame, id_col: str) -> pd.DataFrame:
     """Merge schedule with Monthly and retain only rows whose Job Title begins with LEO."""
+    # semi-join first: only lecturer rows reach the wide roster merge
+    df = semi_join(df, id_col, load_lecturers())
     monthly = load_monthly()
+    leo = monthly[lecturer_mask(monthly, LEO_PREFIX)].copy()
+
     # numeric‑safe IDs for robust merge
     df[id_col] = pd.to_numeric(df[id_col], errors="coerce")
-    monthly["UM ID"] = pd.to_numeric(monthly["UM ID"], errors="coerce")
-    merged = df.merge(monthly, left_on=id_col, right_on="UM ID", how="left")
-
-    # keep lecturers (case‑insensitive) and non‑blank titles
-    mask = merged["Job Title"].fillna("").str.lower().str.startswith(LEO_PREFIX)
-    merged = merged[mask & merged["Job Title"].str.strip().ne("")]
-    return merged
+    leo["UM ID"] = pd.to_numeric(leo["UM ID"], errors="coerce")
+    return df.merge(leo, left_on=id_col, right_on="UM ID", how="inner")
 
 # ------------------ Ann Arbor ------------------
 
 def show_ann_arbor():
     st.header("Ann Arbor Schedule by Day and Subject")
-    raw = pd.read_csv(AA_FILE, dtype=str)
+    raw, _, prune_counts = prune(pd.read_csv(AA_FILE, dtype=str))
     merged = merge_monthly(raw, "Class Instr ID")
 
     # original big drop list (minus "Deduction") plus the four extra columns the user asked for
@@ -71,6 +80,7 @@ def show_ann_arbor():
 
     st.dataframe(day_df)
     st.write(f"Total classes: {len(day_df)}")
+    st.caption(f"Rows pruned at ingest: {describe(prune_counts)}")
 
 # ------------------ Dearborn ------------------
 
@@ -115,8 +125,10 @@ def show_dearborn():
         "Term Code", "Seq Number", "Instructor ID"]
     merged.drop(columns=[c for c in db_drop if c in merged.columns], inplace=True)
 
-    bdict = load_buildings()
-    merged["Location"] = merged["Bldg"].map(bdict).fillna(merged["Bldg"]) + " " + merged["Room"].fillna("")
+    # Dearborn codes resolve in their own namespace, not through the A2 table
+    registry = building_registry(load_buildings())
+    bldg_name = registry.map(merged["Bldg"], "name", DEARBORN).fillna(merged["Bldg"])
+    merged["Location"] = bldg_name + " " + merged["Room"].fillna("")
 
     days = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday"]
     sel_day = st.selectbox("Select Day", days, key="db_day")
@@ -134,7 +146,7 @@ def show_dearborn():
 
 def show_flint():
     st.header("Flint Schedule by Day and Subject")
-    raw = pd.read_csv(FLINT_FILE, dtype=str)
+    raw, _, prune_counts = prune(pd.read_csv(FLINT_FILE, dtype=str))
     merged = merge_monthly(raw, "Instructor ID")
 
     days = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday"]
@@ -149,6 +161,7 @@ def show_flint():
 
     st.dataframe(day_df)
     st.write(f"Total classes: {len(day_df)}")
+    st.caption(f"Rows pruned at ingest: {describe(prune_counts)}")
 
 # ------------------ Main ------------------
 
@@ -1,37 +1,40 @@
-import json 
-import requests
 import streamlit as st
 import pandas as pd
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from leosched.fetch import fetch_all, parse_csv, parse_json
+from leosched.roster import lecturer_ids, semi_join
 
 
 url = "https://raw.githubusercontent.com/umsi-amadaman/LEOcourseschedules/main/UMICHbuildings_dict.json"
-response = requests.get(url)
-new_Bldgs = json.loads(response.text)
 
 
 
 DATA = 'https://github.com/umsi-amadaman/LEOcourseschedules/raw/main/W25/DearbornScheduleW25.csv'
 #https://github.com/umsi-amadaman/LEOcourseschedules/blob/main/W25/A2SchedW25.csv
 
-sched = pd.read_csv(DATA)
+monthlydata = 'https://github.com/umsi-amadaman/LEOcourseschedules/raw/main/W25/LEOmonthly_Jan25.csv'
+
+# fetch every source concurrently; falls back to the last good copy if GitHub is slow or down
+fetched = fetch_all({
+    'buildings': (url, parse_json),
+    'sched': (DATA, parse_csv),
+    'monthly': (monthlydata, parse_csv),
+})
+new_Bldgs, sched, monthly = fetched['buildings'], fetched['sched'], fetched['monthly']
 
 #Breakout Room and Building
 sched['Room'] = sched['Room Code']
 sched['Bldg'] = sched['Building Code']
 
-monthlydata = 'https://github.com/umsi-amadaman/LEOcourseschedules/raw/main/W25/LEOmonthly_Jan25.csv'
-
-
-monthly = pd.read_csv(monthlydata)
 
 # Convert Primary Instructor ID to numeric (int64) to match Monthly's UM ID
 sched['Primary Instructor ID'] = pd.to_numeric(sched['Primary Instructor ID'], errors='coerce')
 
-# Create a filter for rows where Primary Instructor ID exists in Monthly's UM ID
-valid_ids = sched['Primary Instructor ID'].isin(monthly['UM ID'])
-
-# Apply the filter to sched
-sched = sched[valid_ids]
+# Keep only rows taught by a LEO lecturer on the roster (sorted-ID semi-join)
+sched = semi_join(sched, 'Primary Instructor ID', lecturer_ids(monthly))
 
 # Title of the app
 st.title('Dearborn Schedule Viewer by Day - Subject')
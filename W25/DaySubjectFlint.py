@@ -1,54 +1,52 @@
-import json 
-import requests
 import streamlit as st
 import pandas as pd
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from leosched.fetch import fetch_all, parse_csv, parse_json
+from leosched.linkage import full_names, link_names
+from leosched.prune import describe, prune
 
 
 url = "https://raw.githubusercontent.com/umsi-amadaman/LEOcourseschedules/main/UMICHbuildings_dict.json"
-response = requests.get(url)
-new_Bldgs = json.loads(response.text)
 
 
 
 DATA = 'https://github.com/umsi-amadaman/LEOcourseschedules/raw/main/W25/FlintScheduleW25.csv'
 #https://github.com/umsi-amadaman/LEOcourseschedules/blob/main/W25/A2SchedW25.csv
 
-sched = pd.read_csv(DATA)
-
-#Breakout Room and Building
-sched['Room'] = sched['Facility ID'].str.rsplit(' ', n=1).str[0]
-sched['Bldg'] = sched['Facility Descr'].str.rsplit(' ', n=1).str[-1]
-
 monthlydata = 'https://github.com/umsi-amadaman/LEOcourseschedules/raw/main/W25/LEOmonthly_Jan25.csv'
+emaildata = 'https://github.com/umsi-amadaman/LEOcourseschedules/raw/main/FlintEmails.csv'
 
+# fetch every source concurrently; falls back to the last good copy if GitHub is slow or down
+fetched = fetch_all({
+    'buildings': (url, parse_json),
+    'sched': (DATA, parse_csv),
+    'monthly': (monthlydata, parse_csv),
+    'emails': (emaildata, parse_csv),
+})
+new_Bldgs, sched, monthly = fetched['buildings'], fetched['sched'], fetched['monthly']
+emails = fetched['emails']
 
-monthly = pd.read_csv(monthlydata)
-
-IGNORED = '''
-# Convert 'Class Instr ID' in sched to numeric, setting errors='coerce' to handle non-numeric values
-sched['Class Instr ID'] = pd.to_numeric(sched['Class Instr ID'], errors='coerce')
-monthly['UM ID'] = pd.to_numeric(monthly['UM ID'], errors='coerce')
+# drop placeholder and instructor-less rows no day view can show, before any other work
+sched, pruned, prune_counts = prune(sched)
 
-# Drop rows with NaN in 'Class Instr ID' or 'UM ID'
-sched = sched.dropna(subset=['Class Instr ID']).copy()
-monthly = monthly.dropna(subset=['UM ID']).copy()
+#Breakout Room and Building
+sched['Room'] = sched['Facility ID'].str.rsplit(' ', n=1).str[0]
+sched['Bldg'] = sched['Facility Descr'].str.rsplit(' ', n=1).str[-1]
 
-# Convert columns to float explicitly using .loc
-sched.loc[:, 'Class Instr ID'] = sched['Class Instr ID'].astype(float)
-monthly.loc[:, 'UM ID'] = monthly['UM ID'].astype(float)
 
-# Perform an inner join, matching 'Class Instr ID' from sched with 'UM ID' from monthly
-merged_df = sched.merge(
-    monthly[['UM ID', 'Job Title', 'Appointment Start Date', 'FTE', 'Department Name', 'Deduction']],
-    left_on='Class Instr ID',
-    right_on='UM ID',
-    how='inner'
-)
-
-# Drop the redundant 'UM ID' column from the result
-sched = merged_df.drop(columns=['Class Instr ID'])
-sched['UM ID'] = sched['UM ID'].apply(lambda x: f"{x:.0f}")
-'''
+# Flint exports carry no instructor ID, so link names to the Flint roster and email list
+flint_roster = monthly[monthly['Department Name'].str.startswith('Flint', na=False)]
+roster_links = link_names(sched['Class Instr Name'], full_names(flint_roster, 'Employee Last Name', 'Employee First Name'))
+linked = flint_roster.loc[roster_links['match'], ['UM ID', 'Job Title', 'Appointment Start Date', 'FTE', 'Department Name', 'Deduction']]
+linked.index = roster_links.index
+linked['Link Score'] = roster_links['score']
+email_links = link_names(sched['Class Instr Name'], full_names(emails, 'Last Name', 'First Name'))
+linked['Email'] = email_links['match'].map(emails['Email'])
+sched = sched.merge(linked, left_on='Class Instr Name', right_index=True, how='left')
+sched['UM ID'] = sched['UM ID'].map(lambda x: f"{x:.0f}", na_action='ignore')
 
 # Title of the app
 st.title('Flint Schedule Viewer by Day - Subject')
@@ -97,9 +95,10 @@ final_df = final_df[['Meeting Time Start', 'Meeting Time End','Room', 'Bldg', 'C
        'Catalog Nbr', 
        'Class Mtg Nbr',
        'Meeting Start Dt', 'Meeting End Dt',
-       'Mon', 'Tues', 'Wed', 'Thurs', 'Fri', 'Sat', 'Sun']]
+       'Mon', 'Tues', 'Wed', 'Thurs', 'Fri', 'Sat', 'Sun',
+       'UM ID', 'Job Title', 'Appointment Start Date', 'FTE', 'Department Name', 'Deduction', 'Email', 'Link Score']]
 
-### we're not looking up lecs like we do for A2... so you gotta get their appt info yourself
+### lecturers are linked to the roster by name above; 'Link Score' is the match confidence
 
 IGNORE2 = '''
 final_df = final_df[['Meeting Time Start', 'Meeting Time End','Room', 'Bldg', 'Crse Descr', 'Subject',
@@ -123,3 +122,5 @@ st.dataframe(final_df)
 
 #st.write("Columns right before display:", final_df.columns)
 #st.write("Sample of UM ID values:", final_df['UM ID'].head())
+
+st.caption(f"Rows pruned at ingest: {describe(prune_counts)}")
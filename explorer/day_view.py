@@ -0,0 +1,90 @@
+import datetime as dt
+
+import streamlit as st
+from leosched.app import current_frame, download_buttons, paged_table, term_index
+from leosched.dates import DateIndex
+from leosched.export import sort_rows
+from leosched.schedule import DAY_NAMES
+from leosched.search import SearchIndex, day_positions, facet_positions, intersect
+from leosched.timeindex import TimeIndex
+
+st.title('LEO Schedule Explorer')
+
+sched = current_frame()
+
+# Search and facet indexes, built once per term and frame
+index = term_index('search', SearchIndex)
+by_day = term_index('days', day_positions)
+by_campus = term_index('campus', lambda df: facet_positions(df, 'CampusPrediction'))
+by_building = term_index('building', lambda df: facet_positions(df, 'BldgPrediction'))
+by_date = term_index('dates', DateIndex)
+by_time = term_index('times', TimeIndex)
+
+# Course search: prefix and typo-tolerant, e.g. "counterp", "eecs 280"
+query = st.text_input('Search courses (description, subject or number):')
+hits = index.search(query) if query.strip() else None
+if hits is not None:
+    suggestions = index.suggest(query)
+    if suggestions:
+        st.caption("Matches: " + ", ".join(suggestions))
+
+# A weekday shows every section meeting that day; a calendar date only those
+# whose date range (Summer I vs II, half terms) includes it
+if st.radio('View by:', ['Day of week', 'Calendar date'], horizontal=True) == 'Day of week':
+    selected_day = st.selectbox('Select a day of the week:', DAY_NAMES)
+    weekday = selected_day
+    day_rows = intersect(by_day[selected_day], hits)
+    day_tag = selected_day
+else:
+    first, last = by_date.bounds
+    selected_date = st.date_input('Select a date:', value=first, min_value=first, max_value=last)
+    selected_day = f"{selected_date:%A, %m/%d/%Y}"
+    day_tag = f"{selected_date:%Y-%m-%d}"
+    weekday = DAY_NAMES[selected_date.weekday()]
+    day_rows = intersect(by_date.positions(selected_date), hits)
+
+# Time of day, answered by binary search on that day's sorted start / end minutes
+time_mode = st.radio('Time of day:', ['Any time', 'Starting at or after', 'In session at'], horizontal=True)
+if time_mode != 'Any time':
+    at = st.time_input('Time:', value=dt.time(16, 0), step=900)
+    minute = at.hour * 60 + at.minute
+    if time_mode == 'Starting at or after':
+        time_rows = by_time.starting(weekday, after=minute)
+        selected_day += f", starting at or after {at:%H:%M}"
+    else:
+        time_rows = by_time.in_session(weekday, minute)
+        selected_day += f", in session at {at:%H:%M}"
+    day_rows = intersect(day_rows, time_rows)
+    day_tag += f"_{at:%H%M}"
+
+# Campus, then building, with meeting counts in the labels
+campus_counts = {c: len(intersect(day_rows, pos)) for c, pos in by_campus.items()}
+campus_counts = {c: n for c, n in sorted(campus_counts.items(), key=lambda kv: -kv[1]) if n > 0}
+if not campus_counts:
+    st.write(f"No meetings on {selected_day} for this term.")
+    st.stop()
+campus_options = [f"{campus} ({count})" for campus, count in campus_counts.items()]
+selected_campus = st.selectbox('Select a campus:', campus_options).split(' (')[0]
+campus_rows = intersect(day_rows, by_campus[selected_campus])
+
+building_counts = {b: len(intersect(campus_rows, pos)) for b, pos in by_building.items()}
+building_options = [f"ALL ({len(campus_rows)})"] + [
+    f"{building} ({count})" for building, count in sorted(building_counts.items(), key=lambda kv: -kv[1]) if count > 0
+]
+selected_building = st.selectbox('Select a building:', building_options).split(' (')[0]
+rows = campus_rows if selected_building == "ALL" else intersect(campus_rows, by_building[selected_building])
+
+if selected_building == "ALL":
+    st.write(f"Showing schedule for ALL buildings on {selected_campus} campus for {selected_day}:")
+else:
+    st.write(f"Showing schedule for {selected_building} on {selected_campus} campus for {selected_day}:")
+
+# Only the page on screen is formatted and sent; sort orders are precomputed per term
+rows = paged_table(sched, rows, 'day')
+
+st.write(f"Total classes: {len(rows)}")
+
+# Exports stream from the row positions when clicked; nothing is built up front
+download_buttons('This view', sched, rows, f"{selected_campus}_{selected_building}_{day_tag}")
+download_buttons(f'All of {selected_campus} (every day)', sched,
+                 sort_rows(sched, intersect(by_campus[selected_campus], hits)), selected_campus)
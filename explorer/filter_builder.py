@@ -0,0 +1,55 @@
+import streamlit as st
+from leosched.app import current_frame, download_buttons, paged_table, term_index
+from leosched.filters import COLUMNS, Filter, FilterCache
+from leosched.schedule import DAY_NAMES
+
+st.title('Custom Filter')
+
+sched = current_frame()
+# Shared by every session on this term (and LEO-only setting), least recently used expressions dropped first
+cache = term_index('filters', FilterCache)
+
+
+def options(col):
+    return sorted(sched[col].dropna().astype(str).unique()) if col in sched.columns else []
+
+
+typed = st.text_input('Expression (optional), e.g. `day=Monday|Friday; subject=MATH; time=08:00-10:00`:')
+if typed.strip():
+    try:
+        flt = Filter.parse(typed)
+    except ValueError as exc:
+        st.error(str(exc))
+        st.stop()
+else:
+    left, right = st.columns(2)
+    picks = {
+        'day': left.multiselect('Days:', DAY_NAMES),
+        'campus': right.multiselect('Campuses:', options(COLUMNS['campus'])),
+        'bldg': left.multiselect('Buildings:', options(COLUMNS['bldg'])),
+        'subject': right.multiselect('Subjects:', options(COLUMNS['subject'])),
+        'mode': left.multiselect('Instruction modes:', options(COLUMNS['mode'])),
+        'title': right.multiselect('Job titles:', options(COLUMNS['title']),
+                                   disabled=COLUMNS['title'] not in sched.columns,
+                                   help='Needs "LEO lecturers only".'),
+    }
+    window = None
+    if st.checkbox('Limit to a time window'):
+        start, end = st.slider('Meetings overlapping:', 0, 24 * 60, (8 * 60, 12 * 60), step=15,
+                               format='%d min')
+        window = (start, end) if start < end else None
+    flt = Filter(**picks, time=window)
+
+st.code(str(flt), language=None)
+try:
+    rows = cache.positions(flt)
+except KeyError as exc:
+    st.error(exc.args[0])
+    st.stop()
+
+rows = paged_table(sched, rows, 'filter')
+st.write(f"Total classes: {len(rows)}")
+stats = cache.stats()
+st.caption(f"Filter cache: {stats['entries']} expressions ({stats['kb']} KB), "
+           f"{stats['hits']} hits, {stats['misses']} misses")
+download_buttons('This filter', sched, rows, flt.canonical.replace('; ', '_') or 'all')
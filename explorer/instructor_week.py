@@ -0,0 +1,45 @@
+import streamlit as st
+from leosched.app import current_frame, current_term, download_buttons, term_index
+from leosched.export import sort_rows
+from leosched.ical import single_calendar
+from leosched.instructors import InstructorIndex, week
+from leosched.schedule import to_display
+
+st.title('Instructor Week')
+
+sched = current_frame()
+index = term_index('instructors', InstructorIndex)
+
+# Prefix lookup on "Last, First", "First Last" or UM ID, across every campus
+query = st.text_input('Instructor name or UM ID:')
+if not query.strip():
+    st.write("Type the start of a name (e.g. \"Korsyn\" or \"Kevin Kor\") or a UM ID.")
+    st.stop()
+
+matches = index.find(query, limit=50)
+if not matches:
+    st.write(f"No instructor matches \"{query}\" for this term.")
+    st.stop()
+
+choice = st.selectbox(f'Select an instructor ({len(matches)} found):', range(len(matches)),
+                      format_func=lambda i: matches[i].label)
+selected = matches[choice]
+
+week_df = week(sched, selected.positions)
+st.write(f"Weekly schedule for {selected.name}: {len(week_df)} meetings")
+counts = week_df['Day'].value_counts(sort=False)
+st.caption(" | ".join(f"{day}: {n}" for day, n in counts.items() if n))
+
+display = to_display(week_df)
+st.dataframe(display[['Day'] + [c for c in display.columns if c != 'Day']])
+
+download_buttons('All meetings', sched, sort_rows(sched, selected.positions), selected.name)
+# the callable runs later on a worker thread without the session: bind everything it needs now
+term_key, meetings, name = current_term().term.key, sched.iloc[selected.positions], selected.name
+st.download_button(
+    'Add to calendar (.ics)',
+    data=lambda: single_calendar(meetings, name, term_key),
+    file_name=f"{term_key}_{'_'.join(name.replace(',', ' ').split())}.ics",
+    mime='text/calendar',
+    on_click='ignore',
+)
@@ -0,0 +1,57 @@
+import datetime as dt
+
+import pandas as pd
+import streamlit as st
+from leosched.app import current_frame, term_index
+from leosched.ical import TZID
+from leosched.live import Timeline
+from leosched.schedule import to_display
+
+st.title('In Session Now')
+
+sched = current_frame()
+timeline = term_index('timeline', Timeline)
+
+pinned = st.checkbox('Pick a date and time instead of now')
+if pinned:
+    first, last = timeline.dates.bounds
+    left, right = st.columns(2)
+    date = left.date_input('Date:', value=first, min_value=first, max_value=last)
+    clock = right.time_input('Time:', value=dt.time(10, 0), step=300)
+campus = st.selectbox('Campus:', ['ALL'] + sorted(sched['CampusPrediction'].dropna().astype(str).unique()))
+
+
+@st.fragment(run_every=None if pinned else 60)
+def board():
+    if pinned:
+        now = pd.Timestamp.combine(date, clock)
+    else:
+        now = pd.Timestamp.now(tz=TZID).tz_localize(None)
+    minute = now.hour * 60 + now.minute
+
+    # One cursor per session and date; each refresh applies only the events since the last one
+    key = ('live_cursor', st.session_state['term'], st.session_state['leo_only'], now.date())
+    cursor = st.session_state.get(key)
+    if cursor is None or minute < cursor.minute:
+        st.session_state[key] = cursor = timeline.cursor(now.date())
+    applied = cursor.advance(minute)
+
+    rows = cursor.positions()
+    df = sched.iloc[rows]
+    if campus != 'ALL':
+        df = df[df['CampusPrediction'] == campus]
+    nxt = cursor.next_change
+    st.caption(f"{now:%A %m/%d/%Y %H:%M}: {len(df)} meetings in session; {applied} start/end events applied"
+               + (f"; next change at {nxt // 60:02d}:{nxt % 60:02d}" if nxt is not None else ""))
+    if df.empty:
+        st.write("Nothing in session.")
+        return
+
+    counts = df['BldgPrediction'].astype(str).value_counts()
+    for building, count in counts.items():
+        with st.expander(f"{building} ({count})"):
+            st.dataframe(to_display(df[df['BldgPrediction'].astype(str) == building]
+                                    .sort_values('RoomPrediction')), hide_index=True)
+
+
+board()
@@ -0,0 +1,35 @@
+import streamlit as st
+from leosched.app import current_frame, term_index
+from leosched.patterns import PatternCube
+
+st.title('Meeting Patterns')
+
+sched = current_frame()
+
+band = st.radio('Start-time band:', [60, 30], format_func=lambda m: f'{m} minutes', horizontal=True)
+# Counted once per term, frame and band width from the packed Days mask and start minute
+cube = term_index(f'patterns_{band}', lambda df: PatternCube(df, band))
+
+campus = st.selectbox('Campus:', ['ALL'] + sorted(cube.cells['Campus'].unique()))
+campus = None if campus == 'ALL' else campus
+buildings = cube.cells.loc[cube.cells['Campus'] == campus, 'Building'].unique() if campus else []
+building = st.selectbox('Building:', ['ALL'] + sorted(buildings), disabled=campus is None)
+building = None if building == 'ALL' else building
+
+mix = cube.patterns(campus, building)
+st.subheader('Pattern mix')
+st.bar_chart(mix.head(12), x='Pattern', y='Meetings', horizontal=True, sort='-Meetings')
+st.dataframe(mix, hide_index=True)
+
+st.subheader('Patterns by start time')
+common = list(mix['Pattern'].head(8))
+chosen = st.multiselect('Patterns:', list(mix['Pattern']), default=common)
+st.dataframe(cube.grid('Pattern', campus, building, chosen))
+
+if campus and not building:
+    st.subheader(f'Buildings on {campus} by start time')
+    st.dataframe(cube.grid('Building', campus, None, chosen))
+
+st.subheader('Prime-time crunches')
+top = st.slider('Show the busiest:', 5, 50, 15)
+st.dataframe(cube.prime_time(top, campus, building), hide_index=True)
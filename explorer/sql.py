@@ -0,0 +1,41 @@
+import time
+
+import streamlit as st
+from leosched.sql import EXAMPLE, TERM_DIR, connect, ensure_snapshots, select, snapshot_version
+
+st.title('SQL Query')
+
+try:
+    import duckdb  # noqa: F401
+except ImportError:
+    st.info("The SQL mode needs DuckDB, which is not installed here: `pip install duckdb`.")
+    st.stop()
+
+
+@st.cache_resource(max_entries=1)
+def sql_connection(version):
+    # views over the Parquet snapshots of every term; each query scans only what it needs.
+    # Keyed on the snapshot manifests, so a refreshed or newly streamed snapshot opens a new one.
+    return connect(refresh=False, read_only=True)
+
+
+with st.spinner("Writing term snapshots..."):
+    ensure_snapshots()
+
+
+st.caption(f"Tables: `schedule`, `roster` (both with a `term_key` column such as W25, one partition per "
+           f"term, next to the registrar's `Term` code) and "
+           f"`buildings`, read from `{TERM_DIR}`; `history` once exports are streamed in with "
+           f"`python -m leosched.stream`.")
+sql = st.text_area('Query:', EXAMPLE, height=180)
+
+if st.button('Run') or sql == EXAMPLE:
+    t0 = time.perf_counter()
+    try:
+        result = select(sql_connection(snapshot_version()), sql)
+    except Exception as exc:  # syntax errors, unknown columns, ...
+        st.error(str(exc))
+        st.stop()
+    st.caption(f"{len(result)} rows in {time.perf_counter() - t0:.3f}s")
+    st.dataframe(result, hide_index=True)
+    st.download_button('Download CSV', result.to_csv(index=False), file_name='query.csv', mime='text/csv')
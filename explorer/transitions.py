@@ -0,0 +1,30 @@
+import streamlit as st
+from leosched.app import current_frame
+from leosched.schedule import format_minutes
+from leosched.transitions import DEFAULT_RULES, transitions
+
+st.title('Back-to-back Building Transitions')
+
+sched = current_frame()
+
+# Minutes an instructor needs between meetings in different buildings
+cols = st.columns(len(DEFAULT_RULES))
+rules = {
+    rule: col.number_input(f'Minutes needed, {rule}:', min_value=0, max_value=240, value=minutes, step=5)
+    for col, (rule, minutes) in zip(cols, DEFAULT_RULES.items())
+}
+
+flagged = transitions(sched, rules)
+st.write(f"{len(flagged)} tight transitions for {flagged['Class Instr ID'].nunique()} instructors "
+         f"({(flagged['Gap Min'] < 0).sum()} overlapping meetings)")
+
+campus_pairs = (flagged['From Campus'].astype(str) + ' -> ' + flagged['To Campus'].astype(str)).value_counts()
+pair_options = [f"ALL ({len(flagged)})"] + [f"{pair} ({count})" for pair, count in campus_pairs.items()]
+selected_pair = st.selectbox('Select a campus pair:', pair_options).rsplit(' (', 1)[0]
+if selected_pair != "ALL":
+    flagged = flagged[(flagged['From Campus'].astype(str) + ' -> ' + flagged['To Campus'].astype(str)) == selected_pair]
+
+flagged = flagged.sort_values(['Gap Min', 'Class Instr Name', 'Day']).reset_index(drop=True)
+flagged['Ends'] = format_minutes(flagged['Ends'])
+flagged['Starts'] = format_minutes(flagged['Starts'])
+st.dataframe(flagged.drop(columns=['Flagged']))
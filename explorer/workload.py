@@ -0,0 +1,33 @@
+import time
+
+import streamlit as st
+from leosched.app import current_term
+from leosched.workload import OUTLIER_Z, outliers, reconcile
+
+st.title('Contact Minutes vs FTE')
+
+loaded = current_term()
+t0 = time.perf_counter()
+reconciled = reconcile(loaded.schedule, loaded.roster, loaded.lecturer_ids)
+elapsed = time.perf_counter() - t0
+
+z = st.slider('Flag lecturers more than this many robust deviations from the median minutes per FTE:',
+              min_value=1.0, max_value=10.0, value=OUTLIER_Z, step=0.5)
+unscheduled = st.checkbox('Also list roster lecturers with no scheduled meetings', value=False)
+
+departments = reconciled['Department Name'].astype(str).value_counts()
+department_options = [f"ALL ({len(reconciled)})"] + [f"{d} ({n})" for d, n in departments.items()]
+selected_department = st.selectbox('Select a department:', department_options).rsplit(' (', 1)[0]
+if selected_department != "ALL":
+    reconciled = reconciled[reconciled['Department Name'].astype(str) == selected_department]
+
+flagged = outliers(reconciled, z, unscheduled)
+teaching = reconciled[reconciled['Status'] != 'no meetings']
+st.write(f"{len(flagged)} outliers among {len(teaching)} teaching lecturers "
+         f"(median {teaching['Min per FTE'].median():.0f} weekly contact minutes per 1.0 FTE)")
+st.dataframe(flagged)
+
+st.scatter_chart(teaching, x='FTE', y='Avg Weekly Min')
+
+st.caption(f"Reconciled {len(reconciled)} roster lecturers in {elapsed * 1000:.0f} ms; "
+           "cross-listed meetings are counted once, half-term sections by their share of the term.")
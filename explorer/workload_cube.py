@@ -0,0 +1,34 @@
+import streamlit as st
+from leosched.app import current_term
+from leosched.cube import DIMENSIONS, MEASURES, WorkloadCube
+
+st.title('LEO Workload Summary')
+
+# Built once per term; a changed monthly roster is folded in incrementally by the term cache
+loaded = current_term()
+cube = loaded.cached('cube', lambda: WorkloadCube(loaded.schedule, loaded.roster, loaded.lecturer_ids))
+
+rows = st.multiselect('Rows:', DIMENSIONS, default=['Department Name'])
+column_options = ['(none)'] + [d for d in DIMENSIONS if d not in rows]
+column = st.selectbox('Columns:', column_options, index=column_options.index('Day') if 'Day' in column_options else 0)
+measure = st.radio('Measure:', MEASURES, horizontal=True)
+
+filters = {}
+with st.expander('Filters'):
+    for dim in DIMENSIONS:
+        values = cube.cube[dim].dropna().astype(str).unique()
+        choice = st.selectbox(f'{dim}:', ['ALL'] + sorted(values), key=f'cube_{dim}')
+        if choice != 'ALL':
+            filters[dim] = choice
+
+if not rows:
+    st.write("Pick at least one row dimension.")
+    st.stop()
+
+table = cube.summary(rows, None if column == '(none)' else column, measure, filters)
+st.dataframe(table)
+if column != '(none)' and len(rows) == 1:
+    st.bar_chart(table)
+
+st.caption(f"Cube: {len(cube.cube)} cells over {len(DIMENSIONS)} dimensions, "
+           f"{cube.cube['Meetings'].sum()} LEO meeting-days")
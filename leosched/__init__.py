@@ -0,0 +1,6 @@
+"""Shared loading and indexing helpers for the LEO schedule viewers.
+
+The Streamlit scripts in the repo root and in the per-term folders
+(``W25/``, ``SS25/``, ``Summer25/``) import from here so every viewer reads
+the registrar, roster and building exports the same way.
+"""
@@ -0,0 +1,104 @@
+"""Streamlit glue shared by the pages of ``LEOScheduleExplorer.py``.
+
+The entry script draws the term and LEO-only selectors once in the sidebar
+(so they keep their values across pages); pages call ``current_frame`` to get
+the selected term's frame and ``term_index`` for indexes built once per term.
+Result tables go through ``paged_table``, which sorts row positions with the
+term's precomputed orders and formats only the page on screen.
+"""
+from __future__ import annotations
+
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from leosched.export import FORMATS, export
+from leosched.paging import DISPLAY_COLUMNS, PAGE_SIZES, SORT_KEYS, SortOrders, page, page_count
+from leosched.schedule import footprint, to_display
+from leosched.terms import PRELOAD, TERMS, LoadedTerm, TermCache
+
+
+@st.cache_resource
+def term_cache() -> TermCache:
+    cache = TermCache()
+    if PRELOAD:
+        # cold start: every term's campus files parsed across a process pool
+        cache.preload(None if PRELOAD == "all" else PRELOAD.split(","))
+    return cache
+
+
+def sidebar() -> None:
+    st.sidebar.selectbox('Select a term:', list(TERMS), format_func=lambda k: TERMS[k].label, key='term')
+    st.sidebar.checkbox('LEO lecturers only', value=True, key='leo_only')
+
+
+def current_term() -> LoadedTerm:
+    return term_cache().get(st.session_state['term'])
+
+
+def current_frame() -> pd.DataFrame:
+    """The selected term's meetings, LEO lecturers only if that box is ticked."""
+    loaded = current_term()
+    return loaded.lecturers() if st.session_state['leo_only'] else loaded.schedule
+
+
+def term_index(name: str, build: Callable[[pd.DataFrame], object]):
+    """``build(current_frame())``, once per term and LEO-only setting."""
+    loaded = current_term()
+    return loaded.cached((name, st.session_state['leo_only']), lambda: build(current_frame()))
+
+
+def paged_table(df: pd.DataFrame, rows: np.ndarray, key: str = 'table') -> np.ndarray:
+    """One page of ``df.iloc[rows]`` with sort and column controls; returns all rows in sort order."""
+    orders = term_index('sort_orders', SortOrders)
+    sort_col, dir_col, size_col, page_col = st.columns([2, 1, 1, 1])
+    sort_by = sort_col.selectbox('Sort by:', list(SORT_KEYS), key=f'{key}_sort')
+    descending = dir_col.toggle('Descending', key=f'{key}_desc')
+    size = size_col.selectbox('Rows per page:', PAGE_SIZES, index=1, key=f'{key}_size')
+    pages = page_count(len(rows), size)
+    if st.session_state.get(f'{key}_page', 1) > pages:
+        st.session_state[f'{key}_page'] = pages
+    number = page_col.number_input(f'Page (of {pages}):', 1, pages, key=f'{key}_page')
+
+    ordered = orders.order(rows, sort_by, descending)
+    shown = to_display(df.iloc[page(ordered, number, size)])
+    with st.expander('Columns'):
+        columns = st.multiselect('Show:', list(shown.columns), default=DISPLAY_COLUMNS, key=f'{key}_cols')
+    st.dataframe(shown[columns], hide_index=True)
+    first = (number - 1) * size
+    st.caption(f"Rows {min(first + 1, len(rows))}-{min(first + size, len(rows))} of {len(rows)}")
+    return ordered
+
+
+def download_buttons(label: str, df: pd.DataFrame, rows: np.ndarray, name: str) -> None:
+    """CSV and XLSX download buttons; the file is written only when clicked."""
+    def payload(fmt: str) -> bytes:
+        # Streamlit serves downloads from bytes; the spooled file keeps generation bounded
+        with export(df, rows, fmt) as fh:
+            return fh.read()
+
+    stem = "_".join(f"{current_term().term.key} {name}".split()).replace("/", "-")
+    for col, fmt in zip(st.columns(len(FORMATS)), FORMATS):
+        col.download_button(
+            f"{label} ({len(rows)} rows) as {fmt.upper()}",
+            data=lambda fmt=fmt: payload(fmt),
+            file_name=f"{stem}.{fmt}",
+            mime=FORMATS[fmt],
+            on_click="ignore",
+        )
+
+
+def cache_report() -> None:
+    cache, loaded = term_cache(), current_term()
+    stats = cache.stats()
+    st.sidebar.caption(
+        f"Term cache: {stats['size_mb']} / {stats['budget_mb']} MB, loaded {', '.join(stats['loaded'])}; "
+        f"{stats['hits']} hits, {stats['misses']} misses, {stats['evictions']} evictions"
+    )
+    raw_mb, norm_mb = loaded.raw_bytes / 2**20, footprint(loaded.schedule) / 2**20
+    st.sidebar.caption(
+        f"{loaded.term.label}: {raw_mb:.1f} MB raw -> {norm_mb:.1f} MB normalized; "
+        f"{loaded.pruned} rows without meeting days dropped"
+    )
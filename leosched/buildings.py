@@ -0,0 +1,119 @@
+"""Campus-aware building registry compiled from ``UMICHbuildings_dict.json``.
+
+The JSON maps A2 building codes to ``[name, campus]`` lists, except for a few
+bare strings such as ``"ARR"``; indexing ``new_Bldgs[code][-1]`` on those
+returned the string's last character as the campus.  Dearborn and Flint codes
+were looked up in the same A2 table.
+
+``BuildingRegistry`` compiles the JSON once into typed ``Building`` records in
+separate A2, Dearborn and Flint namespaces, and keeps one ``code -> value``
+dict per field so a whole column resolves with a single ``Series.map``.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import NamedTuple
+
+import pandas as pd
+
+A2, DEARBORN, FLINT = "A2", "Dearborn", "Flint"
+NAMESPACES = (A2, DEARBORN, FLINT)
+
+# codes the Dearborn and Flint exports use for sections without a room;
+# their other codes have no reference table in the repo and resolve to None
+VIRTUAL_CODES = {
+    DEARBORN: {"WEB": "Online", "EXAMS": "Exam period", "-": "No room assigned"},
+    FLINT: {"OASYNC": "Online asynchronous", "OSYNC": "Online synchronous"},
+}
+
+FACILITY_COLUMNS = ["RoomPrediction", "BldgPrediction", "CampusPrediction"]
+
+
+class Building(NamedTuple):
+    code: str
+    name: str
+    campus: str
+    campus_id: int
+
+
+class BuildingRegistry:
+    """In-memory hash index of buildings per campus namespace."""
+
+    def __init__(self, records: dict[str, list[tuple[str, str, str]]]):
+        campuses = sorted({campus for rows in records.values() for _, _, campus in rows if campus})
+        self.campuses = campuses
+        campus_ids = {c: i for i, c in enumerate(campuses)}
+        self.namespaces: dict[str, dict[str, Building]] = {
+            ns: {code: Building(code, name, campus, campus_ids.get(campus, -1))
+                 for code, name, campus in rows}
+            for ns, rows in records.items()
+        }
+        # one plain dict per field, so Series.map hits a hash table directly
+        self._fields = {
+            ns: {field: {code: getattr(b, field) for code, b in table.items()}
+                 for field in Building._fields}
+            for ns, table in self.namespaces.items()
+        }
+        self._facilities: dict[str, tuple[str, str, str]] = {}
+
+    @classmethod
+    def from_json(cls, raw: dict) -> "BuildingRegistry":
+        a2 = []
+        for code, value in raw.items():
+            if isinstance(value, str):
+                # e.g. "ARR": a description with no campus
+                a2.append((code, value, ""))
+            else:
+                name, campus = (list(value) + ["", ""])[:2]
+                a2.append((code, name, campus))
+        records = {A2: a2}
+        for ns, codes in VIRTUAL_CODES.items():
+            records[ns] = [(code, name, ns) for code, name in codes.items()]
+        return cls(records)
+
+    def lookup(self, code: str, namespace: str = A2) -> Building | None:
+        return self.namespaces[namespace].get(code)
+
+    def map(self, codes: pd.Series, field: str = "name", namespace: str = A2) -> pd.Series:
+        """Resolve a column of codes to one ``Building`` field; unknown codes give NaN."""
+        return codes.map(self._fields[namespace][field])
+
+    def _resolve_facility(self, facility) -> tuple[str, str, str]:
+        if not isinstance(facility, str) or not facility.strip():
+            return "", "", ""
+        # longest A2 code contained in the Facility ID (or containing it)
+        table = self.namespaces[A2]
+        matches = [code for code in table if facility in code or code in facility]
+        match = max(matches, key=len, default=None)
+        if match is None:
+            return "", facility, ""
+        return facility.replace(match, "").strip(), match, table[match].campus
+
+    def split_facility(self, facility: pd.Series) -> pd.DataFrame:
+        """Room, building and campus predicted from A2 ``Facility ID`` values.
+
+        Each distinct Facility ID is matched against the registry once per
+        process; rows then pick up their values with a vectorized ``map``.
+        """
+        for value in facility.unique():
+            if value not in self._facilities:
+                self._facilities[value] = self._resolve_facility(value)
+        parts = {value: self._facilities[value] for value in facility.unique()}
+        return pd.DataFrame(
+            {col: facility.map({k: v[i] for k, v in parts.items()}).fillna("")
+             for i, col in enumerate(FACILITY_COLUMNS)},
+            index=facility.index,
+        )
+
+
+_REGISTRIES: dict[str, BuildingRegistry] = {}
+
+
+def building_registry(raw: dict) -> BuildingRegistry:
+    """The compiled registry for a buildings JSON, built once per distinct file."""
+    key = hashlib.sha1(json.dumps(raw, sort_keys=True).encode()).hexdigest()
+    registry = _REGISTRIES.get(key)
+    if registry is None:
+        registry = _REGISTRIES[key] = BuildingRegistry.from_json(raw)
+    return registry
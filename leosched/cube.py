@@ -0,0 +1,111 @@
+"""Pre-aggregated workload cube of LEO-taught meetings.
+
+``WorkloadCube`` counts meetings and weekly contact minutes over
+
+    Department Name x School/College/Division x Job Title
+        x Subject x Day x Campus x Instruction Mode
+
+Schedule-side dimensions are aggregated once per term into a *base* keyed by
+UM ID; the roster-side dimensions (department, school, job title) are joined
+on afterwards.  When the monthly roster changes, ``update_roster`` only
+re-files the base rows of lecturers whose roster attributes (or LEO status)
+changed: their old contribution is subtracted and the new one added, instead
+of rebuilding from the meetings.
+
+Summaries (``summary``) are group-bys over the cube, which is a few thousand
+rows, so they are effectively instant.
+"""
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from leosched.roster import appointments, term_window
+from leosched.schedule import DAY_BITS, DAY_NAMES
+
+SCHEDULE_DIMS = ["Subject", "Day", "Campus", "Instruction Mode Descrshort"]
+ROSTER_DIMS = ["Department Name", "School/College/Division", "Job Title"]
+DIMENSIONS = ROSTER_DIMS + SCHEDULE_DIMS
+MEASURES = ["Meetings", "Weekly Min"]
+
+
+def _base(schedule: pd.DataFrame) -> pd.DataFrame:
+    """Meetings and minutes per (UM ID, schedule dimensions), one entry per meeting day."""
+    days = schedule["Days"].to_numpy(dtype=np.uint8)
+    minutes = np.clip(schedule["End Min"].to_numpy(dtype=np.int32) - schedule["Start Min"].to_numpy(), 0, None)
+    frames = []
+    for name, bit in DAY_BITS.items():
+        on = (days & bit) != 0
+        frames.append(pd.DataFrame({
+            "UM ID": schedule["Class Instr ID"].to_numpy()[on],
+            "Subject": schedule["Subject"].to_numpy()[on],
+            "Day": name,
+            "Campus": schedule["CampusPrediction"].to_numpy()[on],
+            "Instruction Mode Descrshort": schedule["Instruction Mode Descrshort"].to_numpy()[on],
+            "Meetings": 1,
+            "Weekly Min": minutes[on],
+        }))
+    long = pd.concat(frames, ignore_index=True)
+    long["Day"] = pd.Categorical(long["Day"], categories=DAY_NAMES, ordered=True)
+    for col in ["Subject", "Campus", "Instruction Mode Descrshort"]:
+        long[col] = long[col].astype("category")
+    return long.groupby(["UM ID"] + SCHEDULE_DIMS, observed=True, dropna=False)[MEASURES].sum().reset_index()
+
+
+def _attributes(roster: pd.DataFrame, lecturer_ids: np.ndarray, window) -> pd.DataFrame:
+    """Roster dimensions per lecturer, from their largest appointment active in ``window``."""
+    return appointments(roster, lecturer_ids, window)[ROSTER_DIMS].astype("string")
+
+
+class WorkloadCube:
+    """Meetings / weekly minutes of LEO lecturers over ``DIMENSIONS``."""
+
+    def __init__(self, schedule: pd.DataFrame, roster: pd.DataFrame, lecturer_ids: np.ndarray):
+        self.base = _base(schedule[schedule["Class Instr ID"].to_numpy() >= 0])
+        self.window = term_window(schedule)
+        self.people = _attributes(roster, lecturer_ids, self.window)
+        self.cube = self._roll_up(self.base, self.people)
+
+    @staticmethod
+    def _roll_up(base: pd.DataFrame, people: pd.DataFrame) -> pd.DataFrame:
+        joined = base.join(people, on="UM ID", how="inner")
+        return joined.groupby(DIMENSIONS, observed=True, dropna=False)[MEASURES].sum().reset_index()
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.base.memory_usage(deep=True).sum() + self.cube.memory_usage(deep=True).sum())
+
+    def update_roster(self, roster: pd.DataFrame, lecturer_ids: np.ndarray) -> int:
+        """Apply a new roster; returns how many lecturers changed."""
+        new = _attributes(roster, lecturer_ids, self.window)
+        old = self.people
+        ids = old.index.union(new.index)
+        before = old.reindex(ids).fillna("\0")
+        after = new.reindex(ids).fillna("\0")
+        changed = ids[(before != after).any(axis=1).to_numpy()]
+        if len(changed):
+            rows = self.base[self.base["UM ID"].isin(changed)]
+            removed = self._roll_up(rows, old[old.index.isin(changed)])
+            added = self._roll_up(rows, new[new.index.isin(changed)])
+            removed[MEASURES] *= -1
+            merged = pd.concat([self.cube, removed, added], ignore_index=True)
+            cube = merged.groupby(DIMENSIONS, observed=True, dropna=False)[MEASURES].sum().reset_index()
+            self.cube = cube[cube["Meetings"] != 0].reset_index(drop=True)
+        self.people = new
+        return len(changed)
+
+    def summary(self, rows: list[str], column: str | None = None, measure: str = "Meetings",
+                filters: dict[str, object] | None = None) -> pd.DataFrame:
+        """``measure`` summed by ``rows`` (and pivoted by ``column``), after ``filters``."""
+        cube = self.cube
+        for dim, value in (filters or {}).items():
+            cube = cube[cube[dim].astype("string") == value]
+        keys = rows + ([column] if column else [])
+        out = cube.groupby(keys, observed=True, dropna=False)[measure].sum()
+        if column:
+            out = out.unstack(column, fill_value=0)
+            if column == "Day":
+                out = out.reindex(columns=[d for d in DAY_NAMES if d in out.columns])
+        else:
+            out = out.to_frame()
+        return out.sort_index()
@@ -0,0 +1,83 @@
+"""Calendar-date queries over meeting date ranges.
+
+A term frame holds only a handful of distinct ``Meeting Start Dt`` /
+``Meeting End Dt`` pairs (full term, Summer I, Summer II, half terms), so
+``DateIndex`` keeps those pairs in a ``pd.IntervalIndex`` and one ``int16``
+range code per row.  "Meets on this date" probes the few intervals and
+broadcasts the answer to the rows through the codes, combined with the
+``Days`` bitmask for the date's weekday in one vectorized predicate.  Rows
+whose range ends before it starts (bad export rows) get no range and never
+match a date.
+"""
+from __future__ import annotations
+
+import datetime as dt
+
+import numpy as np
+import pandas as pd
+
+from leosched.schedule import DAY_BITS, DAY_NAMES
+
+# stand-ins for a missing start / end date, so undated rows always match
+OPEN_START, OPEN_END = pd.Timestamp("1900-01-01"), pd.Timestamp("2100-12-31")
+
+
+class DateIndex:
+    """Distinct meeting date ranges of one frame and each row's range."""
+
+    def __init__(self, df: pd.DataFrame):
+        spans = pd.DataFrame({
+            "start": df["Meeting Start Dt"].astype("datetime64[s]"),
+            "end": df["Meeting End Dt"].astype("datetime64[s]"),
+        })
+        spans = spans.fillna({"start": OPEN_START, "end": OPEN_END})
+        valid = (spans["start"] <= spans["end"]).to_numpy()
+        groups = spans[valid].groupby(["start", "end"], sort=True)
+        ranges = groups.size().index
+        self.intervals = pd.IntervalIndex.from_arrays(
+            ranges.get_level_values("start"), ranges.get_level_values("end"), closed="both")
+        self.codes = np.full(len(df), -1, dtype=np.int16)  # -1: inverted range, never active
+        self.codes[valid] = groups.ngroup().to_numpy(dtype=np.int16)
+        self.days = df["Days"].to_numpy(dtype=np.uint8)
+
+    @property
+    def nbytes(self) -> int:
+        return self.codes.nbytes + self.days.nbytes
+
+    @property
+    def bounds(self) -> tuple[dt.date, dt.date]:
+        """First and last date any meeting is held, for date pickers.
+
+        An open side falls back to the known dates of the other; with no
+        dates at all it is the coming week, so every weekday can be picked.
+        """
+        known = [d for d in (*self.intervals.left, *self.intervals.right) if OPEN_START < d < OPEN_END]
+        left = [d for d in self.intervals.left if d > OPEN_START] or known
+        right = [d for d in self.intervals.right if d < OPEN_END] or known
+        if not known:
+            today = dt.date.today()
+            return today, today + dt.timedelta(days=6)
+        first, last = min(left).date(), max(right).date()
+        return first, max(first, last)
+
+    def active(self, date) -> np.ndarray:
+        """Rows whose date range includes ``date``, whatever the weekday."""
+        hit = np.r_[self.intervals.contains(pd.Timestamp(date)), False]
+        return hit[self.codes]  # code -1 picks the trailing False
+
+    def meets_on(self, date) -> np.ndarray:
+        """Rows that actually meet on ``date``: in range and on that weekday."""
+        bit = DAY_BITS[DAY_NAMES[pd.Timestamp(date).weekday()]]
+        return self.active(date) & ((self.days & bit) != 0)
+
+    def positions(self, date) -> np.ndarray:
+        return np.flatnonzero(self.meets_on(date)).astype(np.int32)
+
+    def ranges(self) -> pd.DataFrame:
+        """Distinct date ranges with their row counts, e.g. to spot Summer I vs II."""
+        counts = np.bincount(self.codes[self.codes >= 0], minlength=len(self.intervals))
+        return pd.DataFrame({
+            "Start": self.intervals.left.date,
+            "End": self.intervals.right.date,
+            "Meetings": counts,
+        })
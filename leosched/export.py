@@ -0,0 +1,127 @@
+"""Streaming CSV / XLSX export of schedule rows by position.
+
+The explorer pages and the CLI both describe what to export as an array of
+row positions into a term frame (a filtered view, or a whole facet such as
+every North Campus building).  ``iter_chunks`` formats ``chunksize`` rows at a
+time with ``to_display``, and the writers append each chunk to the output and
+drop it, so memory stays bounded by the chunk size rather than the export.
+
+    python -m leosched.export W25 --campus "North Campus" --format xlsx -o north.xlsx
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+from typing import IO, Iterator
+
+import numpy as np
+import pandas as pd
+
+from leosched.schedule import DAY_NAMES, to_display
+from leosched.search import day_positions, facet_positions, intersect
+
+CHUNKSIZE = 5000
+SPOOL_BYTES = 8 * 2**20  # downloads larger than this spill to a temp file
+FORMATS = {
+    "csv": "text/csv",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+
+
+def iter_chunks(df: pd.DataFrame, positions: np.ndarray, chunksize: int = CHUNKSIZE) -> Iterator[pd.DataFrame]:
+    """Display-formatted slices of ``df.iloc[positions]``, ``chunksize`` rows each."""
+    for start in range(0, len(positions), chunksize):
+        yield to_display(df.iloc[positions[start:start + chunksize]])
+
+
+def write_csv(df: pd.DataFrame, positions: np.ndarray, fh: IO[bytes], chunksize: int = CHUNKSIZE) -> int:
+    header = True
+    for chunk in iter_chunks(df, positions, chunksize):
+        fh.write(chunk.to_csv(index=False, header=header).encode("utf-8"))
+        header = False
+    if header:  # nothing exported; still write the column names
+        fh.write(to_display(df.iloc[:0]).to_csv(index=False).encode("utf-8"))
+    return len(positions)
+
+
+def write_xlsx(df: pd.DataFrame, positions: np.ndarray, fh: IO[bytes], chunksize: int = CHUNKSIZE) -> int:
+    try:
+        from openpyxl import Workbook
+    except ImportError as exc:  # pragma: no cover - optional dependency
+        raise ImportError("Writing .xlsx exports needs openpyxl: pip install openpyxl") from exc
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Schedule")
+    ws.append(list(to_display(df.iloc[:0]).columns))
+    for chunk in iter_chunks(df, positions, chunksize):
+        values = chunk.astype(object).where(chunk.notna(), None)
+        for row in values.itertuples(index=False, name=None):
+            ws.append(row)
+    wb.save(fh)
+    return len(positions)
+
+
+WRITERS = {"csv": write_csv, "xlsx": write_xlsx}
+
+
+def export(df: pd.DataFrame, positions: np.ndarray, fmt: str = "csv") -> IO[bytes]:
+    """The export as a rewound file object, spooled to disk past ``SPOOL_BYTES``."""
+    fh = tempfile.SpooledTemporaryFile(max_size=SPOOL_BYTES)
+    WRITERS[fmt](df, positions, fh)
+    fh.seek(0)
+    return fh
+
+
+def sort_rows(df: pd.DataFrame, rows: np.ndarray) -> np.ndarray:
+    """``rows`` in viewer order: by start time, then building and room."""
+    order = np.lexsort([
+        df["RoomPrediction"].cat.codes.to_numpy()[rows],
+        df["BldgPrediction"].cat.codes.to_numpy()[rows],
+        df["Start Min"].to_numpy()[rows],
+    ])
+    return rows[order]
+
+
+def select(df: pd.DataFrame, day: str | None = None, campus: str | None = None,
+           building: str | None = None) -> np.ndarray:
+    """Row positions of one facet; ``None`` leaves that facet unfiltered."""
+    rows = np.arange(len(df), dtype=np.int32)
+    if day:
+        rows = intersect(rows, day_positions(df)[day])
+    if campus:
+        rows = intersect(rows, facet_positions(df, "CampusPrediction").get(campus, rows[:0]))
+    if building:
+        rows = intersect(rows, facet_positions(df, "BldgPrediction").get(building, rows[:0]))
+    return sort_rows(df, rows)
+
+
+def main(argv: list[str] | None = None) -> int:
+    from leosched.terms import TERMS, load_term
+
+    parser = argparse.ArgumentParser(prog="python -m leosched.export", description=__doc__.splitlines()[0])
+    parser.add_argument("term", choices=list(TERMS))
+    parser.add_argument("--day", choices=DAY_NAMES)
+    parser.add_argument("--campus", help='CampusPrediction value, e.g. "North Campus" or "Dearborn"')
+    parser.add_argument("--building", help="BldgPrediction value, e.g. MH")
+    parser.add_argument("--leo-only", action="store_true", help="only LEO lecturer meetings")
+    parser.add_argument("--format", choices=list(FORMATS), default="csv")
+    parser.add_argument("-o", "--output", help="file to write (default: stdout, CSV only)")
+    args = parser.parse_args(argv)
+
+    loaded = load_term(TERMS[args.term])
+    df = loaded.lecturers() if args.leo_only else loaded.schedule
+    rows = select(df, args.day, args.campus, args.building)
+    if args.output:
+        with open(args.output, "wb") as fh:
+            n = WRITERS[args.format](df, rows, fh)
+    elif args.format == "csv":
+        n = write_csv(df, rows, sys.stdout.buffer)
+    else:
+        parser.error("--format xlsx needs --output")
+    print(f"{n} rows exported", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
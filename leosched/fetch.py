@@ -0,0 +1,251 @@
+"""Concurrent, revalidating download of the remote sources a viewer needs.
+
+The viewers pull the buildings JSON, a schedule CSV and a monthly roster CSV
+from GitHub.  ``fetch_all`` requests them in parallel on a thread pool and
+parses each one in the worker as soon as its bytes arrive, so cold start costs
+roughly the slowest download instead of the sum of all of them.
+
+Every successful download is kept under ``.snapshots/http/`` together with its
+``ETag``/``Last-Modified`` validators.  When a request times out, errors or
+returns something unparseable, the last good copy is used instead, and failing
+that the file of the same name in this checkout.
+
+After the first load each source is served from memory (stale-while-
+revalidate): once a copy is older than ``max_age`` a background thread sends a
+conditional request, and only if GitHub has a changed export is it parsed and
+swapped in.  The swap replaces one ``(version, value)`` tuple, so a rerun sees
+either the old dataset or the new one, never a mix.
+
+    fetched = fetch_all({
+        "buildings": (BLDG_URL, parse_json),
+        "sched": (SCHED_URL, parse_csv),
+    })
+"""
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable
+
+import pandas as pd
+import requests
+
+from leosched.snapshot import REPO_ROOT, SNAPSHOT_DIR
+
+log = logging.getLogger(__name__)
+
+CACHE_DIR = SNAPSHOT_DIR / "http"
+DEFAULT_TIMEOUT = 10  # seconds, per request
+DEFAULT_MAX_AGE = 300  # seconds before a served copy is revalidated
+
+Parser = Callable[[bytes], Any]
+
+# ------------------ Parsers ------------------
+
+def parse_json(content: bytes) -> Any:
+    return json.loads(content)
+
+
+def parse_csv(content: bytes) -> pd.DataFrame:
+    """Same inference as ``pd.read_csv(url)`` in the viewers."""
+    return pd.read_csv(io.BytesIO(content))
+
+# ------------------ Local copies ------------------
+
+def repo_path_for(url: str) -> Path | None:
+    """Map a GitHub raw URL for this repo onto the file in the local checkout."""
+    for marker in ("/raw/main/", "/refs/heads/main/", "/LEOcourseschedules/main/"):
+        if marker in url:
+            return REPO_ROOT / url.split(marker, 1)[1]
+    return None
+
+
+def cache_path(url: str) -> Path:
+    """Where the last good download of ``url`` is kept."""
+    name = hashlib.sha1(url.encode()).hexdigest()[:16]
+    return CACHE_DIR / f"{name}{Path(url).suffix}"
+
+
+def _meta_path(url: str) -> Path:
+    path = cache_path(url)
+    return path.with_name(path.name + ".meta.json")
+
+
+def _load_meta(url: str) -> dict:
+    try:
+        return json.loads(_meta_path(url).read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def _save_copy(url: str, resp: requests.Response) -> str:
+    """Keep a good response and its validators; return its content version."""
+    version = hashlib.sha256(resp.content).hexdigest()[:16]
+    meta = {
+        "etag": resp.headers.get("ETag"),
+        "last_modified": resp.headers.get("Last-Modified"),
+        "version": version,
+    }
+    _write_atomic(cache_path(url), resp.content)
+    _write_atomic(_meta_path(url), json.dumps(meta).encode())
+    return version
+
+
+def _fallback(url: str, parser: Parser, exc: Exception) -> Any:
+    for candidate in (cache_path(url), repo_path_for(url)):
+        if candidate is not None and candidate.exists():
+            log.warning("Fetching %s failed (%s); using %s", url, exc, candidate)
+            return parser(candidate.read_bytes())
+    raise exc
+
+# ------------------ Fetching ------------------
+
+def _conditional_get(url: str, timeout: float) -> requests.Response:
+    """GET ``url``, sending the validators of the cached copy if there is one."""
+    headers = {}
+    if cache_path(url).exists():
+        meta = _load_meta(url)
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+    resp = requests.get(url, headers=headers, timeout=timeout)
+    resp.raise_for_status()
+    return resp
+
+
+def fetch_one(url: str, parser: Parser, timeout: float = DEFAULT_TIMEOUT) -> Any:
+    """Download and parse one source, falling back to the last good copy."""
+    return _fetch_versioned(url, parser, timeout)[1]
+
+
+def _fetch_versioned(url: str, parser: Parser, timeout: float) -> tuple[str, Any]:
+    try:
+        resp = _conditional_get(url, timeout)
+        if resp.status_code == 304:
+            return _load_meta(url).get("version", ""), parser(cache_path(url).read_bytes())
+        value = parser(resp.content)
+    except (requests.RequestException, OSError, ValueError) as exc:
+        return "", _fallback(url, parser, exc)
+    return _save_copy(url, resp), value
+
+# ------------------ Stale-while-revalidate ------------------
+
+class RemoteSource:
+    """One remote file, served from memory and revalidated in the background.
+
+    Instances are shared by every session in the process (see ``remote``), so
+    a refreshed export is downloaded and parsed once, not once per user.
+    """
+
+    def __init__(self, url: str, parser: Parser, max_age: float = DEFAULT_MAX_AGE,
+                 timeout: float = DEFAULT_TIMEOUT):
+        self.url = url
+        self.parser = parser
+        self.max_age = max_age
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._current: tuple[str, Any] | None = None
+        self._checked = 0.0
+        self._refreshing = False
+
+    def get(self, timeout: float | None = None) -> tuple[str, Any]:
+        """Return ``(version, value)`` now; refresh behind the caller if stale.
+
+        ``timeout`` applies to this call's requests (the first download, or
+        the revalidation it starts) and defaults to the source's own.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        with self._lock:
+            if self._current is None:
+                cached = cache_path(self.url)
+                if cached.exists():
+                    # serve the last good copy straight away and check upstream behind it
+                    try:
+                        self._current = (_load_meta(self.url).get("version", ""),
+                                         self.parser(cached.read_bytes()))
+                    except ValueError:
+                        self._current = None
+                if self._current is None:
+                    self._current = _fetch_versioned(self.url, self.parser, timeout)
+                    self._checked = time.monotonic()
+            current = self._current
+            if not self._refreshing and time.monotonic() - self._checked >= self.max_age:
+                self._refreshing = True
+                threading.Thread(target=self._refresh, args=(timeout,), daemon=True).start()
+        return current
+
+    def _refresh(self, timeout: float) -> None:
+        try:
+            resp = _conditional_get(self.url, timeout)
+            if resp.status_code == 304:
+                return
+            value = self.parser(resp.content)  # fully processed before it is visible
+            version = _save_copy(self.url, resp)
+            with self._lock:
+                if self._current is None or self._current[0] != version:
+                    log.info("Switching %s to version %s", self.url, version)
+                    self._current = (version, value)
+        except (requests.RequestException, OSError, ValueError) as exc:
+            log.warning("Revalidating %s failed (%s); keeping the current copy", self.url, exc)
+        finally:
+            with self._lock:
+                self._checked = time.monotonic()
+                self._refreshing = False
+
+
+_REMOTES: dict[tuple[str, Parser, float], RemoteSource] = {}
+_REMOTES_LOCK = threading.Lock()
+
+
+def remote(url: str, parser: Parser, max_age: float = DEFAULT_MAX_AGE) -> RemoteSource:
+    """The process-wide ``RemoteSource`` for ``url`` parsed by ``parser``.
+
+    Callers asking for the same URL with another parser or ``max_age`` get
+    their own source (the downloaded bytes on disk are still shared).
+    """
+    key = (url, parser, max_age)
+    with _REMOTES_LOCK:
+        source = _REMOTES.get(key)
+        if source is None:
+            source = _REMOTES[key] = RemoteSource(url, parser, max_age=max_age)
+        return source
+
+
+def _detach(value: Any) -> Any:
+    # the viewers add and convert columns in place; keep the shared copy clean
+    return value.copy() if isinstance(value, pd.DataFrame) else value
+
+
+def fetch_all(
+    sources: dict[str, tuple[str, Parser]],
+    timeout: float = DEFAULT_TIMEOUT,
+    max_workers: int | None = None,
+    max_age: float = DEFAULT_MAX_AGE,
+) -> dict[str, Any]:
+    """Fetch and parse every ``name -> (url, parser)`` source concurrently.
+
+    Sources already in memory return immediately; stale ones are revalidated
+    in the background and picked up by a later rerun.
+    """
+    if not sources:
+        return {}
+    remotes = {name: remote(url, parser, max_age) for name, (url, parser) in sources.items()}
+    # the sources are shared by every session: the timeout goes with this call, not onto them
+    with ThreadPoolExecutor(max_workers=max_workers or len(sources)) as pool:
+        futures = {name: pool.submit(source.get, timeout) for name, source in remotes.items()}
+        return {name: _detach(fut.result()[1]) for name, fut in futures.items()}
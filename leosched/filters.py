@@ -0,0 +1,166 @@
+"""Composable filter expressions over a normalized term frame.
+
+A ``Filter`` is any combination of
+
+    day=Monday|Wednesday; campus=Central Campus; bldg=MLB|AH; subject=MATH;
+    mode=In Person; title=LEO Lecturer II; time=09:00-12:00
+
+Values of one dimension are OR-ed, dimensions are AND-ed, and ``time`` keeps
+meetings that overlap the window.  Values match case-insensitively, like the
+viewers' text filters (``bldg=mlb`` finds MLB).  ``Filter.canonical``
+case-folds, sorts and de-duplicates everything, so equivalent expressions
+share one key no matter how they were written.  ``compile`` turns a filter into one boolean mask: categorical
+dimensions through a lookup table indexed by the category codes, days through
+one AND of the ``Days`` bitmask.
+
+``FilterCache`` keeps the row positions of recent expressions per term frame
+in an LRU, so popular queries are answered from memory across sessions.
+"""
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, fields
+
+import numpy as np
+import pandas as pd
+
+from leosched.schedule import DAY_BITS, DAY_NAMES
+
+# expression key -> frame column, for the categorical dimensions
+COLUMNS = {
+    "campus": "CampusPrediction",
+    "bldg": "BldgPrediction",
+    "subject": "Subject",
+    "mode": "Instruction Mode Descrshort",
+    "title": "Job Title",
+}
+CACHE_SIZE = 256  # expressions per term frame
+
+
+def _minutes(hhmm: str) -> int:
+    hours, _, minutes = hhmm.strip().partition(":")
+    return int(hours) * 60 + int(minutes or 0)
+
+
+@dataclass(frozen=True)
+class Filter:
+    """A conjunction of per-dimension value sets; empty means "any"."""
+
+    day: tuple[str, ...] = ()
+    campus: tuple[str, ...] = ()
+    bldg: tuple[str, ...] = ()
+    subject: tuple[str, ...] = ()
+    mode: tuple[str, ...] = ()
+    title: tuple[str, ...] = ()
+    time: tuple[int, int] | None = None  # [start, end) minutes
+
+    def __post_init__(self):
+        days = {d.casefold(): d for d in DAY_NAMES}
+        for f in fields(self):
+            if f.name != "time":
+                values = getattr(self, f.name)
+                values = (values,) if isinstance(values, str) else values
+                values = {str(v).casefold() for v in values}
+                if f.name == "day":
+                    unknown = values - set(days)
+                    if unknown:
+                        raise ValueError(f"unknown day(s): {', '.join(sorted(unknown))}")
+                    values = sorted((days[v] for v in values), key=DAY_NAMES.index)
+                object.__setattr__(self, f.name, tuple(sorted(values) if f.name != "day" else values))
+        if self.time is not None:
+            start, end = map(int, self.time)
+            if not 0 <= start < end <= 24 * 60:
+                raise ValueError(f"bad time window: {self.time}")
+            object.__setattr__(self, "time", (start, end))
+
+    @classmethod
+    def parse(cls, text: str) -> "Filter":
+        """``Filter`` from its expression form (see the module docstring)."""
+        kwargs = {}
+        for part in filter(None, (p.strip() for p in text.split(";"))):
+            key, sep, value = part.partition("=")
+            key = key.strip().lower()
+            if not sep or key not in {f.name for f in fields(cls)}:
+                raise ValueError(f"bad filter term: {part!r}")
+            if key == "time":
+                start, _, end = value.partition("-")
+                kwargs[key] = (_minutes(start), _minutes(end))
+            else:
+                kwargs[key] = tuple(v.strip() for v in value.split("|") if v.strip())
+        return cls(**kwargs)
+
+    @property
+    def canonical(self) -> str:
+        parts = [f"{f.name}={'|'.join(getattr(self, f.name))}"
+                 for f in fields(self) if f.name != "time" and getattr(self, f.name)]
+        if self.time is not None:
+            start, end = self.time
+            parts.append(f"time={start // 60:02d}:{start % 60:02d}-{end // 60:02d}:{end % 60:02d}")
+        return "; ".join(parts)
+
+    def __str__(self) -> str:
+        return self.canonical or "(everything)"
+
+    def compile(self, df: pd.DataFrame) -> np.ndarray:
+        """One boolean mask over ``df`` for the whole expression."""
+        mask = np.ones(len(df), dtype=bool)
+        if self.day:
+            bits = np.uint8(sum(int(DAY_BITS[d]) for d in self.day))
+            mask &= (df["Days"].to_numpy(dtype=np.uint8) & bits) != 0
+        for key, col in COLUMNS.items():
+            values = getattr(self, key)
+            if not values:
+                continue
+            if col not in df.columns:
+                raise KeyError(f"'{key}' filters need the {col!r} column (LEO lecturers only)")
+            cat = df[col].astype("category")
+            folded = pd.Series(cat.cat.categories.astype("string")).str.casefold()
+            wanted = np.r_[folded.isin(values).to_numpy(), False]  # last slot: code -1 (missing)
+            mask &= wanted[cat.cat.codes.to_numpy()]
+        if self.time is not None:
+            start, end = df["Start Min"].to_numpy(), df["End Min"].to_numpy()
+            mask &= (start >= 0) & (start < self.time[1]) & (end > self.time[0])
+        return mask
+
+    def positions(self, df: pd.DataFrame) -> np.ndarray:
+        return np.flatnonzero(self.compile(df)).astype(np.int32)
+
+
+class FilterCache:
+    """LRU of expression -> sorted row positions over one term frame."""
+
+    def __init__(self, df: pd.DataFrame, maxsize: int = CACHE_SIZE):
+        self.df = df
+        self.maxsize = maxsize
+        self._results: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = self.misses = 0
+
+    @property
+    def nbytes(self) -> int:
+        return sum(p.nbytes for p in self._results.values())
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def positions(self, expr: Filter | str) -> np.ndarray:
+        flt = Filter.parse(expr) if isinstance(expr, str) else expr
+        key = flt.canonical
+        with self._lock:
+            if key in self._results:
+                self._results.move_to_end(key)
+                self.hits += 1
+                return self._results[key]
+        rows = flt.positions(self.df)
+        rows.flags.writeable = False  # shared between sessions
+        with self._lock:
+            self.misses += 1
+            self._results[key] = rows
+            while len(self._results) > self.maxsize:
+                self._results.popitem(last=False)
+        return rows
+
+    def stats(self) -> dict:
+        return {"entries": len(self), "hits": self.hits, "misses": self.misses,
+                "kb": round(self.nbytes / 1024, 1)}
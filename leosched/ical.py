@@ -0,0 +1,238 @@
+"""Batch iCalendar (.ics) export of lecturers' teaching schedules.
+
+Every meeting row becomes one weekly recurring ``VEVENT``: the first
+occurrence is the first date on or after ``Meeting Start Dt`` whose weekday is
+in ``Days``, ``BYDAY`` lists the days of the bitmask and ``UNTIL`` is
+``Meeting End Dt``.  Times are local to ``America/Detroit`` (all three
+campuses).
+
+``write_calendars`` groups a term's lecturer meetings by UM ID (or by
+department) in one pass and renders the groups in chunks across a process
+pool; each worker builds its events column-wise for the whole chunk before
+splitting them into calendars.
+
+    python -m leosched.ical W25 --by department -o calendars/
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+TZID = "America/Detroit"
+BYDAY = ["MO", "TU", "WE", "TH", "FR", "SA", "SU"]  # bit order of the Days mask
+GROUP_COLUMNS = {"lecturer": "UM ID", "department": "Department Name"}
+CHUNK_GROUPS = 200  # calendars per worker task
+
+# the Eastern rules in force since 2007
+VTIMEZONE = "\r\n".join([
+    "BEGIN:VTIMEZONE", f"TZID:{TZID}",
+    "BEGIN:DAYLIGHT", "TZOFFSETFROM:-0500", "TZOFFSETTO:-0400", "TZNAME:EDT",
+    "DTSTART:19700308T020000", "RRULE:FREQ=YEARLY;BYMONTH=3;BYDAY=2SU", "END:DAYLIGHT",
+    "BEGIN:STANDARD", "TZOFFSETFROM:-0400", "TZOFFSETTO:-0500", "TZNAME:EST",
+    "DTSTART:19701101T020000", "RRULE:FREQ=YEARLY;BYMONTH=11;BYDAY=1SU", "END:STANDARD",
+    "END:VTIMEZONE",
+])
+
+EVENT_COLUMNS = [
+    "Subject", "Catalog Nbr", "Class Section", "Crse Descr", "Class Nbr", "Class Instr ID",
+    "Class Instr Name", "RoomPrediction", "BldgPrediction", "Facility Descr", "CampusPrediction",
+    "Meeting Start Dt", "Meeting End Dt", "Start Min", "End Min", "Days",
+]
+
+# ------------------ Rendering ------------------
+
+def _escape(s: pd.Series) -> pd.Series:
+    s = s.astype("string").fillna("")
+    return s.str.replace("\\", "\\\\").str.replace(";", "\\;").str.replace(",", "\\,").str.replace("\n", "\\n")
+
+
+def _fold(line: str) -> str:
+    """Fold a content line at 75 octets (RFC 5545 3.1)."""
+    if len(line.encode()) <= 75:
+        return line
+    out, current = [], ""
+    for ch in line:
+        if len((current + ch).encode()) > 75:
+            out.append(current)
+            current = " " + ch
+        else:
+            current += ch
+    return "\r\n".join(out + [current])
+
+
+def _first_meeting(start: np.ndarray, days: np.ndarray) -> np.ndarray:
+    """First date on or after ``start`` that falls on a day in the ``days`` mask."""
+    weekday = (start.astype("datetime64[D]").view("int64") + 3) % 7  # 1970-01-01 was a Thursday
+    first = np.full(len(start), np.datetime64("NaT"), dtype="datetime64[D]")
+    for offset in range(7):
+        hit = np.isnat(first) & ((days >> ((weekday + offset) % 7)) & 1).astype(bool)
+        first[hit] = start[hit].astype("datetime64[D]") + offset
+    return first
+
+
+def render_events(df: pd.DataFrame, stamp: str, uid_prefix: str) -> pd.Series:
+    """``VEVENT`` text for every row with a time, days and dates (others give NA)."""
+    days = df["Days"].to_numpy(dtype=np.uint8)
+    start_min, end_min = df["Start Min"].to_numpy(), df["End Min"].to_numpy()
+    start_dt = df["Meeting Start Dt"].astype("datetime64[s]").to_numpy()
+    end_dt = df["Meeting End Dt"].astype("datetime64[s]").to_numpy()
+    ok = (days != 0) & (start_min >= 0) & (end_min > start_min) & ~np.isnat(start_dt) & ~np.isnat(end_dt)
+
+    first = pd.Series(_first_meeting(start_dt, days)).dt.strftime("%Y%m%d")
+    # UNTIL must be UTC when DTSTART has a TZID; 03:59:59Z the next day is late evening in Detroit
+    until = (pd.Series(end_dt) + pd.Timedelta(days=1)).dt.strftime("%Y%m%dT035959Z")
+
+    def clock(minutes):
+        m = pd.Series(minutes, dtype="int32").clip(lower=0)
+        return (m // 60).astype("string").str.zfill(2) + (m % 60).astype("string").str.zfill(2) + "00"
+
+    byday = pd.Series([",".join(d for i, d in enumerate(BYDAY) if mask >> i & 1) for mask in range(128)])
+    byday = byday.iloc[days].reset_index(drop=True)
+
+    def text(col):
+        return df[col].astype("string").fillna("").reset_index(drop=True)
+
+    course = (text("Subject") + " " + text("Catalog Nbr") + "-" + text("Class Section")).str.strip(" -")
+    summary = _escape(course + " " + text("Crse Descr"))
+    room = (df["RoomPrediction"].astype("string").fillna("") + " "
+            + df["BldgPrediction"].astype("string").fillna("")).str.strip()
+    location = _escape((room + ", " + df["CampusPrediction"].astype("string").fillna("")).str.strip(", "))
+    descr = _escape("Instructor: " + df["Class Instr Name"].astype("string").fillna("")
+                    + "\nFacility: " + df["Facility Descr"].astype("string").fillna(""))
+    # Dearborn and Flint rows often lack Class Nbr / Mtg Nbr, so key on course, section and pattern
+    uid = (uid_prefix + "-" + course.str.replace(" ", "") + "-" + text("Class Nbr") + "-"
+           + pd.Series(days).astype("string") + "-" + pd.Series(start_min).astype("string") + "-"
+           + text("Class Instr ID") + "@leosched")
+    events = (
+        "BEGIN:VEVENT\r\nUID:" + uid.reset_index(drop=True)
+        + f"\r\nDTSTAMP:{stamp}"
+        + f"\r\nDTSTART;TZID={TZID}:" + first + "T" + clock(start_min)
+        + f"\r\nDTEND;TZID={TZID}:" + first + "T" + clock(end_min)
+        + "\r\nRRULE:FREQ=WEEKLY;BYDAY=" + byday + ";UNTIL=" + until
+        + "\r\nSUMMARY:" + summary.reset_index(drop=True)
+        + "\r\nLOCATION:" + location.reset_index(drop=True)
+        + "\r\nDESCRIPTION:" + descr.reset_index(drop=True)
+        + "\r\nEND:VEVENT"
+    )
+    events = events.map(lambda e: "\r\n".join(_fold(line) for line in e.split("\r\n")), na_action="ignore")
+    return events.where(ok, pd.NA)
+
+
+def calendar(events, name: str) -> str:
+    """One ``VCALENDAR`` around already rendered events."""
+    body = [e for e in events if isinstance(e, str)]
+    return "\r\n".join([
+        "BEGIN:VCALENDAR", "VERSION:2.0", "PRODID:-//leosched//LEO schedules//EN", "CALSCALE:GREGORIAN",
+        _fold(f"X-WR-CALNAME:{name}"), f"X-WR-TIMEZONE:{TZID}", VTIMEZONE, *body, "END:VCALENDAR",
+    ]) + "\r\n"
+
+
+def dtstamp() -> str:
+    return pd.Timestamp.now(tz="UTC").strftime("%Y%m%dT%H%M%SZ")
+
+
+def single_calendar(df: pd.DataFrame, name: str, uid_prefix: str = "term") -> str:
+    """The .ics text for one set of meetings, e.g. one instructor's week."""
+    return calendar(render_events(df[EVENT_COLUMNS], dtstamp(), uid_prefix), name)
+
+# ------------------ Batch ------------------
+
+def _slug(value) -> str:
+    return re.sub(r"[^A-Za-z0-9]+", "_", str(value)).strip("_") or "unknown"
+
+
+def file_stems(names: dict) -> dict:
+    """File name (without .ics) per group, unique even where two names slug alike."""
+    slugs = {value: _slug(name).lower() for value, name in names.items()}
+    clashes = pd.Series(list(slugs.values())).value_counts()
+    stems = {}
+    for value, name in names.items():
+        stem = _slug(name)
+        if clashes[slugs[value]] > 1:
+            # the group key tells them apart; department keys are the names themselves, so hash those
+            suffix = _slug(value) if str(value) != str(name) else hashlib.sha1(str(value).encode()).hexdigest()[:8]
+            stem = f"{stem}_{suffix}"
+        stems[value] = stem
+    return stems
+
+
+def _render_chunk(args) -> list[tuple[str, str, int]]:
+    chunk, names, stems, key, stamp, uid_prefix, outdir = args
+    events = render_events(chunk, stamp, uid_prefix)
+    written = []
+    for value, idx in chunk.groupby(key, sort=False, observed=True).indices.items():
+        group_events = events.iloc[idx].dropna()
+        if group_events.empty:
+            continue
+        name = names.get(value, str(value))
+        path = Path(outdir) / f"{stems.get(value, _slug(name))}.ics"
+        path.write_text(calendar(group_events, name), newline="")
+        written.append((str(value), str(path), len(group_events)))
+    return written
+
+
+def calendar_name(df: pd.DataFrame, by: str) -> dict:
+    """File / calendar name for every group: uniqname (or name) per lecturer, else the department."""
+    if by == "department":
+        return {v: v for v in df["Department Name"].dropna().unique()}
+    first = df.drop_duplicates("UM ID")
+    label = first["Uniqname"].astype("string").str.lower().fillna(first["Class Instr Name"].astype("string"))
+    return dict(zip(first["UM ID"], label.fillna(first["UM ID"].astype("string"))))
+
+
+def write_calendars(df: pd.DataFrame, outdir: str | os.PathLike, by: str = "lecturer",
+                    uid_prefix: str = "term", workers: int | None = None) -> pd.DataFrame:
+    """Write one .ics per lecturer or department; returns (group, path, events) rows."""
+    key = GROUP_COLUMNS[by]
+    outdir = Path(outdir)
+    outdir.mkdir(parents=True, exist_ok=True)
+    stamp = dtstamp()
+    names = calendar_name(df, by)
+    stems = file_stems(names)
+
+    # one grouped pass: rows sorted by group, then cut into chunks of whole groups
+    frame = df[EVENT_COLUMNS + ([key] if key not in EVENT_COLUMNS else [])]
+    frame = frame[frame[key].notna()].sort_values(key, kind="stable")
+    group_starts = np.flatnonzero(np.r_[True, frame[key].to_numpy()[1:] != frame[key].to_numpy()[:-1]])
+    cuts = list(group_starts[::CHUNK_GROUPS][1:]) if len(frame) else []
+    bounds = zip([0] + cuts, cuts + [len(frame)])
+    tasks = [(frame.iloc[a:b], names, stems, key, stamp, uid_prefix, str(outdir)) for a, b in bounds if b > a]
+
+    workers = workers or min(len(tasks), os.cpu_count() or 1)
+    if workers <= 1:
+        results = map(_render_chunk, tasks)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_render_chunk, tasks))
+    return pd.DataFrame([row for chunk in results for row in chunk], columns=["group", "path", "events"])
+
+
+def main(argv: list[str] | None = None) -> int:
+    from leosched.terms import TERMS, load_term
+
+    parser = argparse.ArgumentParser(prog="python -m leosched.ical", description=__doc__.splitlines()[0])
+    parser.add_argument("term", choices=list(TERMS))
+    parser.add_argument("--by", choices=list(GROUP_COLUMNS), default="lecturer")
+    parser.add_argument("-o", "--outdir", default="calendars")
+    parser.add_argument("--workers", type=int, help="worker processes (default: one per CPU)")
+    args = parser.parse_args(argv)
+
+    df = load_term(TERMS[args.term]).lecturers()
+    t0 = time.perf_counter()
+    written = write_calendars(df, Path(args.outdir) / args.term, args.by, args.term, args.workers)
+    print(f"{len(written)} calendars, {written['events'].sum()} events in "
+          f"{time.perf_counter() - t0:.2f}s -> {Path(args.outdir) / args.term}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,106 @@
+"""Parallel ingest of many terms' campus exports and rosters.
+
+Every source file of every requested term (A2, Dearborn and Flint exports
+plus the monthly rosters) is an independent job: ``load_terms`` parses and
+normalizes them across a process pool.  Workers hand their frames back as
+Arrow IPC streams, which are flat column buffers (categories as dictionary
+arrays), so the parent receives one ``bytes`` object per file instead of
+pickled Python objects, and rebuilding the frame is mostly zero-copy.  The
+parent then only combines each term's parts (``terms.assemble``).
+
+    python -m leosched.ingest FA24 W25 SS25 SU25 --workers 4
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+import pyarrow as pa
+
+from leosched.schedule import footprint, load_registry, normalize
+from leosched.snapshot import load_snapshot
+from leosched.terms import TERMS, LoadedTerm, Term, assemble, load_roster
+
+ROSTER = "roster"  # job kind next to the campus names
+
+
+def to_buffer(df: pd.DataFrame) -> bytes:
+    """``df`` as one Arrow IPC stream."""
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def from_buffer(buf: bytes) -> pd.DataFrame:
+    df = pa.ipc.open_stream(buf).read_all().to_pandas()
+    for col in df.columns:
+        s = df[col]
+        if isinstance(s.dtype, pd.CategoricalDtype) and not isinstance(s.cat.categories, pd.DatetimeIndex):
+            # Arrow gives back str / object categories; ``compact`` uses the "string" dtype
+            df[col] = pd.Categorical.from_codes(s.cat.codes, s.cat.categories.astype("string"),
+                                                ordered=s.cat.ordered)
+    return df
+
+
+def _ingest(job: tuple[str, str, str]) -> tuple[str, str, bytes, int]:
+    """One source file -> (term key, kind, Arrow buffer, raw bytes)."""
+    key, kind, path = job
+    if kind == ROSTER:
+        return key, kind, to_buffer(load_roster(path)), 0
+    raw = load_snapshot(path)
+    return key, kind, to_buffer(normalize(raw, kind, load_registry())), footprint(raw)
+
+
+def load_terms(terms: list[Term], workers: int | None = None) -> dict[str, LoadedTerm]:
+    """Load ``terms`` with every source file parsed in its own pool task."""
+    jobs = [(t.key, campus, str(path)) for t in terms for campus, path in t.sources.items()]
+    jobs += [(t.key, ROSTER, str(t.monthly)) for t in terms]
+    # largest files first, so the longest jobs do not start last
+    jobs.sort(key=lambda job: -os.path.getsize(job[2]))
+
+    workers = workers or min(len(jobs), os.cpu_count() or 1)
+    if workers <= 1:
+        results = map(_ingest, jobs)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_ingest, jobs))
+
+    parts: dict[str, dict[str, pd.DataFrame]] = {t.key: {} for t in terms}
+    raw_bytes = dict.fromkeys(parts, 0)
+    for key, kind, buf, size in results:
+        parts[key][kind] = from_buffer(buf)
+        raw_bytes[key] += size
+    return {
+        t.key: assemble(t, {c: parts[t.key][c] for c in t.sources}, parts[t.key][ROSTER], raw_bytes[t.key])
+        for t in terms
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m leosched.ingest", description=__doc__.splitlines()[0])
+    parser.add_argument("terms", nargs="*", metavar="TERM", help=f"terms to load: {', '.join(TERMS)} (default: all)")
+    parser.add_argument("--workers", type=int, help="worker processes (default: one per CPU)")
+    args = parser.parse_args(argv)
+    unknown = set(args.terms) - set(TERMS)
+    if unknown:
+        parser.error(f"unknown term(s): {', '.join(sorted(unknown))}")
+
+    terms = [TERMS[k] for k in args.terms or TERMS]
+    t0 = time.perf_counter()
+    loaded = load_terms(terms, args.workers)
+    elapsed = time.perf_counter() - t0
+    for key, lt in loaded.items():
+        print(f"{key}: {len(lt.schedule)} meetings, {len(lt.roster)} roster rows, "
+              f"{lt.nbytes / 2**20:.1f} MB")
+    print(f"{len(terms)} terms in {elapsed:.2f}s", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,107 @@
+"""Prefix index of instructors across every campus of a term.
+
+``normalize`` already folds Dearborn's ``Primary Instructor Last/First Name``
+into the A2 ``Class Instr Name`` ("Last,First"), and Flint spells it
+"Last, First", so one index over the combined term frame covers all three
+campuses.  Every instructor (one UM ID, or one normalized name where the
+export has no ID) is filed under "last first", "first last" of each spelling
+and the UM ID; ``InstructorIndex.find``
+answers a prefix with a binary search over those sorted keys and returns the
+instructor's row positions directly.
+"""
+from __future__ import annotations
+
+import bisect
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+
+from leosched.linkage import split_name
+from leosched.schedule import DAY_NAMES, on_day
+from leosched.search import group_positions
+
+
+class Instructor(NamedTuple):
+    name: str
+    um_id: int  # -1 when the export carries no ID
+    campuses: tuple[str, ...]
+    positions: np.ndarray
+
+    @property
+    def label(self) -> str:
+        um_id = f" ({self.um_id})" if self.um_id >= 0 else ""
+        return f"{self.name}{um_id} - {', '.join(self.campuses)}"
+
+
+def _keys(name: str, um_id: int) -> set[str]:
+    last, first = split_name(name)
+    keys = {f"{last} {first}".strip(), f"{first} {last}".strip()}
+    if first:
+        keys.add(f"{first.split()[0]} {last}")  # "kevin korsyn" for "Korsyn,Kevin E"
+    if um_id >= 0:
+        keys.add(str(um_id))
+    return {k for k in keys if k}
+
+
+class InstructorIndex:
+    """Sorted ``(key, instructor)`` pairs over one schedule frame."""
+
+    def __init__(self, df: pd.DataFrame):
+        names = df["Class Instr Name"].astype("string").fillna("").to_numpy(dtype=object)
+        ids = df["Class Instr ID"].to_numpy()
+        # one instructor per UM ID, however each campus spells the name; rows without an ID
+        # fall back to the normalized "last first"
+        normalized = {n: " ".join(split_name(n)).strip() for n in pd.unique(names)}
+        person = np.where(ids >= 0, ids.astype(str), pd.Series(names).map(normalized).radd("~").to_numpy())
+        codes = pd.factorize(person)[0]
+        # every spelling of every instructor with its count, most frequent (then alphabetical) first
+        spellings = (pd.DataFrame({"code": codes, "name": names})
+                     .query("name != ''").value_counts(sort=False).reset_index(name="n")
+                     .sort_values(["code", "n", "name"], ascending=[True, False, True]))
+        spelled = dict(iter(spellings.groupby("code", sort=False)["name"]))
+        campus = df["Campus"].astype("string").to_numpy()
+        self.instructors: list[Instructor] = []
+        entries = []
+        for code, pos in group_positions(codes).items():
+            um_id = int(ids[pos[0]])
+            variants = list(spelled[code]) if code in spelled else []
+            if not variants and um_id < 0:
+                continue
+            campuses = tuple(sorted(set(campus[pos])))
+            self.instructors.append(Instructor(variants[0] if variants else "", um_id, campuses, pos))
+            keys = set().union(_keys("", um_id), *(_keys(n, um_id) for n in variants))
+            entries += [(key, len(self.instructors) - 1) for key in keys]
+        entries.sort()
+        self._keys = [k for k, _ in entries]
+        self._slots = [i for _, i in entries]
+
+    @property
+    def nbytes(self) -> int:
+        return sum(i.positions.nbytes for i in self.instructors)
+
+    def find(self, prefix: str, limit: int | None = None) -> list[Instructor]:
+        """Instructors with a name part or UM ID starting with ``prefix``."""
+        query = prefix.strip()
+        if not query.isdigit():
+            last, first = split_name(query)
+            query = f"{last} {first}" if "," in query else f"{first} {last}"
+            query = query.strip()
+        if not query:
+            return []
+        lo = bisect.bisect_left(self._keys, query)
+        hi = bisect.bisect_left(self._keys, query + "￿")
+        seen = dict.fromkeys(self._slots[lo:hi])
+        found = [self.instructors[i] for i in seen]
+        found.sort(key=lambda i: (-len(i.positions), i.name))
+        return found[:limit] if limit else found
+
+
+def week(df: pd.DataFrame, positions: np.ndarray) -> pd.DataFrame:
+    """One row per meeting day of the given rows, ordered Monday to Sunday by start time."""
+    rows = df.iloc[positions]
+    days = rows["Days"].to_numpy()
+    frames = [rows[on_day(days, day)].assign(Day=day) for day in DAY_NAMES]
+    out = pd.concat(frames, ignore_index=True)
+    out["Day"] = pd.Categorical(out["Day"], categories=DAY_NAMES, ordered=True)
+    return out.sort_values(["Day", "Start Min"], kind="stable").reset_index(drop=True)
@@ -0,0 +1,153 @@
+"""Record linkage of instructor names across exports that share no ID.
+
+The Flint schedules carry only ``Class Instr Name`` ("Last, First"), while the
+monthly roster, ``FlintLecs.csv`` and ``FlintEmails.csv`` spell names in other
+layouts.  ``link_names`` normalizes both sides to ``(last, first)``, groups
+right-hand names into blocks by surname prefix and scores each left name only
+against the candidates in its own blocks, so the work grows with block size
+rather than ``len(left) * len(right)``.  A left name whose best score is shared
+by differently spelled candidates is ambiguous and stays unlinked.
+
+Links are cached under ``.snapshots/links/`` keyed by both name lists, so an
+unchanged pair of files is never re-scored.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import unicodedata
+from collections import defaultdict
+from difflib import SequenceMatcher
+
+import pandas as pd
+
+from leosched.snapshot import SNAPSHOT_DIR
+
+LINK_DIR = SNAPSHOT_DIR / "links"
+DEFAULT_THRESHOLD = 0.85
+BLOCK_PREFIX = 3  # surname letters that define a block
+LINK_FORMAT = 2  # bump when the matching rules change, to re-score cached links
+
+_SUFFIXES = {"jr", "sr", "ii", "iii", "iv"}
+
+# ------------------ Normalization ------------------
+
+def _clean(text: str) -> str:
+    text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode()
+    text = re.sub(r"[^a-z\- ]", " ", text.lower())
+    return " ".join(w for w in text.split() if w not in _SUFFIXES)
+
+
+def split_name(name) -> tuple[str, str]:
+    """``(last, first)`` from "Last, First" or "First Last", lower-cased."""
+    if not isinstance(name, str) or not name.strip():
+        return "", ""
+    if "," in name:
+        last, first = name.split(",", 1)
+        return _clean(last), _clean(first)
+    words = _clean(name).split()
+    if not words:
+        return "", ""
+    return words[-1], " ".join(words[:-1])
+
+
+def full_names(df: pd.DataFrame, last_col: str, first_col: str) -> pd.Series:
+    """"Last, First" strings from separate name columns, keeping ``df``'s index."""
+    return df[last_col].fillna("").astype(str) + ", " + df[first_col].fillna("").astype(str)
+
+
+def block_keys(last: str) -> set[str]:
+    """Surname prefixes a name is filed under; each part of a double surname counts."""
+    parts = [p for p in re.split(r"[\s\-]+", last) if p]
+    keys = {p[:BLOCK_PREFIX] for p in parts}
+    compact = "".join(parts)
+    if compact:
+        keys.add(compact[:BLOCK_PREFIX])
+    return keys
+
+# ------------------ Scoring ------------------
+
+def _first_similarity(a: str, b: str) -> float:
+    if not a or not b:
+        return 0.5
+    a, b = a.split()[0], b.split()[0]
+    if a == b:
+        return 1.0
+    if len(a) == 1 or len(b) == 1:
+        return 0.9 if a[0] == b[0] else 0.0
+    if a.startswith(b) or b.startswith(a):  # Jon / Jonathan
+        return 0.9
+    return SequenceMatcher(None, a, b).ratio()
+
+
+def score(left: tuple[str, str], right: tuple[str, str]) -> float:
+    """Similarity in [0, 1]; the surname carries most of the weight."""
+    last = SequenceMatcher(None, left[0].replace(" ", ""), right[0].replace(" ", "")).ratio()
+    return 0.6 * last + 0.4 * _first_similarity(left[1], right[1])
+
+# ------------------ Linking ------------------
+
+def _link(left: list[str], right: pd.Series, threshold: float) -> dict[str, tuple]:
+    blocks: dict[str, list[int]] = defaultdict(list)
+    parsed_right = {}
+    for pos, name in enumerate(right):
+        parts = split_name(name)
+        if not parts[0]:
+            continue
+        parsed_right[pos] = parts
+        for key in block_keys(parts[0]):
+            blocks[key].append(pos)
+
+    links = {}
+    for name in left:
+        parts = split_name(name)
+        # candidates in ``right`` order, so equal scores resolve the same way on every run
+        candidates = sorted({pos for key in block_keys(parts[0]) for pos in blocks.get(key, ())})
+        scored = [(score(parts, parsed_right[pos]), pos) for pos in candidates]
+        best_score = max((s for s, _ in scored), default=0.0)
+        if best_score < threshold:
+            continue
+        tied = [pos for s, pos in scored if s == best_score]
+        if len({parsed_right[pos] for pos in tied}) > 1:
+            continue  # "Smith, J" against "Smith, Jane" and "Smith, John": ambiguous, no link
+        # several rows of one name (a roster lists each appointment): the first one
+        links[name] = (right.index[tied[0]], round(best_score, 3))
+    return links
+
+
+def _cache_file(left: list[str], right: pd.Series, threshold: float) -> os.PathLike:
+    h = hashlib.sha1()
+    h.update(json.dumps(left).encode())
+    h.update(json.dumps([[str(k), str(v)] for k, v in right.items()]).encode())
+    h.update(f"{threshold}|{LINK_FORMAT}".encode())
+    return LINK_DIR / f"{h.hexdigest()[:20]}.json"
+
+
+def link_names(
+    left: pd.Series, right: pd.Series, threshold: float = DEFAULT_THRESHOLD
+) -> pd.DataFrame:
+    """Best right-hand match for every distinct name in ``left``.
+
+    Returns a frame indexed by the left name with ``match`` (the label of the
+    matching ``right`` row) and ``score``; names with no candidate scoring at
+    least ``threshold``, or tied between different names, are left out.  Ties
+    between rows spelling the same name go to the first of them.
+    """
+    names = sorted({n for n in left.dropna().unique() if str(n).strip()})
+    path = _cache_file(names, right, threshold)
+    try:
+        cached = json.loads(path.read_text())
+        links = {name: (right.index[pos], s) for name, (pos, s) in cached.items()}
+    except (OSError, ValueError):
+        links = _link(names, right, threshold)
+        # store positions rather than labels so any index type round-trips
+        positions = {label: i for i, label in enumerate(right.index)}
+        LINK_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text(json.dumps({n: (positions[lbl], s) for n, (lbl, s) in links.items()}))
+        os.replace(tmp, path)
+    return pd.DataFrame(
+        [(n, lbl, s) for n, (lbl, s) in links.items()], columns=["name", "match", "score"]
+    ).set_index("name")
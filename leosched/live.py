@@ -0,0 +1,76 @@
+"""What is in session now: per-day event timelines and a moving cursor.
+
+``Timeline`` turns every timed meeting of a day into two events, a start at
+``Start Min`` and an end at ``End Min``, sorted by minute (ends before starts
+at the same minute, so back-to-back meetings hand over cleanly).  A
+``Cursor`` walks one date's events: ``advance(minute)`` applies only the
+events between the previous position and ``minute`` to the active set, so a
+dashboard refreshed every minute does work proportional to the meetings that
+started or ended since the last refresh, not to the size of the term.  Going
+back in time (or to another date) starts a new cursor.
+"""
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from leosched.dates import DateIndex
+from leosched.schedule import DAY_BITS, DAY_NAMES
+
+
+class Cursor:
+    """Active meetings at the last minute this cursor was advanced to."""
+
+    def __init__(self, minutes: np.ndarray, rows: np.ndarray, starts: np.ndarray):
+        self.minutes, self.rows, self.starts = minutes, rows, starts
+        self.pos = 0
+        self.minute = -1
+        self.active: set[int] = set()
+
+    def advance(self, minute: int) -> int:
+        """Move to ``minute``; returns how many events were applied."""
+        if minute < self.minute:
+            raise ValueError("a cursor only moves forward; start a new one")
+        stop = int(np.searchsorted(self.minutes, minute, side="right"))
+        rows, starts = self.rows[self.pos:stop], self.starts[self.pos:stop]
+        # a meeting that both starts and ends inside the step is added, then removed
+        self.active.update(rows[starts].tolist())
+        self.active.difference_update(rows[~starts].tolist())
+        applied, self.pos, self.minute = stop - self.pos, stop, minute
+        return applied
+
+    def positions(self) -> np.ndarray:
+        return np.fromiter(sorted(self.active), dtype=np.int32, count=len(self.active))
+
+    @property
+    def next_change(self) -> int | None:
+        """Minute of the next start or end, if any."""
+        return int(self.minutes[self.pos]) if self.pos < len(self.minutes) else None
+
+
+class Timeline:
+    """Start / end events of every day of the week, sorted by minute."""
+
+    def __init__(self, df: pd.DataFrame):
+        start = df["Start Min"].to_numpy(dtype=np.int16)
+        end = df["End Min"].to_numpy(dtype=np.int16)
+        days = df["Days"].to_numpy(dtype=np.uint8)
+        timed = (start >= 0) & (end > start)
+        self.dates = DateIndex(df)
+        self.events: dict[str, tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+        for day, bit in DAY_BITS.items():
+            rows = np.flatnonzero(timed & ((days & bit) != 0)).astype(np.int32)
+            minutes = np.concatenate([start[rows], end[rows]])
+            is_start = np.repeat([True, False], len(rows))
+            order = np.lexsort([is_start, minutes])
+            self.events[day] = (minutes[order], np.concatenate([rows, rows])[order], is_start[order])
+
+    @property
+    def nbytes(self) -> int:
+        return self.dates.nbytes + sum(a.nbytes for ev in self.events.values() for a in ev)
+
+    def cursor(self, date) -> Cursor:
+        """A cursor over the events of ``date``: its weekday, rows whose date range includes it."""
+        minutes, rows, starts = self.events[DAY_NAMES[pd.Timestamp(date).weekday()]]
+        keep = self.dates.active(date)[rows]
+        return Cursor(minutes[keep], rows[keep], starts[keep])
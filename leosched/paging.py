@@ -0,0 +1,97 @@
+"""Precomputed sort orders and pages of row positions.
+
+``SortOrders`` lexsorts a term frame once per sort key and direction (on
+category ranks and minutes, never on strings) and keeps each order as a rank per row.  Sorting a
+result set is then an ``argsort`` of small integers, or, for result sets that
+cover a large share of the frame, one pass over the precomputed permutation.
+Pages are slices of the sorted row positions, so a table only ever formats
+and ships the rows on screen.
+"""
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+# sort key -> columns, most significant first
+SORT_KEYS = {
+    "Time": ["Start Min", "BldgPrediction", "RoomPrediction"],
+    "Building": ["BldgPrediction", "RoomPrediction", "Start Min"],
+    "Room": ["RoomPrediction", "BldgPrediction", "Start Min"],
+    "Subject": ["Subject", "Catalog Nbr", "Class Section", "Start Min"],
+    "Instructor": ["Class Instr Name", "Start Min"],
+}
+PAGE_SIZES = [25, 50, 100, 250]
+DISPLAY_COLUMNS = [
+    "Meeting Time Start", "Meeting Time End", "RoomPrediction", "BldgPrediction", "Subject",
+    "Catalog Nbr", "Class Section", "Crse Descr", "Class Instr Name", "Instruction Mode Descrshort",
+    "CampusPrediction",
+]
+
+
+# code columns ordered by their leading number ("99" < "100" < "312C"), not as text
+NUMBERED = {"Catalog Nbr"}
+MISSING = np.iinfo(np.int32).max
+
+
+def _category_ranks(categories: pd.Index, numbered: bool) -> np.ndarray:
+    """Sort rank of each category (the categories need not be in order)."""
+    if isinstance(categories, pd.DatetimeIndex):
+        return np.argsort(np.argsort(categories.to_numpy(), kind="stable"), kind="stable")
+    text = categories.astype("string").to_numpy(dtype=object)
+    keys = [np.argsort(np.argsort(text, kind="stable"), kind="stable")]
+    if numbered:
+        lead = pd.Series(text).str.extract(r"^(\d+)", expand=False)
+        keys.append(pd.to_numeric(lead, errors="coerce").fillna(np.inf).to_numpy())
+    return np.argsort(np.lexsort(keys), kind="stable")
+
+
+def _sortable(s: pd.Series, descending: bool = False) -> np.ndarray:
+    """Integer sort values; missing categories and times sort last either way."""
+    if isinstance(s.dtype, pd.CategoricalDtype):
+        codes = s.cat.codes.to_numpy()
+        missing = codes < 0
+        values = _category_ranks(s.cat.categories, s.name in NUMBERED)[codes].astype(np.int32)
+    else:
+        values = s.to_numpy().astype(np.int32)
+        missing = values < 0  # -1 = no time
+    return np.where(missing, MISSING, -values if descending else values)
+
+
+class SortOrders:
+    """Row ranks under every ``SORT_KEYS`` order of one frame, built on first use."""
+
+    def __init__(self, df: pd.DataFrame):
+        self.df = df
+        self._ranks: dict[tuple[str, bool], np.ndarray] = {}
+        self._perms: dict[tuple[str, bool], np.ndarray] = {}
+
+    @property
+    def nbytes(self) -> int:
+        return sum(a.nbytes for a in [*self._ranks.values(), *self._perms.values()])
+
+    def permutation(self, key: str, descending: bool = False) -> np.ndarray:
+        if (key, descending) not in self._perms:
+            cols = SORT_KEYS[key]
+            perm = np.lexsort([_sortable(self.df[c], descending) for c in reversed(cols)]).astype(np.int32)
+            rank = np.empty(len(perm), dtype=np.int32)
+            rank[perm] = np.arange(len(perm), dtype=np.int32)
+            self._ranks[key, descending], self._perms[key, descending] = rank, perm
+        return self._perms[key, descending]
+
+    def order(self, rows: np.ndarray, key: str, descending: bool = False) -> np.ndarray:
+        """``rows`` sorted by ``key``; descending flips every sort column, missing values stay last."""
+        perm = self.permutation(key, descending)
+        if len(rows) * 8 > len(perm):
+            keep = np.zeros(len(perm), dtype=bool)
+            keep[rows] = True
+            return perm[keep[perm]]
+        return rows[np.argsort(self._ranks[key, descending][rows], kind="stable")]
+
+
+def page_count(n: int, size: int) -> int:
+    return max(1, -(-n // size))
+
+
+def page(rows: np.ndarray, number: int, size: int) -> np.ndarray:
+    """Rows of 1-based page ``number``."""
+    return rows[(number - 1) * size:number * size]
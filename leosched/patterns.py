@@ -0,0 +1,103 @@
+"""Meeting patterns (MWF, TTh, MW, ...) by building and start-time band.
+
+Every meeting row already carries its days as one ``uint8`` bitmask and its
+start as integer minutes, so ``PatternCube`` folds (days, start band, campus
+code, building code) into a single ``int64`` key per row and counts the keys
+with one ``np.unique``.  The result is a few thousand cells per term, from
+which the distribution of patterns, building x band grids and the busiest
+"prime time" cells are plain pandas group-bys.  Nothing is built from the
+``Mon``..``Sun`` strings.
+"""
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from leosched.schedule import day_count
+
+DAY_LETTERS = ["M", "T", "W", "Th", "F", "Sa", "Su"]  # bit order of the Days mask
+PATTERN_NAMES = np.array(["".join(d for i, d in enumerate(DAY_LETTERS) if mask >> i & 1) or "-"
+                          for mask in range(128)], dtype=object)
+BAND_MINUTES = 60
+NO_TIME = "no time"
+UNKNOWN = "unknown"  # campus / building of rows the building lookup could not place
+
+
+def band_label(band: int) -> str:
+    return NO_TIME if band < 0 else f"{band // 60:02d}:{band % 60:02d}"
+
+
+class PatternCube:
+    """Meeting counts per (pattern, start band, campus, building) of one frame."""
+
+    def __init__(self, df: pd.DataFrame, band: int = BAND_MINUTES):
+        self.band = band
+        days = df["Days"].to_numpy(dtype=np.int64)
+        start = df["Start Min"].to_numpy().astype(np.int64)
+        bands = np.where(start >= 0, start // band, -1) + 1  # 0 = no time
+        campus = df["CampusPrediction"].astype("category")
+        bldg = df["BldgPrediction"].astype("category")
+        campus_codes = campus.cat.codes.to_numpy().astype(np.int64) + 1  # 0 = missing
+        bldg_codes = bldg.cat.codes.to_numpy().astype(np.int64) + 1
+        n_bands = 24 * 60 // band + 2
+        n_campus, n_bldg = len(campus.cat.categories) + 1, len(bldg.cat.categories) + 1
+
+        key = ((days * n_bands + bands) * n_campus + campus_codes) * n_bldg + bldg_codes
+        keys, counts = np.unique(key, return_counts=True)
+
+        keys, b = np.divmod(keys, n_bldg)
+        keys, c = np.divmod(keys, n_campus)
+        mask, t = np.divmod(keys, n_bands)
+        # label the missing code rather than leave NA, which group-bys and pivots would drop
+        campuses = np.r_[[UNKNOWN], np.asarray(campus.cat.categories, dtype=object)]
+        buildings = np.r_[[UNKNOWN], np.asarray(bldg.cat.categories, dtype=object)]
+        self.cells = pd.DataFrame({
+            "Days": mask.astype(np.uint8),
+            "Pattern": PATTERN_NAMES[mask],
+            "Day Count": day_count(mask.astype(np.uint8)),
+            "Band": np.where(t > 0, (t - 1) * band, -1).astype(np.int16),
+            "Campus": campuses[c],
+            "Building": buildings[b],
+            "Meetings": counts,
+        })
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.cells.memory_usage(deep=True).sum())
+
+    def _filtered(self, campus: str | None = None, building: str | None = None) -> pd.DataFrame:
+        cells = self.cells
+        if campus:
+            cells = cells[cells["Campus"] == campus]
+        if building:
+            cells = cells[cells["Building"] == building]
+        return cells
+
+    def patterns(self, campus: str | None = None, building: str | None = None) -> pd.DataFrame:
+        """Meetings per pattern, most common first, with each one's share."""
+        out = (self._filtered(campus, building)
+               .groupby(["Pattern", "Day Count"], sort=False)["Meetings"].sum()
+               .sort_values(ascending=False).reset_index())
+        out["Share"] = (out["Meetings"] / max(out["Meetings"].sum(), 1)).round(3)
+        return out
+
+    def grid(self, rows: str = "Pattern", campus: str | None = None, building: str | None = None,
+             patterns: list[str] | None = None) -> pd.DataFrame:
+        """``rows`` (Pattern, Building or Campus) x start band meeting counts."""
+        cells = self._filtered(campus, building)
+        if patterns:
+            cells = cells[cells["Pattern"].isin(patterns)]
+        out = cells.pivot_table(index=rows, columns="Band", values="Meetings", aggfunc="sum", fill_value=0)
+        out = out.loc[out.sum(axis=1).sort_values(ascending=False).index]
+        out.columns = [band_label(b) for b in out.columns]
+        return out
+
+    def prime_time(self, top: int = 20, campus: str | None = None, building: str | None = None,
+                   by_building: bool = True) -> pd.DataFrame:
+        """Busiest (building,) pattern and band cells: where rooms and people are crunched."""
+        cells = self._filtered(campus, building)
+        cells = cells[cells["Band"] >= 0]
+        keys = ["Campus"] + (["Building"] if by_building else []) + ["Pattern", "Band"]
+        out = cells.groupby(keys, sort=False)["Meetings"].sum().nlargest(top).reset_index()
+        out["Band"] = [f"{band_label(b)}-{band_label(b + self.band)}" for b in out["Band"]]
+        return out
@@ -0,0 +1,70 @@
+"""Validation and pruning of meeting rows right after ingest.
+
+More than half of every A2 export is rows no viewer can show: placeholder
+meetings with no days, a blank facility and a ``1:00 AM``-``1:00 AM`` time,
+plus rows without an instructor.  ``prune`` classifies every row with
+vectorized predicates and drops the requested categories before the roster
+merge and building lookup, so those stages only see real meetings.
+
+Works on the A2 and Flint layouts, which share the ``Facility ID``,
+``Meeting Time Start/End`` and ``Mon``..``Sun`` columns.
+"""
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+DAY_COLS = ["Mon", "Tues", "Wed", "Thurs", "Fri", "Sat", "Sun"]
+DAY_ON = ["Y", "X"]  # A2 flags a meeting day with Y, Flint with X
+
+# checked in this order; a row is filed under the first category it matches
+CATEGORIES = ("no instructor", "placeholder", "no meeting days", "no facility", "remote", "arranged")
+
+# rows no day-based view can ever display
+NEVER_SHOWN = ("no instructor", "placeholder", "no meeting days")
+# rows with no physical room, which the building views cannot place
+NO_ROOM = ("no facility", "remote", "arranged")
+
+
+def _blank(s: pd.Series) -> pd.Series:
+    return s.astype("string").str.strip().fillna("").eq("")
+
+
+def classify(df: pd.DataFrame) -> pd.Series:
+    """Prune category of every row, missing (NA) for rows that are kept."""
+    false = pd.Series(False, index=df.index)
+    no_days = ~df[[c for c in DAY_COLS if c in df.columns]].isin(DAY_ON).any(axis=1)
+    start = df.get("Meeting Time Start", false).astype("string").str.strip()
+    end = df.get("Meeting Time End", false).astype("string").str.strip()
+    facility = df["Facility ID"].astype("string").str.strip().str.upper()
+
+    conditions = [
+        _blank(df["Class Instr ID"]) if "Class Instr ID" in df.columns else false,
+        no_days & (start.eq(end).fillna(False) | _blank(start)),
+        no_days,
+        facility.fillna("").eq(""),
+        facility.eq("REMOTE").fillna(False),
+        facility.eq("ARR").fillna(False),
+    ]
+    reason = np.select(conditions, CATEGORIES, default="")
+    return pd.Series(reason, index=df.index).replace("", None)
+
+
+def prune(
+    df: pd.DataFrame, drop: tuple[str, ...] = NEVER_SHOWN
+) -> tuple[pd.DataFrame, pd.DataFrame, dict[str, int]]:
+    """Split ``df`` into kept rows and quarantined ``drop`` rows.
+
+    Returns ``(kept, quarantined, counts)``; ``quarantined`` carries a
+    ``Prune Reason`` column and ``counts`` has one entry per ``drop`` category.
+    """
+    reason = classify(df)
+    mask = reason.isin(drop)
+    counts = reason[mask].value_counts().reindex(list(drop), fill_value=0)
+    quarantined = df[mask].assign(**{"Prune Reason": reason[mask]})
+    return df[~mask].copy(), quarantined, {k: int(v) for k, v in counts.items()}
+
+
+def describe(counts: dict[str, int]) -> str:
+    """One-line summary of ``prune`` counts for a caption."""
+    return ", ".join(f"{name} {n}" for name, n in counts.items() if n) or "none"
@@ -0,0 +1,91 @@
+"""LEO lecturer ID set from the monthly roster, used as a semi-join filter.
+
+Only a small share of scheduled meetings are taught by LEO lecturers, but the
+viewers merged every meeting against the wide (40+ column) monthly roster and
+only then filtered on ``Job Title``.  ``lecturer_ids`` reduces the roster to a
+sorted ``int64`` array of UM IDs once, and ``semi_join`` cuts a schedule down
+to lecturer rows with a binary search per row, so the roster merge that
+follows only sees the survivors.
+
+A lecturer can hold several appointments (an expired adjunct row next to the
+current lecturer row, two part-time appointments in different units).
+``appointments`` resolves them to one row per lecturer for a term: only the
+appointments overlapping the term's meeting dates count, their FTE is
+summed, and the other columns come from the largest of them.
+"""
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+LEO_PREFIX = "leo"  # case-insensitive Job Title prefix for lecturers
+
+
+def to_ids(s: pd.Series) -> np.ndarray:
+    """UM IDs as ``int64``, with ``-1`` for blank or non-numeric values."""
+    return pd.to_numeric(s, errors="coerce").fillna(-1).to_numpy(dtype=np.int64)
+
+
+def lecturer_mask(monthly: pd.DataFrame, prefix: str | None = LEO_PREFIX) -> pd.Series:
+    """Roster rows whose ``Job Title`` starts with ``prefix`` (all rows if None)."""
+    if prefix is None:
+        return pd.Series(True, index=monthly.index)
+    title = monthly["Job Title"].astype("string").str.strip().str.lower()
+    return title.str.startswith(prefix).fillna(False).astype(bool)
+
+
+def lecturer_ids(monthly: pd.DataFrame, prefix: str | None = LEO_PREFIX) -> np.ndarray:
+    """Sorted unique UM IDs of the roster's lecturers."""
+    ids = to_ids(monthly.loc[lecturer_mask(monthly, prefix), "UM ID"])
+    return np.unique(ids[ids >= 0])
+
+
+def id_mask(values: pd.Series, ids: np.ndarray) -> np.ndarray:
+    """Boolean mask of ``values`` that appear in the sorted ``ids`` array."""
+    x = to_ids(values)
+    if len(ids) == 0:
+        return np.zeros(len(x), dtype=bool)
+    pos = np.searchsorted(ids, x).clip(max=len(ids) - 1)
+    return ids[pos] == x
+
+
+def semi_join(df: pd.DataFrame, id_col: str, ids: np.ndarray) -> pd.DataFrame:
+    """Rows of ``df`` whose ``id_col`` is one of ``ids``."""
+    return df[id_mask(df[id_col], ids)].copy()
+
+
+def term_window(schedule: pd.DataFrame) -> tuple[pd.Timestamp, pd.Timestamp] | None:
+    """First and last meeting date of a term frame, or None if it has no dates."""
+    start = schedule["Meeting Start Dt"].astype("datetime64[s]").min()
+    end = schedule["Meeting End Dt"].astype("datetime64[s]").max()
+    return None if pd.isna(start) or pd.isna(end) else (start, end)
+
+
+def _dates(s: pd.Series) -> pd.Series:
+    return pd.to_datetime(s.astype("string"), format="%m/%d/%Y", errors="coerce")
+
+
+def active_mask(roster: pd.DataFrame, window: tuple[pd.Timestamp, pd.Timestamp]) -> np.ndarray:
+    """Appointments whose start / end dates overlap ``window``; a missing date is open-ended."""
+    start, end = _dates(roster["Appointment Start Date"]), _dates(roster["Appointment End Date"])
+    return ((start.isna() | (start <= window[1])) & (end.isna() | (end >= window[0]))).to_numpy()
+
+
+def appointments(roster: pd.DataFrame, ids: np.ndarray,
+                 window: tuple[pd.Timestamp, pd.Timestamp] | None = None) -> pd.DataFrame:
+    """One row per UM ID in ``ids``: summed FTE of the active appointments, the rest from the largest.
+
+    Lecturers with no appointment overlapping ``window`` (a roster older or
+    newer than the term) keep all of theirs rather than disappear.
+    """
+    rows = roster[id_mask(roster["UM ID"], ids)]
+    if window is not None and len(rows):
+        active = pd.Series(active_mask(rows, window), index=rows.index)
+        any_active = active.groupby(rows["UM ID"].to_numpy()).transform("any").to_numpy()
+        rows = rows[active.to_numpy() | ~any_active]
+    rows = rows.sort_values("FTE", ascending=False, kind="stable", na_position="last")
+    grouped = rows.groupby("UM ID", sort=False)["FTE"]
+    people = rows.drop_duplicates("UM ID").set_index("UM ID")
+    people["FTE"] = grouped.sum(min_count=1).reindex(people.index).astype(np.float32)
+    people["Appointments"] = grouped.size().reindex(people.index).astype(np.int16)
+    return people
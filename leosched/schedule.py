@@ -0,0 +1,258 @@
+"""Normalized, compact schedule frames shared by every campus.
+
+The A2, Dearborn and Flint exports spell the same facts differently (``Mon``
+= ``Y`` vs ``Monday Indicator`` = ``M`` vs ``Mon`` = ``X``; ``1:30 PM`` vs
+``1600`` vs ``01:30PM``).  ``normalize`` maps any of them onto the A2 column
+names and stores every column compactly:
+
+* repeated strings (subject, course, instructor, facility, mode, ...) are
+  ``category``;
+* meeting times become ``Start Min`` / ``End Min`` minutes after midnight
+  (``int16``, ``-1`` when missing);
+* the seven day flags are packed into one ``uint8`` ``Days`` bitmask
+  (Monday = bit 0 ... Sunday = bit 6);
+* IDs and class numbers are ``int32`` (``-1`` when missing);
+* ``Meeting Start Dt`` / ``Meeting End Dt`` (Dearborn's term dates) are
+  parsed once into ``datetime64`` values, stored as ``category``.
+
+    python -m leosched.schedule LEOAug24Schedule.csv A2
+
+prints the footprint of a raw export before and after normalization.
+"""
+from __future__ import annotations
+
+import json
+import sys
+
+import numpy as np
+import pandas as pd
+
+from leosched.buildings import A2, DEARBORN, FLINT, NAMESPACES, BuildingRegistry, building_registry
+from leosched.snapshot import REPO_ROOT, load_snapshot
+
+DAY_NAMES = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+DAY_BITS = {day: np.uint8(1 << i) for i, day in enumerate(DAY_NAMES)}
+A2_DAY_COLS = ["Mon", "Tues", "Wed", "Thurs", "Fri", "Sat", "Sun"]
+DEARBORN_DAY_COLS = [f"{day} Indicator" for day in DAY_NAMES]
+
+# Dearborn and Flint spellings of the A2 column names
+ALIASES = {
+    "Term Code": "Term",
+    "Term Desc": "Term Descrshort",
+    "Subject Code": "Subject",
+    "Course Number": "Catalog Nbr",
+    "SEQ Number": "Class Section",
+    "Primary Instructor ID": "Class Instr ID",
+    "Begin Time": "Meeting Time Start",
+    "End Time": "Meeting Time End",
+    "Term Start Date": "Meeting Start Dt",
+    "Term End Date": "Meeting End Dt",
+    "Instructional Mode": "Instruction Mode Descrshort",
+    "Facility Desccr": "Facility Descr",
+    "Meeting EndDt": "Meeting End Dt",
+    # the Flint registrar workbook
+    "TERM": "Term",
+    "TERM_DESCRSHORT": "Term Descrshort",
+    "CRSE_DESCR": "Crse Descr",
+    "SUBJECT": "Subject",
+    "CATALOG_NUMBR": "Catalog Nbr",
+    "CLASS_INST_ID": "Class Instr ID",
+    "CLASS_INSTR_NAME": "Class Instr Name",
+    "CLASS_MTG_NBR": "Class Mtg Nbr",
+    "FACILITY_ID": "Facility ID",
+    "FACILITY_DESC": "Facility Descr",
+    "MEETING_START_DT": "Meeting Start Dt",
+    "MEETING_END_DT": "Meeting End Dt",
+    "MEETING_TIME_START": "Meeting Time Start",
+    "MEETING_TIME_END": "Meeting Time End",
+    "JOBCODE_DESCR": "Jobcode Descr",
+    **dict(zip(["MON", "TUES", "WED", "THURS", "FRI", "SAT", "SUN"], A2_DAY_COLS)),
+}
+
+DATE_COLUMNS = ["Meeting Start Dt", "Meeting End Dt"]
+CATEGORY_COLUMNS = [
+    "Campus", "Term", "Term Descrshort", "Subject", "Catalog Nbr", "Class Section", "Crse Descr",
+    "Class Instr Name", "Class Mtg Nbr", "Facility ID", "Facility Descr",
+    "Instruction Mode Descrshort", "Meeting Start Dt", "Meeting End Dt",
+    "RoomPrediction", "BldgPrediction", "CampusPrediction",
+]
+ID_COLUMNS = ["Class Nbr", "Class Instr ID"]
+SCHEMA = CATEGORY_COLUMNS[:7] + ["Class Nbr", "Class Instr ID"] + CATEGORY_COLUMNS[7:] + [
+    "Start Min", "End Min", "Days",
+]
+
+# ------------------ Parsing ------------------
+
+def _text(s: pd.Series) -> pd.Series:
+    return s.astype("string").str.strip().replace("", pd.NA)
+
+
+def parse_minutes(s: pd.Series) -> np.ndarray:
+    """Minutes after midnight from ``1:30 PM``, ``01:30PM`` or ``1330``; -1 if blank."""
+    uniq = pd.Series(_text(s).str.upper().unique()).dropna()
+    parts = uniq.str.extract(r"^(\d{1,2}):?(\d{2})\s*([AP]M)?$")
+    hour = pd.to_numeric(parts[0], errors="coerce")
+    minute = pd.to_numeric(parts[1], errors="coerce")
+    pm, am = parts[2].eq("PM").fillna(False), parts[2].eq("AM").fillna(False)
+    hour = hour.where(~(pm | am), hour % 12 + np.where(pm, 12, 0))
+    table = dict(zip(uniq, (hour * 60 + minute).fillna(-1).astype(int)))
+    return _text(s).str.upper().map(table).fillna(-1).to_numpy(dtype=np.int16)
+
+
+def parse_dates(s: pd.Series) -> pd.Series:
+    """Dates from ``01/08/2025`` / ``1/6/2025`` strings, parsed once per distinct value."""
+    text = _text(s)
+    uniq = pd.Series(text.unique()).dropna()
+    table = dict(zip(uniq, pd.to_datetime(uniq, format="%m/%d/%Y", errors="coerce")))
+    return text.map(table).astype("datetime64[s]").astype(pd.CategoricalDtype(ordered=True))
+
+
+def format_minutes(minutes) -> pd.Series:
+    """``HH:MM`` strings for display; blank where the time is missing."""
+    m = pd.Series(minutes, dtype="int32")
+    text = (m // 60).astype("string").str.zfill(2) + ":" + (m % 60).astype("string").str.zfill(2)
+    return text.where(m >= 0, "")
+
+
+def pack_days(df: pd.DataFrame, day_cols: list[str]) -> np.ndarray:
+    """``uint8`` bitmask of the meeting days; any flag other than blank/N is set."""
+    days = np.zeros(len(df), dtype=np.uint8)
+    for bit, col in zip(DAY_BITS.values(), day_cols):
+        if col in df.columns:
+            flag = _text(df[col]).str.upper()
+            days |= np.where(flag.notna() & flag.ne("N"), bit, 0).astype(np.uint8)
+    return days
+
+
+def on_day(days, day: str) -> np.ndarray:
+    """Boolean mask of meetings that include ``day`` (e.g. "Monday")."""
+    return (np.asarray(days, dtype=np.uint8) & DAY_BITS[day]) != 0
+
+
+_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+def day_count(days) -> np.ndarray:
+    """Number of meeting days per week in each ``Days`` bitmask (a popcount)."""
+    return _POPCOUNT[np.asarray(days, dtype=np.uint8)]
+
+
+def expand_days(days) -> pd.DataFrame:
+    """A2-style ``Mon``..``Sun`` Y/N columns back from a ``Days`` bitmask."""
+    days = np.asarray(days, dtype=np.uint8)
+    return pd.DataFrame({
+        col: np.where(days & bit, "Y", "N") for col, bit in zip(A2_DAY_COLS, DAY_BITS.values())
+    })
+
+
+def to_display(df: pd.DataFrame) -> pd.DataFrame:
+    """Meetings with ``HH:MM`` times and Mon..Sun Y/N columns, as the term scripts show them."""
+    df = df.reset_index(drop=True)
+    df = df.assign(**{col: df[col].dt.strftime("%m/%d/%Y") for col in DATE_COLUMNS if col in df})
+    return pd.concat([
+        pd.DataFrame({
+            "Meeting Time Start": format_minutes(df["Start Min"]),
+            "Meeting Time End": format_minutes(df["End Min"]),
+        }),
+        df.drop(columns=["Start Min", "End Min", "Days", "Class Instr ID"]),
+        expand_days(df["Days"]),
+    ], axis=1)
+
+# ------------------ Normalization ------------------
+
+def load_registry() -> BuildingRegistry:
+    """The building registry compiled from the JSON in this checkout."""
+    with open(REPO_ROOT / "UMICHbuildings_dict.json") as fh:
+        return building_registry(json.load(fh))
+
+
+def _ids(s: pd.Series | None, n: int) -> np.ndarray:
+    if s is None:
+        return np.full(n, -1, dtype=np.int32)
+    return pd.to_numeric(_text(s), errors="coerce").fillna(-1).to_numpy(dtype=np.int32)
+
+
+def compact(df: pd.DataFrame) -> pd.DataFrame:
+    """Store every string and date column of ``df`` as ``category``."""
+    out = df.copy()
+    for col in out.columns:
+        if out[col].dtype == object or pd.api.types.is_string_dtype(out[col]):
+            out[col] = _text(out[col]).astype("category")
+        elif pd.api.types.is_datetime64_dtype(out[col]):
+            out[col] = out[col].astype(pd.CategoricalDtype(ordered=True))
+    return out
+
+
+def normalize(
+    raw: pd.DataFrame, campus: str, registry: BuildingRegistry | None = None
+) -> pd.DataFrame:
+    """Map one campus export onto the shared compact schema (see module docs)."""
+    if campus not in NAMESPACES:
+        raise ValueError(f"unknown campus {campus!r}; expected one of {NAMESPACES}")
+    registry = registry or load_registry()
+    df = raw.rename(columns=lambda c: ALIASES.get(c.strip().lstrip("﻿"), c.strip().lstrip("﻿")))
+    df = df.reset_index(drop=True)
+    n = len(df)
+
+    if campus == DEARBORN:
+        last = _text(df.get("Primary Instructor Last Name", pd.Series(pd.NA, index=df.index)))
+        first = _text(df.get("Primary Instructor First Name", pd.Series(pd.NA, index=df.index)))
+        df["Class Instr Name"] = (last + "," + first).fillna(last)
+        bldg, room = _text(df["Building Code"]), _text(df["Room Code"])
+        df["Facility ID"] = (bldg + " " + room).fillna(bldg)
+        df["Facility Descr"] = registry.map(bldg, "name", DEARBORN).fillna(bldg)
+        places = pd.DataFrame({"RoomPrediction": room, "BldgPrediction": bldg, "CampusPrediction": DEARBORN})
+        day_cols = DEARBORN_DAY_COLS
+    elif campus == FLINT:
+        facility = _text(df["Facility ID"])
+        places = pd.DataFrame({
+            "RoomPrediction": facility.str.rsplit(" ", n=1).str[0],
+            "BldgPrediction": _text(df["Facility Descr"]).str.rsplit(" ", n=1).str[-1],
+            "CampusPrediction": FLINT,
+        })
+        day_cols = A2_DAY_COLS
+    else:
+        places = registry.split_facility(df["Facility ID"])
+        day_cols = A2_DAY_COLS
+
+    out = pd.DataFrame(index=df.index)
+    out["Campus"] = campus
+    for col in CATEGORY_COLUMNS[1:]:
+        if col in places.columns:
+            out[col] = places[col]
+        elif col in df.columns:
+            out[col] = df[col]
+        else:
+            out[col] = pd.NA
+    for col in DATE_COLUMNS:
+        out[col] = parse_dates(out[col])
+    out["Class Nbr"] = _ids(df.get("Class Nbr"), n)
+    out["Class Instr ID"] = _ids(df.get("Class Instr ID"), n)
+    out["Start Min"] = parse_minutes(df["Meeting Time Start"]) if "Meeting Time Start" in df else np.int16(-1)
+    out["End Min"] = parse_minutes(df["Meeting Time End"]) if "Meeting Time End" in df else np.int16(-1)
+    out["Days"] = pack_days(df, day_cols)
+
+    # keep anything the export adds beyond the shared schema (e.g. Jobcode Descr)
+    consumed = set(SCHEMA) | set(day_cols) | {"Meeting Time Start", "Meeting Time End"}
+    if campus == DEARBORN:
+        consumed |= {"Primary Instructor Last Name", "Primary Instructor First Name", "Room Code", "Building Code"}
+    for col in df.columns:
+        if col not in consumed:
+            out[col] = df[col]
+    return compact(out[SCHEMA + [c for c in out.columns if c not in SCHEMA]])
+
+
+def footprint(df: pd.DataFrame) -> int:
+    """Resident bytes of ``df``, counting string payloads."""
+    return int(df.memory_usage(deep=True).sum())
+
+
+def footprint_report(raw: pd.DataFrame, normalized: pd.DataFrame) -> str:
+    before, after = footprint(raw), footprint(normalized)
+    return f"{before / 2**20:.1f} MB raw -> {after / 2**20:.1f} MB normalized ({before / max(after, 1):.1f}x smaller)"
+
+
+if __name__ == "__main__":
+    path, campus = sys.argv[1], sys.argv[2] if len(sys.argv) > 2 else A2
+    raw_frame = load_snapshot(path)
+    print(f"{path}: {footprint_report(raw_frame, normalize(raw_frame, campus))}")
@@ -0,0 +1,142 @@
+"""Inverted token index over course descriptions and course codes.
+
+``SearchIndex`` tokenizes ``Crse Descr`` and ``Subject`` + ``Catalog Nbr``
+once per distinct category value and keeps, for every token, the sorted
+``int32`` row positions it occurs in.  A query token matches
+
+* exactly,
+* as a prefix of indexed tokens (typeahead: ``counterp`` finds
+  ``counterpoint``), and, when neither finds anything,
+* within one edit of an indexed token (``countrpoint``), through a
+  delete-neighbourhood table built alongside the vocabulary.
+
+Query tokens are AND-ed, and the hits are intersected with the day and campus
+row-position sets from ``facet_positions`` / ``day_positions``, so a search
+never rescans the frame.
+"""
+from __future__ import annotations
+
+import bisect
+import re
+from collections import defaultdict
+
+import numpy as np
+import pandas as pd
+
+from leosched.schedule import DAY_NAMES, on_day
+
+SEARCH_COLUMNS = ["Crse Descr", "Subject", "Catalog Nbr"]
+MIN_TYPO_LENGTH = 4  # shorter tokens are too ambiguous for edit-distance matches
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text) -> list[str]:
+    if not isinstance(text, str):
+        return []
+    return _TOKEN.findall(text.lower())
+
+
+def _deletes(word: str) -> set[str]:
+    return {word[:i] + word[i + 1:] for i in range(len(word))}
+
+
+def group_positions(codes: np.ndarray) -> dict[int, np.ndarray]:
+    """Row positions of every category code, from one stable argsort."""
+    order = np.argsort(codes, kind="stable").astype(np.int32)
+    values, starts = np.unique(codes[order], return_index=True)
+    return {int(v): p for v, p in zip(values, np.split(order, starts[1:])) if v >= 0}
+
+
+def facet_positions(df: pd.DataFrame, col: str) -> dict[str, np.ndarray]:
+    """Sorted row positions of every value of a categorical column."""
+    cat = df[col].astype("category")
+    groups = group_positions(cat.cat.codes.to_numpy())
+    return {cat.cat.categories[code]: pos for code, pos in groups.items()}
+
+
+def day_positions(df: pd.DataFrame) -> dict[str, np.ndarray]:
+    """Sorted row positions of the meetings on each day."""
+    return {day: np.flatnonzero(on_day(df["Days"], day)).astype(np.int32) for day in DAY_NAMES}
+
+
+def intersect(*positions: np.ndarray | None) -> np.ndarray:
+    """Intersection of sorted position arrays; ``None`` means "no filter"."""
+    arrays = sorted((p for p in positions if p is not None), key=len)
+    if not arrays:
+        raise ValueError("intersect needs at least one position array")
+    out = arrays[0]
+    for p in arrays[1:]:
+        out = np.intersect1d(out, p, assume_unique=True)
+    return out
+
+
+class SearchIndex:
+    """Token -> row positions over the ``SEARCH_COLUMNS`` of one frame."""
+
+    def __init__(self, df: pd.DataFrame):
+        postings: dict[str, list[np.ndarray]] = defaultdict(list)
+        course = (df["Subject"].astype("string").fillna("") + " "
+                  + df["Catalog Nbr"].astype("string").fillna(""))
+        for series in (df["Crse Descr"], course):
+            cat = series.astype("category")
+            for code, pos in group_positions(cat.cat.codes.to_numpy()).items():
+                text = cat.cat.categories[code]
+                tokens = set(tokenize(text))
+                if series is course:
+                    tokens.add("".join(tokenize(text)))  # "eecs280" as well as "eecs" "280"
+                for token in tokens:
+                    postings[token].append(pos)
+        self.postings = {t: np.unique(np.concatenate(p)) for t, p in postings.items()}
+        self.vocab = sorted(self.postings)
+        self._neighbours: dict[str, set[str]] = defaultdict(set)
+        for token in self.vocab:
+            if len(token) >= MIN_TYPO_LENGTH:
+                for d in _deletes(token):
+                    self._neighbours[d].add(token)
+        self.nrows = len(df)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(p.nbytes for p in self.postings.values())
+
+    def prefixed(self, prefix: str) -> list[str]:
+        """Indexed tokens starting with ``prefix``."""
+        lo = bisect.bisect_left(self.vocab, prefix)
+        hi = bisect.bisect_left(self.vocab, prefix + "￿")
+        return self.vocab[lo:hi]
+
+    def near(self, token: str) -> set[str]:
+        """Indexed tokens within one insertion, deletion or substitution of ``token``."""
+        if len(token) < MIN_TYPO_LENGTH:
+            return set()
+        found = set(self._neighbours.get(token, ()))  # one letter missing from the query
+        for d in _deletes(token):
+            if d in self.postings:  # one letter too many
+                found.add(d)
+            found |= self._neighbours.get(d, set())  # one letter wrong
+        return found
+
+    def expand(self, token: str) -> list[str]:
+        matches = self.prefixed(token)
+        return matches or sorted(self.near(token))
+
+    def search(self, query: str) -> np.ndarray:
+        """Sorted row positions matching every token of ``query``."""
+        hits = []
+        for token in tokenize(query):
+            matches = self.expand(token)
+            if not matches:
+                return np.empty(0, dtype=np.int32)
+            hits.append(np.unique(np.concatenate([self.postings[t] for t in matches])))
+        if not hits:
+            return np.arange(self.nrows, dtype=np.int32)
+        return intersect(*hits)
+
+    def suggest(self, query: str, limit: int = 8) -> list[str]:
+        """Completions of the last query token, most frequent first."""
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+        matches = self.expand(tokens[-1])
+        return sorted(matches, key=lambda t: -len(self.postings[t]))[:limit]
@@ -0,0 +1,173 @@
+"""Cached snapshots of the raw schedule and roster exports.
+
+Every source file (CSV or XLSX) is parsed once into a Parquet snapshot under
+``.snapshots/``.  A JSON manifest next to each snapshot records the source's
+mtime, size and SHA-256, so a later load either reuses the snapshot straight
+away (same mtime) or after a hash check (touched but unchanged file).
+
+Columns are kept as strings, the same as ``pd.read_csv(..., dtype=str)``, so
+a workbook snapshot is a drop-in replacement for the hand-converted CSV.
+
+    python -m leosched.snapshot SS25/*.xlsx
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sys
+from datetime import date, datetime, time
+from pathlib import Path
+
+import pandas as pd
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SNAPSHOT_DIR = Path(os.environ.get("LEOSCHED_SNAPSHOT_DIR", REPO_ROOT / ".snapshots"))
+SPREADSHEET_SUFFIXES = {".xlsx", ".xlsm"}
+# hive partition column of the columnar term snapshots; not "term", which DuckDB
+# would match against (and let shadow) the exports' own "Term" column
+PARTITION_KEY = "term_key"
+
+# ------------------ Helpers ------------------
+
+def file_digest(path: str | Path, chunk_size: int = 1 << 20) -> str:
+    """SHA-256 of a file, read in 1 MiB chunks."""
+    h = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(chunk_size), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _format_time(t: time) -> str:
+    hour = t.hour % 12 or 12
+    return f"{hour}:{t.minute:02d} {'AM' if t.hour < 12 else 'PM'}"
+
+
+def _cell_to_str(value) -> str | None:
+    """Render a workbook cell the way the registrar's CSV exports spell it."""
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        # Excel stores a bare time of day as a datetime on its epoch day
+        if value.year <= 1900:
+            return _format_time(value.time())
+        return value.strftime("%m/%d/%Y")
+    if isinstance(value, date):
+        return value.strftime("%m/%d/%Y")
+    if isinstance(value, time):
+        return _format_time(value)
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def read_workbook(path: str | Path, sheet: str | None = None) -> pd.DataFrame:
+    """Stream one worksheet into a string-typed DataFrame.
+
+    The workbook is opened read-only, so rows are parsed as they are iterated
+    instead of loading the whole sheet tree.  Title rows above the header
+    (the Dearborn union report has two) are skipped: the header is the first
+    row with more than one non-blank cell.
+    """
+    try:
+        from openpyxl import load_workbook
+    except ImportError as exc:  # pragma: no cover - optional dependency
+        raise ImportError("Reading .xlsx sources needs openpyxl: pip install openpyxl") from exc
+
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        ws = wb[sheet] if sheet else wb.worksheets[0]
+        # some exports under-report their used range, which truncates iter_rows
+        ws.reset_dimensions()
+        rows = ws.iter_rows(values_only=True)
+        header = None
+        for row in rows:
+            if sum(c is not None and str(c).strip() != "" for c in row) > 1:
+                header = [str(c).strip() if c is not None else f"Unnamed: {i}" for i, c in enumerate(row)]
+                break
+        if header is None:
+            return pd.DataFrame()
+        width = len(header)
+        records = []
+        for row in rows:
+            if all(c is None for c in row):
+                continue
+            cells = [_cell_to_str(c) for c in row[:width]]
+            cells.extend([None] * (width - len(cells)))
+            records.append(cells)
+    finally:
+        wb.close()
+    return pd.DataFrame(records, columns=header, dtype=object)
+
+
+def read_source(path: str | Path, sheet: str | None = None) -> pd.DataFrame:
+    """Parse a CSV or workbook export with every column as a string."""
+    path = Path(path)
+    if path.suffix.lower() in SPREADSHEET_SUFFIXES:
+        return read_workbook(path, sheet)
+    return pd.read_csv(path, dtype=str, encoding="utf-8-sig")
+
+
+def snapshot_path(path: str | Path, sheet: str | None = None) -> Path:
+    """Location of the Parquet snapshot for ``path`` (and ``sheet``)."""
+    path = Path(path).resolve()
+    key = hashlib.sha1(f"{path}|{sheet or ''}".encode()).hexdigest()[:10]
+    return SNAPSHOT_DIR / f"{path.stem.strip().replace(' ', '_')}-{key}.parquet"
+
+
+def _read_manifest(path: Path) -> dict | None:
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def _write_atomic(path: Path, write) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    write(tmp)
+    os.replace(tmp, path)
+
+# ------------------ Public API ------------------
+
+def load_snapshot(path: str | Path, sheet: str | None = None) -> pd.DataFrame:
+    """Return the source at ``path`` as a DataFrame, parsing it at most once.
+
+    A snapshot is reused when the source's mtime and size match the manifest,
+    or when they don't but its SHA-256 still does (e.g. after a fresh git
+    checkout).  Otherwise the source is re-parsed and the snapshot replaced.
+    """
+    src = Path(path)
+    snap = snapshot_path(src, sheet)
+    manifest_path = snap.with_suffix(".json")
+    stat = src.stat()
+    meta = _read_manifest(manifest_path) if snap.exists() else None
+
+    if meta and meta.get("mtime_ns") == stat.st_mtime_ns and meta.get("size") == stat.st_size:
+        return pd.read_parquet(snap)
+
+    digest = file_digest(src)
+    if meta and meta.get("sha256") == digest:
+        meta.update(mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+        _write_atomic(manifest_path, lambda p: p.write_text(json.dumps(meta)))
+        return pd.read_parquet(snap)
+
+    df = read_source(src, sheet)
+    SNAPSHOT_DIR.mkdir(parents=True, exist_ok=True)
+    _write_atomic(snap, lambda p: df.to_parquet(p, index=False))
+    meta = {
+        "source": str(src.resolve()),
+        "sheet": sheet,
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "sha256": digest,
+        "rows": len(df),
+    }
+    _write_atomic(manifest_path, lambda p: p.write_text(json.dumps(meta)))
+    return df
+
+
+if __name__ == "__main__":
+    for arg in sys.argv[1:]:
+        frame = load_snapshot(arg)
+        print(f"{arg}: {len(frame)} rows x {frame.shape[1]} cols -> {snapshot_path(arg)}")
@@ -0,0 +1,190 @@
+"""Ad-hoc SQL over columnar term snapshots (optional DuckDB).
+
+``ensure_snapshots`` writes every term's normalized schedule and slimmed
+roster as Hive-partitioned Parquet under ``.snapshots/terms/``::
+
+    schedule/term_key=W25/part.parquet
+    roster/term_key=W25/part.parquet
+    buildings.parquet
+
+and rewrites a term only when one of its source files is newer than its
+manifest (or ``FORMAT`` has moved on).  ``connect`` opens an in-memory DuckDB database with ``schedule``,
+``roster`` and ``buildings`` views over those files, so a query reads only
+the columns it names, prunes ``term_key`` partitions from its WHERE clause
+and pushes the other predicates into the Parquet row-group scan; nothing is
+loaded into pandas first.  The partition column is ``term_key`` (FA24, W25,
+...) because DuckDB matches names case-insensitively and a ``term`` key
+would shadow the registrar's own ``Term`` code.
+
+    python -m leosched.sql "SELECT term_key, Campus, count(*) FROM schedule GROUP BY ALL"
+
+DuckDB is optional: ``pip install duckdb``.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from leosched.schedule import load_registry
+from leosched.snapshot import PARTITION_KEY, SNAPSHOT_DIR
+from leosched.stream import HISTORY_DIR
+from leosched.ingest import load_terms
+from leosched.terms import TERMS, Term
+
+TERM_DIR = SNAPSHOT_DIR / "terms"
+TABLES = ("schedule", "roster")
+FORMAT = 2  # bump when normalize changes what a snapshot holds, to rewrite every term
+
+EXAMPLE = """-- LEO-taught meeting-days per campus and term
+SELECT s.term_key, s.CampusPrediction AS campus, count(*) AS meetings
+FROM schedule s JOIN roster r ON r."UM ID" = s."Class Instr ID" AND r.term_key = s.term_key
+WHERE r."Job Title" ILIKE 'LEO%'
+GROUP BY ALL
+ORDER BY meetings DESC"""
+
+
+def _duckdb():
+    try:
+        import duckdb
+    except ImportError as exc:
+        raise ImportError("The SQL mode needs DuckDB: pip install duckdb") from exc
+    return duckdb
+
+
+def _stamp(term: Term) -> list:
+    return [FORMAT, max(os.stat(p).st_mtime for p in [*term.sources.values(), term.monthly])]
+
+
+def _partition(table: str, term: Term) -> Path:
+    return TERM_DIR / table / f"{PARTITION_KEY}={term.key}" / "part.parquet"
+
+
+def _write_parquet(df: pd.DataFrame, path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    # categories are written as Parquet dictionary pages; small row groups let DuckDB skip by min/max
+    df.to_parquet(tmp, index=False, row_group_size=2048)
+    os.replace(tmp, path)
+
+
+def ensure_snapshots(terms: dict[str, Term] = TERMS) -> list[str]:
+    """Write (or refresh) the Parquet snapshots of ``terms``; returns the keys rewritten."""
+    manifest_path = TERM_DIR / "manifest.json"
+    try:
+        manifest = json.loads(manifest_path.read_text())
+    except (OSError, ValueError):
+        manifest = {}
+
+    stale = [term for key, term in terms.items()
+             if manifest.get(key) != _stamp(term)
+             or not all(_partition(t, term).exists() for t in TABLES)]
+    written = []
+    for key, loaded in load_terms(stale).items() if stale else ():
+        term = loaded.term
+        _write_parquet(loaded.schedule, _partition("schedule", term))
+        _write_parquet(loaded.roster, _partition("roster", term))
+        manifest[key] = _stamp(term)
+        written.append(key)
+
+    buildings = TERM_DIR / "buildings.parquet"
+    if written or not buildings.exists():
+        registry = load_registry()
+        _write_parquet(pd.DataFrame(
+            [(ns, *b) for ns, table in registry.namespaces.items() for b in table.values()],
+            columns=["namespace", "code", "name", "campus", "campus_id"],
+        ), buildings)
+    if written or not manifest_path.exists():
+        TERM_DIR.mkdir(parents=True, exist_ok=True)
+        manifest_path.write_text(json.dumps(manifest, indent=1))
+    return written
+
+
+def snapshot_version() -> tuple:
+    """Changes whenever ``ensure_snapshots`` or ``leosched.stream`` rewrites snapshots."""
+    paths = [TERM_DIR / "manifest.json", *sorted(HISTORY_DIR.glob("*.json"))]
+    return tuple((p.name, p.stat().st_mtime_ns) for p in paths if p.exists())
+
+
+def connect(refresh: bool = True, read_only: bool = False):
+    """In-memory DuckDB connection with ``schedule``, ``roster`` and ``buildings`` views.
+
+    A ``history`` view over the streamed exports (``leosched.stream``) is added when there are any.
+    ``read_only`` locks the connection down for untrusted SQL: no file access outside the
+    snapshot directories and no changing that back (run queries through ``select``).
+    """
+    duckdb = _duckdb()
+    if refresh:
+        ensure_snapshots()
+    con = duckdb.connect()
+    for table in TABLES:
+        glob = (TERM_DIR / table / f"{PARTITION_KEY}=*" / "*.parquet").as_posix()
+        con.execute(
+            f"CREATE VIEW {table} AS SELECT * FROM read_parquet('{glob}', hive_partitioning = true, union_by_name = true)"
+        )
+    con.execute(f"CREATE VIEW buildings AS SELECT * FROM read_parquet('{(TERM_DIR / 'buildings.parquet').as_posix()}')")
+    if any(HISTORY_DIR.glob(f"*/{PARTITION_KEY}=*/*.parquet")):
+        # exports streamed in by ``leosched.stream``, possibly with different extra columns
+        glob = (HISTORY_DIR / "*" / f"{PARTITION_KEY}=*" / "*.parquet").as_posix()
+        con.execute(f"CREATE VIEW history AS SELECT * FROM read_parquet('{glob}', hive_partitioning = true, "
+                    f"hive_types = {{'{PARTITION_KEY}': VARCHAR}}, union_by_name = true)")
+    if read_only:
+        allowed = ", ".join(f"'{d.resolve().as_posix()}/'" for d in (TERM_DIR, HISTORY_DIR))
+        con.execute(f"SET allowed_directories = [{allowed}]")
+        con.execute("SET enable_external_access = false")
+        con.execute("SET lock_configuration = true")
+    return con
+
+
+def query(sql: str, con=None) -> pd.DataFrame:
+    con = con or connect()
+    return con.execute(sql).df()
+
+
+def select(con, sql: str) -> pd.DataFrame:
+    """Run ``sql`` on a cursor of ``con`` if it is nothing but SELECT statements.
+
+    Anything else (COPY, CREATE, DROP, ATTACH, SET, EXPLAIN ANALYZE, ...) raises
+    ``ValueError`` before it runs, so a shared ``read_only`` connection keeps
+    its views and writes no files.
+    """
+    duckdb = _duckdb()
+    statements = con.extract_statements(sql)
+    if not statements:
+        raise ValueError("no SQL statement to run")
+    for statement in statements:
+        if statement.type != duckdb.StatementType.SELECT:
+            raise ValueError(f"only SELECT queries can be run here, not {statement.type.name}")
+    return con.cursor().execute(sql).df()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m leosched.sql", description=__doc__.splitlines()[0])
+    parser.add_argument("sql", nargs="?", default=EXAMPLE, help="query to run (default: an example)")
+    parser.add_argument("--explain", action="store_true", help="print the query plan instead")
+    parser.add_argument("--csv", action="store_true", help="write the result as CSV to stdout")
+    args = parser.parse_args(argv)
+
+    con = connect()
+    t0 = time.perf_counter()
+    if args.explain:
+        for _, plan in con.execute(f"EXPLAIN {args.sql}").fetchall():
+            print(plan)
+        return 0
+    result = con.execute(args.sql).df()
+    if args.csv:
+        result.to_csv(sys.stdout, index=False)
+    else:
+        with pd.option_context("display.max_rows", 200, "display.width", 200):
+            print(result)
+    print(f"{len(result)} rows in {time.perf_counter() - t0:.3f}s", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
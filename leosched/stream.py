@@ -0,0 +1,149 @@
+"""Streaming ingest of large (multi-year) schedule exports.
+
+``stream_source`` reads a CSV export ``chunksize`` rows at a time, runs each
+chunk through ``schedule.normalize`` (time / day / date parsing and the
+building lookup), drops the rows without meeting days as ``load_term`` does,
+and appends the rest to one Parquet file per ``Term`` value:
+
+    .snapshots/history/<stem>-<campus>/term_key=2410/part.parquet
+
+(the partition column is ``term_key``, as in ``leosched.sql``, so it never
+shadows the file's own ``Term`` column in case-insensitive DuckDB).
+
+Every chunk becomes a row group of the partitions it touches, so at most
+one chunk is ever in memory, whatever the size of the input.  The
+partitions are written to a temporary directory and swapped in at the end,
+and a manifest next to it (``<stem>-<campus>.json``) with the source's
+SHA-256 lets an unchanged export be skipped.  Flint IDs, which need the
+roster linkage, are left at -1.
+
+    python -m leosched.stream registrar_2019_2025.csv --campus A2
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import shutil
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from leosched.buildings import NAMESPACES
+from leosched.schedule import CATEGORY_COLUMNS, DATE_COLUMNS, compact, load_registry, normalize
+from leosched.snapshot import PARTITION_KEY, SNAPSHOT_DIR, file_digest
+
+HISTORY_DIR = SNAPSHOT_DIR / "history"
+CHUNK_ROWS = 50_000
+
+_TYPES = {
+    **{col: pa.string() for col in CATEGORY_COLUMNS},
+    **{col: pa.timestamp("s") for col in DATE_COLUMNS},
+    "Class Nbr": pa.int32(),
+    "Class Instr ID": pa.int32(),
+    "Start Min": pa.int16(),
+    "End Min": pa.int16(),
+    "Days": pa.uint8(),
+}
+
+
+def _schema(columns) -> pa.Schema:
+    """One fixed Arrow schema for every chunk; columns beyond the shared ones are strings."""
+    return pa.schema([(col, _TYPES.get(col, pa.string())) for col in columns])
+
+
+def _partition(value) -> str:
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", str(value)) if pd.notna(value) else "unknown"
+
+
+def history_path(path: str | Path, campus: str) -> Path:
+    return HISTORY_DIR / f"{Path(path).stem.strip().replace(' ', '_')}-{campus}"
+
+
+def stream_source(path: str | Path, campus: str, outdir: str | Path | None = None,
+                  chunksize: int = CHUNK_ROWS, force: bool = False) -> dict:
+    """Normalize the CSV at ``path`` chunk by chunk into term partitions; returns the manifest."""
+    if campus not in NAMESPACES:
+        raise ValueError(f"unknown campus {campus!r}; expected one of {NAMESPACES}")
+    src = Path(path)
+    outdir = Path(outdir) if outdir else history_path(src, campus)
+    manifest_path = outdir.with_name(outdir.name + ".json")
+    digest = file_digest(src)
+    if not force and manifest_path.exists():
+        meta = json.loads(manifest_path.read_text())
+        if meta.get("sha256") == digest:
+            return meta
+
+    registry = load_registry()
+    tmp = outdir.with_name(outdir.name + ".tmp")
+    shutil.rmtree(tmp, ignore_errors=True)
+    writers: dict[str, pq.ParquetWriter] = {}
+    schema = None
+    rows = kept = chunks = 0
+    per_term: dict[str, int] = {}
+    try:
+        for chunk in pd.read_csv(src, dtype=str, encoding="utf-8-sig", chunksize=chunksize):
+            df = normalize(chunk, campus, registry)
+            rows += len(df)
+            chunks += 1
+            df = df[df["Days"].to_numpy() != 0]  # never shown in a day view
+            kept += len(df)
+            if schema is None:
+                schema = _schema(df.columns)
+            table = pa.Table.from_pandas(df, preserve_index=False).select(schema.names).cast(schema)
+            for term, idx in df.groupby(df["Term"].astype("string").map(_partition),
+                                        sort=False).indices.items():
+                if term not in writers:
+                    part = tmp / f"{PARTITION_KEY}={term}"
+                    part.mkdir(parents=True, exist_ok=True)
+                    writers[term] = pq.ParquetWriter(part / "part.parquet", schema)
+                writers[term].write_table(table.take(idx))
+                per_term[term] = per_term.get(term, 0) + len(idx)
+    finally:
+        for writer in writers.values():
+            writer.close()
+
+    meta = {
+        "source": str(src.resolve()), "campus": campus, "sha256": digest, "chunksize": chunksize,
+        "chunks": chunks, "rows": rows, "kept": kept, "pruned": rows - kept, "terms": per_term,
+    }
+    tmp.mkdir(parents=True, exist_ok=True)
+    shutil.rmtree(outdir, ignore_errors=True)
+    tmp.rename(outdir)
+    manifest_path.write_text(json.dumps(meta, indent=1))
+    return meta
+
+
+def read_history(outdir: str | Path, terms: list[str] | None = None,
+                 columns: list[str] | None = None) -> pd.DataFrame:
+    """Selected terms (and columns) of a streamed export, back in the compact schema."""
+    filters = [(PARTITION_KEY, "in", [_partition(t) for t in terms])] if terms else None
+    partitioning = ds.partitioning(pa.schema([(PARTITION_KEY, pa.string())]), flavor="hive")
+    return compact(pd.read_parquet(outdir, columns=columns, filters=filters, partitioning=partitioning))
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m leosched.stream", description=__doc__.splitlines()[0])
+    parser.add_argument("path", help="CSV schedule export")
+    parser.add_argument("--campus", choices=NAMESPACES, required=True)
+    parser.add_argument("-o", "--outdir", help=f"partition directory (default: under {HISTORY_DIR})")
+    parser.add_argument("--chunksize", type=int, default=CHUNK_ROWS, help="rows per chunk")
+    parser.add_argument("--force", action="store_true", help="rewrite even if the source is unchanged")
+    args = parser.parse_args(argv)
+
+    t0 = time.perf_counter()
+    meta = stream_source(args.path, args.campus, args.outdir, args.chunksize, args.force)
+    print(f"{meta['rows']} rows in {meta['chunks']} chunks, {meta['pruned']} pruned, "
+          f"{len(meta['terms'])} terms in {time.perf_counter() - t0:.2f}s", file=sys.stderr)
+    for term, n in sorted(meta["terms"].items()):
+        print(f"{PARTITION_KEY}={term}: {n}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,312 @@
+"""Term catalog and a memory-budgeted LRU cache of loaded terms.
+
+Each ``Term`` names the per-campus schedule exports and the monthly roster it
+is built from.  ``load_term`` turns them into one normalized schedule frame
+(see ``leosched.schedule``) plus a slimmed roster.  ``TermCache`` loads a term
+on first use and evicts the least recently used ones once the resident size
+exceeds its budget, so one process can serve every term without holding all
+of them at once.
+"""
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+from leosched.buildings import A2, DEARBORN, FLINT
+from leosched.linkage import full_names, link_names
+from leosched.roster import appointments, id_mask, lecturer_ids, term_window, to_ids
+from leosched.schedule import compact, footprint, load_registry, normalize
+from leosched.snapshot import REPO_ROOT, load_snapshot
+
+DEFAULT_BUDGET = int(os.environ.get("LEOSCHED_TERM_BUDGET_MB", "256")) * 2**20
+# "all" or comma-separated term keys to load in parallel at start-up
+PRELOAD = os.environ.get("LEOSCHED_PRELOAD", "")
+
+# roster columns the viewers display or join on; the rest (home addresses etc.) stay on disk
+ROSTER_COLUMNS = [
+    "UM ID", "Employee Last Name", "Employee First Name", "Job Title", "Appointment Start Date",
+    "Appointment End Date", "FTE", "Deduction", "Department Name", "School/College/Division",
+    "Uniqname", "UM Email",
+]
+
+
+@dataclass(frozen=True)
+class Term:
+    key: str
+    label: str
+    sources: dict[str, Path]
+    monthly: Path
+
+
+TERMS = {
+    t.key: t for t in [
+        Term("FA24", "Fall 2024", {
+            A2: REPO_ROOT / "LEOAug24Schedule.csv",
+            FLINT: REPO_ROOT / "Flint_Winter_2025_082924.xlsx",  # holds the Fall 2024 Flint term
+        }, REPO_ROOT / "LEO_Oct24Monthly.csv"),
+        Term("W25", "Winter 2025", {
+            A2: REPO_ROOT / "W25" / "A2SchedW25.csv",
+            DEARBORN: REPO_ROOT / "W25" / "DearbornScheduleW25.csv",
+            FLINT: REPO_ROOT / "W25" / "FlintScheduleW25.csv",
+        }, REPO_ROOT / "W25" / "LEOmonthly_Jan25.csv"),
+        Term("SS25", "Spring/Summer 2025", {
+            A2: REPO_ROOT / "SS25" / "LEO_schedule_of_classes_105_4421647497674918032.xlsx",
+            DEARBORN: REPO_ROOT / "SS25" / "Dearborn_S25.csv",
+            FLINT: REPO_ROOT / "SS25" / "Flint_S25.csv",
+        }, REPO_ROOT / "W25" / "LEOmonthly_Jan25.csv"),
+        Term("SU25", "Summer II 2025", {
+            A2: REPO_ROOT / "Summer25" / "AASchedSum25.csv",
+            DEARBORN: REPO_ROOT / "Summer25" / "DBSchedSum25.csv",
+        }, REPO_ROOT / "Summer25" / "MonthlyJuly25.csv"),
+    ]
+}
+
+
+@dataclass
+class LoadedTerm:
+    term: Term
+    schedule: pd.DataFrame
+    roster: pd.DataFrame
+    lecturer_ids: np.ndarray
+    raw_bytes: int
+    pruned: int = 0
+    roster_mtime: float = 0.0
+    extras: dict = field(default_factory=dict)  # per-term indexes built on demand
+    # called after an extra is built or the roster reloaded, so the owning cache can re-check its budget
+    on_grow: Callable[[], None] | None = field(default=None, repr=False)
+    # serializes building extras and roster refreshes of this term; readers of a built extra never wait
+    _lock: threading.RLock = field(default_factory=threading.RLock, repr=False, compare=False)
+
+    @property
+    def nbytes(self) -> int:
+        extras = sum(footprint(v) if isinstance(v, pd.DataFrame) else getattr(v, "nbytes", 0)
+                     for v in self.extras.values())
+        return footprint(self.schedule) + footprint(self.roster) + extras
+
+    def cached(self, key, build: Callable[[], object]):
+        """``build()`` once per term; the result counts towards the cache budget."""
+        value = self.extras.get(key)
+        if value is not None:
+            return value
+        with self._lock:
+            value = self.extras.get(key)
+            if value is not None:
+                return value
+            value = build()
+            # a new dict rather than an insert, so ``nbytes`` can iterate the old one meanwhile
+            self.extras = {**self.extras, key: value}
+        if self.on_grow is not None:
+            self.on_grow()
+        return value
+
+    def refresh_roster(self) -> bool:
+        """Re-read the monthly roster if its file changed since it was loaded.
+
+        Extras that know how to follow a roster change (``update_roster``)
+        are updated in place; the others are dropped and rebuilt on demand.
+        """
+        mtime = os.stat(self.term.monthly).st_mtime
+        if mtime == self.roster_mtime:
+            return False
+        with self._lock:
+            if mtime == self.roster_mtime:  # another session got here first
+                return False
+            roster = load_roster(self.term.monthly)
+            ids = lecturer_ids(roster)
+            kept = {k: v for k, v in self.extras.items() if hasattr(v, "update_roster")}
+            for extra in kept.values():
+                extra.update_roster(roster, ids)
+            self.roster, self.lecturer_ids, self.extras = roster, ids, kept
+            self.roster_mtime = mtime
+        if self.on_grow is not None:
+            self.on_grow()
+        return True
+
+    def lecturers(self) -> pd.DataFrame:
+        """LEO lecturer meetings with their roster columns, built once per term.
+
+        The roster columns come from each lecturer's largest appointment active
+        during the term, with FTE summed over the active ones.
+        """
+        def build():
+            sched = self.schedule[id_mask(self.schedule["Class Instr ID"], self.lecturer_ids)]
+            roster = appointments(self.roster, self.lecturer_ids, term_window(self.schedule)).drop(
+                columns=["Employee Last Name", "Employee First Name", "Appointments"]).reset_index()
+            return sched.merge(roster, left_on="Class Instr ID", right_on="UM ID", how="inner")
+        return self.cached("lecturers", build)
+
+# ------------------ Loading ------------------
+
+def load_roster(path: Path) -> pd.DataFrame:
+    raw = load_snapshot(path)
+    roster = compact(raw[[c for c in ROSTER_COLUMNS if c in raw.columns]])
+    roster["UM ID"] = to_ids(raw["UM ID"]).astype(np.int32)
+    roster["FTE"] = pd.to_numeric(raw["FTE"], errors="coerce").astype(np.float32)
+    return roster
+
+
+def _link_flint_ids(schedule: pd.DataFrame, roster: pd.DataFrame) -> np.ndarray:
+    """UM IDs for Flint meetings by name, for exports that carry no ID."""
+    flint = roster[roster["Department Name"].astype("string").str.startswith("Flint", na=False)]
+    names = schedule["Class Instr Name"].astype("string")
+    links = link_names(names, full_names(flint, "Employee Last Name", "Employee First Name"))
+    ids = links["match"].map(flint["UM ID"])
+    return names.map(ids).fillna(-1).to_numpy(dtype=np.int32)
+
+
+def assemble(term: Term, frames: dict[str, pd.DataFrame], roster: pd.DataFrame,
+             raw_bytes: int = 0) -> LoadedTerm:
+    """Combine a term's normalized campus frames (in ``term.sources`` order) and roster."""
+    parts = []
+    for campus in term.sources:
+        df = frames[campus]
+        if campus == FLINT and (df["Class Instr ID"] < 0).all():
+            df["Class Instr ID"] = _link_flint_ids(df, roster)
+        parts.append(df)
+    schedule = compact(pd.concat(parts, ignore_index=True))
+    # rows without meeting days never show in a day view (placeholders, async sections)
+    meets = schedule["Days"].to_numpy() != 0
+    return LoadedTerm(
+        term=term,
+        schedule=schedule[meets].reset_index(drop=True),
+        roster=roster,
+        lecturer_ids=lecturer_ids(roster),
+        raw_bytes=raw_bytes,
+        pruned=int((~meets).sum()),
+        roster_mtime=os.stat(term.monthly).st_mtime,
+    )
+
+
+def load_term(term: Term) -> LoadedTerm:
+    """Load, normalize and combine every campus export of ``term``."""
+    registry = load_registry()
+    frames, raw_bytes = {}, 0
+    for campus, path in term.sources.items():
+        raw = load_snapshot(path)
+        raw_bytes += footprint(raw)
+        frames[campus] = normalize(raw, campus, registry)
+    return assemble(term, frames, load_roster(term.monthly), raw_bytes)
+
+# ------------------ Cache ------------------
+
+class TermCache:
+    """Lazily loaded terms, least recently used evicted beyond ``budget`` bytes.
+
+    The term just requested is never evicted, even if it alone exceeds the
+    budget.  Terms are loaded outside the lock, so a cold term never holds up
+    cache hits on other terms; sessions asking for a term that is already
+    being loaded wait on that load's future instead of starting another.
+    Roster refreshes and extras are built under each term's own lock, and
+    the budget is re-checked whenever a cached term grows.
+    """
+
+    def __init__(self, budget: int = DEFAULT_BUDGET,
+                 loader: Callable[[Term], LoadedTerm] = load_term,
+                 terms: dict[str, Term] = TERMS):
+        self.budget = budget
+        self.loader = loader
+        self.terms = terms
+        self._loaded: OrderedDict[str, LoadedTerm] = OrderedDict()
+        self._pending: dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = 0
+
+    def _add(self, key: str, loaded: LoadedTerm) -> None:
+        """Insert a loaded term (lock held) and evict down to the budget."""
+        self._loaded[key] = loaded
+        loaded.on_grow = self._trim
+        self._evict()
+
+    def _evict(self) -> None:
+        while self.nbytes > self.budget and len(self._loaded) > 1:
+            self._loaded.popitem(last=False)[1].on_grow = None
+            self.evictions += 1
+
+    def _trim(self) -> None:
+        """Evict down to the budget after a cached term grew (new extras, new roster)."""
+        with self._lock:
+            self._evict()
+
+    def _settle(self, loads: dict[str, Future], results: dict[str, LoadedTerm] | None,
+                exc: BaseException | None = None) -> None:
+        with self._lock:
+            for key in loads:
+                del self._pending[key]
+                if results is not None:
+                    self._add(key, results[key])
+        for key, future in loads.items():
+            if results is not None:
+                future.set_result(results[key])
+            else:
+                future.set_exception(exc)
+
+    def get(self, key: str) -> LoadedTerm:
+        with self._lock:
+            loaded = self._loaded.get(key)
+            if loaded is not None:
+                self._loaded.move_to_end(key)
+                self.hits += 1
+            else:
+                future = self._pending.get(key)
+                owner = future is None
+                if owner:
+                    self.misses += 1
+                    future = self._pending[key] = Future()
+        if loaded is not None:
+            # a changed roster is re-read under the term's own lock, not the cache's
+            loaded.refresh_roster()
+            return loaded
+        if not owner:
+            return future.result()
+        try:
+            loaded = self.loader(self.terms[key])
+        except BaseException as exc:
+            self._settle({key: future}, None, exc)
+            raise
+        self._settle({key: future}, {key: loaded})
+        return loaded
+
+    def preload(self, keys: list[str] | None = None, workers: int | None = None) -> list[str]:
+        """Load the terms not yet cached in parallel (``ingest.load_terms``); returns the keys loaded.
+
+        Terms are added in the given order, so the budget evicts the first ones
+        if they do not all fit.  Terms another caller is already loading are
+        left to that load.
+        """
+        from leosched.ingest import load_terms
+
+        with self._lock:
+            todo = [self.terms[k] for k in (keys or list(self.terms))
+                    if k not in self._loaded and k not in self._pending]
+            loads = {t.key: self._pending.setdefault(t.key, Future()) for t in todo}
+        if not todo:
+            return []
+        try:
+            results = load_terms(todo, workers)
+        except BaseException as exc:
+            self._settle(loads, None, exc)
+            raise
+        self._settle(loads, results)
+        return list(loads)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(t.nbytes for t in self._loaded.values())
+
+    def stats(self) -> dict:
+        return {
+            "loaded": list(self._loaded),
+            "size_mb": round(self.nbytes / 2**20, 1),
+            "budget_mb": round(self.budget / 2**20, 1),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
@@ -0,0 +1,89 @@
+"""Time-of-day range queries over per-day sorted start / end minutes.
+
+For every day ``TimeIndex`` keeps the rows meeting that day sorted by
+``Start Min`` and, separately, by ``End Min``: the sorted minutes plus the
+permutation back to row positions.  "Starting between 16:00 and 18:00",
+"ending by noon", "in session at 10:30" and "overlapping 13:00-15:00" are
+one or two ``np.searchsorted`` calls on those arrays (the overlap queries
+intersect a start range with an end range); the answers are sorted
+``int32`` row positions, ready for ``search.intersect`` with the campus,
+building and search postings.  Rows without a time are not indexed.
+"""
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from leosched.schedule import DAY_BITS
+
+
+class _Day:
+    __slots__ = ("starts", "by_start", "ends", "by_end")
+
+    def __init__(self, rows: np.ndarray, start: np.ndarray, end: np.ndarray):
+        order = np.argsort(start[rows], kind="stable")
+        self.by_start = rows[order]
+        self.starts = start[self.by_start]
+        order = np.argsort(end[rows], kind="stable")
+        self.by_end = rows[order]
+        self.ends = end[self.by_end]
+
+    @property
+    def nbytes(self) -> int:
+        return self.starts.nbytes + self.by_start.nbytes + self.ends.nbytes + self.by_end.nbytes
+
+
+class TimeIndex:
+    """Per-day sorted start / end minutes of one frame."""
+
+    def __init__(self, df: pd.DataFrame):
+        self.start = df["Start Min"].to_numpy(dtype=np.int16)
+        self.end = df["End Min"].to_numpy(dtype=np.int16)
+        days = df["Days"].to_numpy(dtype=np.uint8)
+        timed = (self.start >= 0) & (self.end >= 0)
+        self.days = {
+            day: _Day(np.flatnonzero(timed & ((days & bit) != 0)).astype(np.int32), self.start, self.end)
+            for day, bit in DAY_BITS.items()
+        }
+
+    @property
+    def nbytes(self) -> int:
+        return self.start.nbytes + self.end.nbytes + sum(d.nbytes for d in self.days.values())
+
+    @staticmethod
+    def _slice(values: np.ndarray, perm: np.ndarray, low: int | None, high: int | None) -> np.ndarray:
+        """Rows whose value is in ``[low, high)``; ``None`` leaves that side open."""
+        a = 0 if low is None else np.searchsorted(values, low, side="left")
+        b = len(values) if high is None else np.searchsorted(values, high, side="left")
+        return np.sort(perm[a:b])
+
+    def starting(self, day: str, after: int | None = None, before: int | None = None) -> np.ndarray:
+        """Meetings on ``day`` starting at or after ``after`` and before ``before``."""
+        d = self.days[day]
+        return self._slice(d.starts, d.by_start, after, before)
+
+    def ending(self, day: str, after: int | None = None, before: int | None = None) -> np.ndarray:
+        """Meetings on ``day`` ending after ``after`` and at or before ``before``."""
+        d = self.days[day]
+        return self._slice(d.ends, d.by_end, None if after is None else after + 1,
+                           None if before is None else before + 1)
+
+    def overlapping(self, day: str, start: int, end: int) -> np.ndarray:
+        """Meetings on ``day`` that are in session at some point of ``[start, end)``.
+
+        The answer is the intersection of two binary-searched ranges: the rows
+        starting before ``end`` (a prefix of ``by_start``) and the rows ending
+        after ``start`` (a suffix of ``by_end``).  Only the shorter of the two is
+        read and checked against the other bound, so the cost follows the
+        smaller range (early-morning or late-evening queries touch few rows).
+        """
+        d = self.days[day]
+        began = d.by_start[:np.searchsorted(d.starts, end, side="left")]
+        running = d.by_end[np.searchsorted(d.ends, start, side="right"):]
+        if len(began) <= len(running):
+            return np.sort(began[self.end[began] > start])
+        return np.sort(running[self.start[running] < end])
+
+    def in_session(self, day: str, minute: int) -> np.ndarray:
+        """Meetings on ``day`` running at ``minute`` (start inclusive, end exclusive)."""
+        return self.overlapping(day, minute, minute + 1)
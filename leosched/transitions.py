@@ -0,0 +1,146 @@
+"""Back-to-back building transitions per instructor.
+
+Every meeting is expanded to one entry per meeting day, the entries are
+sorted by (instructor, day, start minute) with one ``np.lexsort``, and each
+entry is compared with its predecessor: the earlier-starting entry of the
+same instructor and day, among those whose date range overlaps its own, that
+ends last.  So Summer I and Summer II sections never pair up, a Summer II
+section sitting between two Summer I meetings does not hide their
+transition, and neither does a short meeting inside a longer one.  A pair
+is flagged when the instructor moves to a different building (or campus)
+with less time between the end of one meeting and the start of the next
+than the threshold for that campus pair.  Predecessors are found with one
+shifted comparison of the sorted arrays per offset (up to the busiest
+instructor-day), so nothing loops per instructor.
+"""
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from leosched.buildings import DEARBORN, FLINT, VIRTUAL_CODES
+from leosched.schedule import DAY_BITS, DAY_NAMES
+
+# minutes needed between meetings in different buildings
+DEFAULT_RULES = {
+    "same campus": 10,  # walk within Central, North, ...
+    "across Ann Arbor": 20,  # Central <-> North by bus
+    "regional": 60,  # Ann Arbor <-> Dearborn <-> Flint
+}
+REGIONAL_CAMPUSES = {DEARBORN, FLINT, "Pellston, Michigan"}
+
+NO_BUILDING = {code for codes in VIRTUAL_CODES.values() for code in codes} | {"ARR", "REMOTE", ""}
+
+
+def pair_rule(a: str, b: str) -> str:
+    if a == b:
+        return "same campus"
+    if a in REGIONAL_CAMPUSES or b in REGIONAL_CAMPUSES:
+        return "regional"
+    return "across Ann Arbor"
+
+
+def threshold_matrix(campuses, rules: dict[str, int] | None = None,
+                     overrides: dict[tuple[str, str], int] | None = None) -> np.ndarray:
+    """Minutes needed from campus ``i`` to campus ``j``, indexed by category code."""
+    rules = {**DEFAULT_RULES, **(rules or {})}
+    overrides = {tuple(sorted(k)): v for k, v in (overrides or {}).items()}
+    n = len(campuses)
+    out = np.zeros((n, n), dtype=np.int16)
+    for i, a in enumerate(campuses):
+        for j, b in enumerate(campuses):
+            out[i, j] = overrides.get(tuple(sorted((a, b))), rules[pair_rule(a, b)])
+    return out
+
+
+def _by_day(df: pd.DataFrame) -> tuple[np.ndarray, np.ndarray]:
+    """(row position, day number) for every meeting day of every placeable row."""
+    days = df["Days"].to_numpy(dtype=np.uint8)
+    bldg = df["BldgPrediction"].astype("string").fillna("")
+    placeable = (
+        (df["Class Instr ID"].to_numpy() >= 0)
+        & (df["Start Min"].to_numpy() >= 0) & (df["End Min"].to_numpy() >= 0)
+        & ~bldg.isin(NO_BUILDING).to_numpy()
+        & df["CampusPrediction"].notna().to_numpy()
+    )
+    rows, day_nums = [], []
+    for num, bit in enumerate(DAY_BITS.values()):
+        hit = np.flatnonzero(placeable & ((days & bit) != 0))
+        rows.append(hit)
+        day_nums.append(np.full(len(hit), num, dtype=np.int8))
+    return np.concatenate(rows), np.concatenate(day_nums)
+
+
+def transitions(df: pd.DataFrame, rules: dict[str, int] | None = None,
+                overrides: dict[tuple[str, str], int] | None = None,
+                include_ok: bool = False) -> pd.DataFrame:
+    """Consecutive same-day meeting pairs of each instructor that are too tight.
+
+    ``rules`` replaces any of the ``DEFAULT_RULES`` minutes; ``overrides`` maps
+    specific campus pairs (either order) to minutes.  With ``include_ok``
+    every building change is returned, flagged or not.  A negative gap means
+    the two meetings overlap.
+    """
+    rows, day = _by_day(df)
+    instr = df["Class Instr ID"].to_numpy()[rows]
+    start = df["Start Min"].to_numpy()[rows]
+    order = np.lexsort([start, day, instr])
+    rows, day, instr, start = rows[order], day[order], instr[order], start[order]
+
+    end = df["End Min"].to_numpy()[rows]
+    bldg = df["BldgPrediction"].cat.codes.to_numpy()[rows]
+    campus_cat = df["CampusPrediction"].astype("category")
+    campus = campus_cat.cat.codes.to_numpy()[rows]
+    first = df["Meeting Start Dt"].astype("datetime64[s]").to_numpy()[rows]
+    last = df["Meeting End Dt"].astype("datetime64[s]").to_numpy()[rows]
+
+    # each entry's predecessor: of the earlier-starting entries of the same instructor and day
+    # whose dates overlap its own, the one ending last.  Checking only the entry just before
+    # would miss the real pair behind a Summer II section or a meeting contained in another.
+    # One vectorized pass per offset k compares every entry with the entry k places back.
+    n = len(rows)
+    slot_start = np.flatnonzero(np.r_[True, (instr[1:] != instr[:-1]) | (day[1:] != day[:-1])])
+    longest = int(np.diff(np.r_[slot_start, n]).max()) if n else 0
+    pred = np.full(n, -1, dtype=np.int64)
+    latest = np.full(n, np.iinfo(np.int32).min, dtype=np.int32)
+    for k in range(1, longest):
+        j = np.arange(k, n)
+        i = j - k
+        dates_overlap = ~((last[i] < first[j]) | (last[j] < first[i]))  # NaT compares False: kept
+        better = (instr[i] == instr[j]) & (day[i] == day[j]) & dates_overlap & (end[i] > latest[j])
+        pred[j[better]], latest[j[better]] = i[better], end[i[better]]
+
+    nxt = np.flatnonzero(pred >= 0)
+    prv = pred[nxt]
+    moves = (bldg[prv] != bldg[nxt]) | (campus[prv] != campus[nxt])
+    gap = start[nxt].astype(np.int32) - end[prv]
+    needed = threshold_matrix(list(campus_cat.cat.categories), rules, overrides)[campus[prv], campus[nxt]]
+    tight = gap < needed
+
+    keep = moves & (tight | include_ok)
+    prv, nxt, gap, needed, tight = prv[keep], nxt[keep], gap[keep], needed[keep], tight[keep]
+    prev, following = rows[prv], rows[nxt]
+
+    def col(name, pos):
+        return df[name].to_numpy()[pos]
+
+    def course(pos):
+        return (df["Subject"].astype("string").iloc[pos].fillna("").to_numpy() + " "
+                + df["Catalog Nbr"].astype("string").iloc[pos].fillna("").to_numpy())
+
+    return pd.DataFrame({
+        "Class Instr Name": col("Class Instr Name", prev),
+        "Class Instr ID": instr[nxt],
+        "Day": pd.Categorical(np.asarray(DAY_NAMES)[day[nxt]], categories=DAY_NAMES, ordered=True),
+        "From Course": course(prev),
+        "From Bldg": col("BldgPrediction", prev),
+        "From Campus": col("CampusPrediction", prev),
+        "Ends": end[prv],
+        "To Course": course(following),
+        "To Bldg": col("BldgPrediction", following),
+        "To Campus": col("CampusPrediction", following),
+        "Starts": start[nxt],
+        "Gap Min": gap,
+        "Needed Min": needed,
+        "Flagged": tight,
+    })
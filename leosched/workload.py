@@ -0,0 +1,86 @@
+"""Weekly contact minutes per lecturer, reconciled against roster FTE.
+
+A meeting contributes ``(End Min - Start Min) * day_count(Days)`` minutes a
+week.  Cross-listed sections share one physical meeting (same instructor,
+days, times, room and dates, different subject/number), so rows are
+deduplicated on those keys before summing.  Half-term sections are also
+weighted by the share of the term they run, giving an average week next to
+the peak week.
+
+``contact_minutes`` is one grouped, vectorized pass over a term's lecturer
+frame; ``reconcile`` joins the totals to FTE and scores each lecturer's
+minutes per 1.0 FTE with a robust (median / MAD) z-score.
+"""
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from leosched.roster import appointments, term_window
+from leosched.schedule import day_count
+
+# one physical meeting, whatever section numbers it is listed under
+MEETING_KEYS = ["Class Instr ID", "Days", "Start Min", "End Min", "Facility ID", "Meeting Start Dt", "Meeting End Dt"]
+OUTLIER_Z = 3.0
+
+
+def contact_minutes(df: pd.DataFrame) -> pd.DataFrame:
+    """Peak and term-average weekly contact minutes per ``Class Instr ID``."""
+    timed = df[(df["Class Instr ID"].to_numpy() >= 0) & (df["End Min"].to_numpy() > df["Start Min"].to_numpy())]
+    meetings = timed.drop_duplicates(MEETING_KEYS)
+    minutes = (meetings["End Min"].to_numpy(dtype=np.int32) - meetings["Start Min"].to_numpy()) \
+        * day_count(meetings["Days"])
+
+    start = meetings["Meeting Start Dt"].astype("datetime64[s]")
+    end = meetings["Meeting End Dt"].astype("datetime64[s]")
+    span = (end - start).dt.days.to_numpy(dtype=float) + 1
+    term_days = (end.max() - start.min()).days + 1 if start.notna().any() else np.nan
+    share = np.clip(np.nan_to_num(span / term_days, nan=1.0), 0, 1)
+
+    out = pd.DataFrame({
+        "UM ID": meetings["Class Instr ID"].to_numpy(),
+        "Meetings": 1,
+        "Cross-listed": 0,
+        "Peak Weekly Min": minutes,
+        "Avg Weekly Min": minutes * share,
+    }).groupby("UM ID").sum()
+    listings = timed.groupby("Class Instr ID").size()
+    out["Cross-listed"] = listings.reindex(out.index).to_numpy() - out["Meetings"]
+    out["Avg Weekly Min"] = out["Avg Weekly Min"].round().astype(np.int32)
+    return out
+
+
+def reconcile(df: pd.DataFrame, roster: pd.DataFrame, lecturer_ids: np.ndarray) -> pd.DataFrame:
+    """Contact minutes next to FTE for every roster lecturer, with outlier scores.
+
+    FTE is the sum over the appointments active during ``df``'s meeting dates
+    (``roster.appointments``).  Lecturers on the roster with no timed meeting
+    this term get zero minutes and the status "no meetings"; the z-score is
+    computed over the others.
+    """
+    people = appointments(roster, lecturer_ids, term_window(df))
+    minutes = contact_minutes(df).reindex(people.index, fill_value=0)
+    out = people[["Employee Last Name", "Employee First Name", "Job Title", "Department Name", "FTE",
+                  "Appointments"]].join(minutes)
+    fte = out["FTE"].astype(float)
+    out["Min per FTE"] = (out["Avg Weekly Min"] / fte.where(fte > 0)).round(1)
+
+    teaching = out["Meetings"] > 0
+    per_fte = out["Min per FTE"].where(teaching)
+    median = per_fte.median()
+    mad = (per_fte - median).abs().median() * 1.4826  # scaled to match a standard deviation
+    out["Z"] = ((per_fte - median) / mad).round(2) if mad else per_fte * 0
+    out["Status"] = np.select(
+        [~teaching, out["FTE"].isna() | (fte <= 0)],
+        ["no meetings", "no FTE"],
+        default="ok",
+    )
+    return out.reset_index()
+
+
+def outliers(reconciled: pd.DataFrame, z: float = OUTLIER_Z, unscheduled: bool = False) -> pd.DataFrame:
+    """Lecturers whose minutes per FTE sit more than ``z`` robust deviations from the median."""
+    flagged = (reconciled["Z"].abs() > z) | (reconciled["Status"] == "no FTE")
+    if unscheduled:
+        flagged |= reconciled["Status"] == "no meetings"
+    return reconciled[flagged].sort_values("Z", key=lambda s: -s.abs(), na_position="last")
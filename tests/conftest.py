@@ -0,0 +1,17 @@
+import pytest
+
+from leosched import fetch, linkage, snapshot, sql, stream
+
+
+@pytest.fixture(scope="session", autouse=True)
+def snapshot_dir(tmp_path_factory):
+    """Keep every snapshot, manifest and cached download the tests write out of the checkout."""
+    root = tmp_path_factory.mktemp("snapshots")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(snapshot, "SNAPSHOT_DIR", root)
+        mp.setattr(sql, "TERM_DIR", root / "terms")
+        mp.setattr(sql, "HISTORY_DIR", root / "history")
+        mp.setattr(stream, "HISTORY_DIR", root / "history")
+        mp.setattr(linkage, "LINK_DIR", root / "links")
+        mp.setattr(fetch, "CACHE_DIR", root / "http")
+        yield root
@@ -0,0 +1,45 @@
+import pandas as pd
+
+from leosched.buildings import A2, DEARBORN, FLINT, BuildingRegistry, building_registry
+
+RAW = {
+    "MH": ["Mason Hall", "Central Campus"],
+    "MLB": ["Modern Languages Building", "Central Campus"],
+    "LB": ["Lab Building", "Central Campus"],  # also inside "MLB 1200"
+    "BBB": ["Bob and Betty Beyster Building", "North Campus"],
+    "ARR": "Arranged",
+}
+
+
+def test_bare_strings_have_no_campus():
+    registry = BuildingRegistry.from_json(RAW)
+    assert registry.lookup("ARR") == ("ARR", "Arranged", "", -1)
+    assert registry.lookup("BBB").campus == "North Campus"
+    assert registry.campuses == ["Central Campus", "Dearborn", "Flint", "North Campus"]
+
+
+def test_namespaces_are_separate():
+    registry = BuildingRegistry.from_json(RAW)
+    codes = pd.Series(["MH", "WEB", "OSYNC", "XYZ"])
+    assert registry.map(codes).tolist()[:1] == ["Mason Hall"]
+    assert registry.map(codes).isna().tolist() == [False, True, True, True]
+    assert registry.map(codes, namespace=DEARBORN).tolist()[1] == "Online"
+    assert registry.map(codes, "campus", namespace=FLINT).tolist()[2] == FLINT
+    assert registry.lookup("MH", DEARBORN) is None and registry.lookup("MH", A2).name == "Mason Hall"
+
+
+def test_split_facility_takes_the_longest_matching_code():
+    registry = BuildingRegistry.from_json(RAW)
+    facility = pd.Series(["MLB 1200", "MH 1401", "BBB1670", "MLB 1200", "NOPE 1", None, "  "], index=list("abcdefg"))
+    parts = registry.split_facility(facility)
+    assert parts.index.tolist() == list("abcdefg")
+    assert parts.to_dict("list") == {
+        "RoomPrediction": ["1200", "1401", "1670", "1200", "", "", ""],
+        "BldgPrediction": ["MLB", "MH", "BBB", "MLB", "NOPE 1", "", ""],
+        "CampusPrediction": ["Central Campus", "Central Campus", "North Campus", "Central Campus", "", "", ""],
+    }
+
+
+def test_registry_is_built_once_per_file():
+    assert building_registry(dict(RAW)) is building_registry(dict(reversed(RAW.items())))
+    assert building_registry(RAW) is not building_registry({**RAW, "NQ": ["North Quad", "Central Campus"]})
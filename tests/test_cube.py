@@ -0,0 +1,68 @@
+import pandas as pd
+
+from leosched.buildings import BuildingRegistry
+from leosched.cube import DIMENSIONS, WorkloadCube
+from leosched.roster import lecturer_ids
+from leosched.schedule import normalize
+
+REGISTRY = BuildingRegistry.from_json({"MH": ["Mason Hall", "Central Campus"], "BBB": ["Beyster", "North Campus"]})
+
+
+def _term():
+    rows = [
+        ("1", "MATH", "MH 1401", "10:00 AM", "11:00 AM", ("Mon", "Wed")),
+        ("1", "MATH", "MH 1401", "1:00 PM", "2:30 PM", ("Mon",)),
+        ("2", "EECS", "BBB 1670", "9:00 AM", "10:30 AM", ("Tues", "Thurs")),
+        ("3", "STATS", "MH 1200", "8:00 AM", "9:00 AM", ("Fri",)),
+        ("4", "EECS", "BBB 1690", "8:00 AM", "9:00 AM", ("Mon",)),
+        ("", "MATH", "MH 1200", "8:00 AM", "9:00 AM", ("Mon",)),
+    ]
+    raw = pd.DataFrame([
+        {"Class Instr ID": i, "Subject": s, "Facility ID": f, "Meeting Time Start": a, "Meeting Time End": b,
+         "Instruction Mode Descrshort": "P", "Meeting Start Dt": "08/25/2025", "Meeting End Dt": "12/09/2025",
+         **{d: "Y" if d in days else "N" for d in ["Mon", "Tues", "Wed", "Thurs", "Fri"]}}
+        for i, s, f, a, b, days in rows
+    ])
+    return normalize(raw, "A2", REGISTRY)
+
+
+def _roster(changes=None):
+    people = {
+        1: ("LEO Lecturer I", "Mathematics", "LSA"),
+        2: ("LEO Lecturer II", "EECS", "Engineering"),
+        3: ("LEO Lecturer I", "Statistics", "LSA"),
+        4: ("Professor", "EECS", "Engineering"),
+    } | (changes or {})
+    return pd.DataFrame(
+        [(um_id, *attrs, 1.0, None, None) for um_id, attrs in people.items()],
+        columns=["UM ID", "Job Title", "Department Name", "School/College/Division", "FTE",
+                 "Appointment Start Date", "Appointment End Date"],
+    )
+
+
+def _rows(cube: WorkloadCube) -> pd.DataFrame:
+    out = cube.cube.astype({dim: "string" for dim in DIMENSIONS})
+    return out.sort_values(DIMENSIONS).reset_index(drop=True)
+
+
+def test_cube_counts_lecturer_meeting_days():
+    schedule, roster = _term(), _roster()
+    cube = WorkloadCube(schedule, roster, lecturer_ids(roster))
+    by_person = cube.summary(["Department Name"], measure="Weekly Min")["Weekly Min"].to_dict()
+    assert by_person == {"EECS": 180, "Mathematics": 210, "Statistics": 60}  # the professor is left out
+    days = cube.summary(["Subject"], column="Day")
+    assert days.columns.tolist() == ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday"]
+    assert days.loc["MATH"].tolist() == [2, 0, 1, 0, 0]
+
+
+def test_update_roster_matches_a_full_rebuild():
+    schedule, roster = _term(), _roster()
+    cube = WorkloadCube(schedule, roster, lecturer_ids(roster))
+    new = _roster({
+        1: ("LEO Lecturer II", "Mathematics", "LSA"),  # promoted
+        3: ("Research Fellow", "Statistics", "LSA"),  # no longer a lecturer
+        4: ("LEO Lecturer I", "EECS", "Engineering"),  # newly a lecturer
+    })
+    assert cube.update_roster(new, lecturer_ids(new)) == 3
+    pd.testing.assert_frame_equal(_rows(cube), _rows(WorkloadCube(schedule, new, lecturer_ids(new))))
+    assert cube.update_roster(new, lecturer_ids(new)) == 0
@@ -0,0 +1,38 @@
+import datetime as dt
+
+import numpy as np
+import pandas as pd
+
+from leosched.dates import DateIndex
+
+
+def _frame(starts, ends, days=0b11111):
+    return pd.DataFrame({
+        "Meeting Start Dt": pd.to_datetime(pd.Series(starts, dtype=object)),
+        "Meeting End Dt": pd.to_datetime(pd.Series(ends, dtype=object)),
+        "Days": np.full(len(starts), days, dtype=np.uint8),
+    })
+
+
+def test_open_ended_ranges_match_every_date():
+    index = DateIndex(_frame([None, "2025-05-05", None], [None, None, "2025-06-20"]))
+    assert index.active("2025-01-01").tolist() == [True, False, True]
+    assert index.active("2030-01-01").tolist() == [True, True, False]
+    assert index.bounds == (dt.date(2025, 5, 5), dt.date(2025, 6, 20))
+
+
+def test_bounds_without_any_dates_cover_a_week():
+    first, last = DateIndex(_frame([None, None], [None, None])).bounds
+    assert (last - first).days == 6
+
+
+def test_bounds_with_only_starts_or_only_ends():
+    assert DateIndex(_frame(["2025-05-05"], [None])).bounds == (dt.date(2025, 5, 5), dt.date(2025, 5, 5))
+    assert DateIndex(_frame([None], ["2025-06-20"])).bounds == (dt.date(2025, 6, 20), dt.date(2025, 6, 20))
+
+
+def test_inverted_ranges_are_left_out():
+    index = DateIndex(_frame(["2025-06-20", "2025-05-05"], ["2025-05-05", "2025-06-20"]))
+    assert index.active("2025-05-20").tolist() == [False, True]
+    assert index.positions("2025-05-20").tolist() == [1]  # a Tuesday
+    assert index.ranges()["Meetings"].tolist() == [1]
@@ -0,0 +1,66 @@
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from leosched.buildings import BuildingRegistry
+from leosched.export import export, select, write_csv
+from leosched.schedule import normalize
+
+REGISTRY = BuildingRegistry.from_json({
+    "MH": ["Mason Hall", "Central Campus"],
+    "BBB": ["Bob and Betty Beyster Building", "North Campus"],
+})
+
+
+def _term():
+    raw = pd.DataFrame({
+        "Subject": ["EECS", "MATH", "EECS", "MATH", "EECS"],
+        "Catalog Nbr": ["280", "115", "281", "116", "370"],
+        "Class Instr ID": ["1", "2", "3", "4", "5"],
+        "Facility ID": ["BBB 1670", "MH 1401", "BBB 1670", "MH 1200", "BBB 1690"],
+        "Meeting Time Start": ["10:30 AM", "8:00 AM", "10:30 AM", "8:00 AM", "9:00 AM"],
+        "Meeting Time End": ["12:00 PM", "9:00 AM", "12:00 PM", "9:00 AM", "10:30 AM"],
+        "Meeting Start Dt": ["08/25/2025"] * 5,
+        "Meeting End Dt": ["12/09/2025"] * 5,
+        "Mon": ["Y", "Y", "N", "Y", "Y"],
+        "Tues": ["N", "N", "Y", "N", "N"],
+    })
+    return normalize(raw, "A2", REGISTRY)
+
+
+def test_select_filters_facets_and_sorts_by_time_then_room():
+    df = _term()
+    assert select(df).tolist() == [3, 1, 4, 0, 2]  # 8:00 MH 1200 before MH 1401
+    assert select(df, day="Monday", campus="North Campus").tolist() == [4, 0]
+    assert select(df, building="MH").tolist() == [3, 1]
+    assert select(df, campus="Dearborn").tolist() == []
+
+
+@pytest.mark.parametrize("chunksize", [1, 2, 5000])
+def test_csv_is_the_same_at_any_chunk_size(chunksize):
+    df = _term()
+    fh = io.BytesIO()
+    assert write_csv(df, select(df), fh, chunksize) == 5
+    out = pd.read_csv(io.BytesIO(fh.getvalue()), dtype=str)
+    assert out["Catalog Nbr"].tolist() == ["116", "115", "370", "280", "281"]
+    assert out["Meeting Time Start"].tolist()[:3] == ["08:00", "08:00", "09:00"]
+    assert out[["Mon", "Tues"]].iloc[-1].tolist() == ["N", "Y"]
+    assert "Class Instr ID" not in out.columns and "Days" not in out.columns
+
+
+def test_empty_export_still_has_a_header():
+    df = _term()
+    fh = export(df, np.empty(0, dtype=np.int32))
+    out = pd.read_csv(fh, dtype=str)
+    assert out.empty and "Meeting Time Start" in out.columns
+
+
+def test_xlsx_matches_the_csv():
+    pytest.importorskip("openpyxl")
+    df = _term()
+    rows = select(df, day="Monday")
+    csv = pd.read_csv(export(df, rows), dtype=str)
+    xlsx = pd.read_excel(export(df, rows, "xlsx"), dtype=str)
+    pd.testing.assert_frame_equal(xlsx, csv)
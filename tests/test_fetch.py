@@ -0,0 +1,113 @@
+import hashlib
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from leosched import fetch
+
+
+class Origin(BaseHTTPRequestHandler):
+    """A stand-in for GitHub raw: serves ``body`` with an ETag, or fails."""
+
+    body = b'{"version": 1}'
+    failing = False
+    delay = 0.0
+    statuses: list[int] = []
+
+    def do_GET(self):
+        time.sleep(self.delay)
+        if self.failing:
+            status, body = 503, b""
+        else:
+            etag = '"%s"' % hashlib.sha1(self.body).hexdigest()
+            status = 304 if self.headers.get("If-None-Match") == etag else 200
+            body = self.body if status == 200 else b""
+        type(self).statuses.append(status)
+        self.send_response(status)
+        if status != 503:
+            self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def origin(tmp_path, monkeypatch):
+    monkeypatch.setattr(fetch, "CACHE_DIR", tmp_path)
+    monkeypatch.setattr(fetch, "_REMOTES", {})
+    handler = type("Handler", (Origin,), {"statuses": []})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield handler, f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_revalidates_and_falls_back_to_the_last_good_copy(origin):
+    handler, base = origin
+    url = f"{base}/buildings.json"
+
+    version, value = fetch._fetch_versioned(url, fetch.parse_json, timeout=5)
+    assert value == {"version": 1} and version
+    assert handler.statuses == [200]
+
+    assert fetch._fetch_versioned(url, fetch.parse_json, timeout=5) == (version, value)
+    assert handler.statuses == [200, 304]
+
+    handler.failing = True
+    assert fetch.fetch_one(url, fetch.parse_json, timeout=5) == {"version": 1}
+    assert handler.statuses == [200, 304, 503]
+
+
+def test_remote_serves_the_current_copy_and_swaps_in_a_changed_one(origin):
+    handler, base = origin
+    url = f"{base}/buildings.json"
+    source = fetch.remote(url, fetch.parse_json, max_age=0)
+    first = source.get()
+    assert first[1] == {"version": 1}
+
+    handler.body = b'{"version": 2}'
+    assert source.get() == first  # served at once, revalidated behind the caller
+    deadline = time.monotonic() + 5
+    while source.get()[1] != {"version": 2}:
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def test_fetch_all_fans_out_per_source(origin):
+    handler, base = origin
+    fetched = fetch.fetch_all({
+        "a": (f"{base}/a.json", fetch.parse_json),
+        "b": (f"{base}/b.json", fetch.parse_json),
+    })
+    assert fetched == {"a": {"version": 1}, "b": {"version": 1}}
+    assert sorted(handler.statuses) == [200, 200]
+
+
+def test_remote_is_keyed_by_parser_and_max_age(origin):
+    _, base = origin
+    url = f"{base}/buildings.json"
+    assert fetch.remote(url, fetch.parse_json) is fetch.remote(url, fetch.parse_json)
+    assert fetch.remote(url, fetch.parse_json) is not fetch.remote(url, fetch.parse_csv)
+    assert fetch.remote(url, fetch.parse_json) is not fetch.remote(url, fetch.parse_json, max_age=60)
+
+
+def test_fetch_all_timeout_is_per_call(origin):
+    handler, base = origin
+    url = f"{base}/slow.json"
+    fetch.fetch_all({"slow": (url, fetch.parse_json)}, timeout=5)
+    source = fetch.remote(url, fetch.parse_json)
+    assert source.timeout == fetch.DEFAULT_TIMEOUT  # the shared source is left alone
+
+    handler.delay = 0.5
+    fresh = fetch.remote(f"{base}/other.json", fetch.parse_json)
+    with pytest.raises(requests.Timeout):
+        fresh.get(timeout=0.1)  # nothing cached or checked in to fall back to
+    assert fresh.timeout == fetch.DEFAULT_TIMEOUT
@@ -0,0 +1,45 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from leosched.filters import Filter, FilterCache
+
+
+def _frame():
+    return pd.DataFrame({
+        "Days": np.array([0b1, 0b10, 0b101], dtype=np.uint8),
+        "CampusPrediction": pd.Categorical(["Central Campus", "North Campus", "Central Campus"]),
+        "BldgPrediction": pd.Categorical(["MLB", "EECS", None]),
+        "Subject": pd.Categorical(["MATH", "EECS", "math"]),
+        "Instruction Mode Descrshort": pd.Categorical(["In Person"] * 3),
+        "Start Min": np.array([540, 600, -1], dtype=np.int16),
+        "End Min": np.array([590, 650, -1], dtype=np.int16),
+    })
+
+
+def test_values_match_case_insensitively():
+    df = _frame()
+    assert Filter.parse("bldg=mlb").positions(df).tolist() == [0]
+    assert Filter.parse("subject=Math").positions(df).tolist() == [0, 2]
+    assert Filter.parse("campus=CENTRAL campus; day=monday").positions(df).tolist() == [0, 2]
+
+
+def test_equivalent_expressions_share_one_key():
+    a = Filter.parse("subject=MATH|eecs; day=Wednesday|monday")
+    b = Filter.parse("day=Monday|WEDNESDAY; subject=math|EECS|Math")
+    assert a.canonical == b.canonical == "day=Monday|Wednesday; subject=eecs|math"
+    cache = FilterCache(_frame())
+    cache.positions(a)
+    cache.positions(b)
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_time_window_and_missing_values():
+    df = _frame()
+    assert Filter.parse("time=09:30-10:00").positions(df).tolist() == [0]
+    assert Filter.parse("bldg=MLB|none").positions(df).tolist() == [0]
+
+
+def test_unknown_day_is_an_error():
+    with pytest.raises(ValueError):
+        Filter.parse("day=Mon")
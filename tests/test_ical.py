@@ -0,0 +1,33 @@
+import numpy as np
+import pandas as pd
+
+from leosched.ical import EVENT_COLUMNS, file_stems, write_calendars
+
+
+def _meetings(departments):
+    n = len(departments)
+    df = pd.DataFrame({col: pd.Series([None] * n, dtype="string") for col in EVENT_COLUMNS})
+    df["Subject"], df["Catalog Nbr"], df["Class Section"] = "MATH", "105", "001"
+    df["Class Nbr"] = np.arange(n, dtype=np.int32)
+    df["Class Instr ID"] = np.arange(n, dtype=np.int32)
+    df["Meeting Start Dt"] = pd.Timestamp("2025-01-08")
+    df["Meeting End Dt"] = pd.Timestamp("2025-04-22")
+    df["Start Min"] = np.int16(600)
+    df["End Min"] = np.int16(660)
+    df["Days"] = np.uint8(0b101)
+    df["Department Name"] = departments
+    return df
+
+
+def test_groups_whose_names_slug_alike_get_their_own_files(tmp_path):
+    written = write_calendars(_meetings(["Math & Stats", "Math, Stats", "Physics"]), tmp_path,
+                              by="department", workers=1)
+    paths = set(written["path"])
+    assert len(paths) == 3
+    assert str(tmp_path / "Physics.ics") in paths
+    assert all((tmp_path / p).exists() for p in paths)
+
+
+def test_stems_keep_plain_names_and_add_the_key_on_clashes():
+    stems = file_stems({1: "Smith, Ann", 2: "Smith Ann", 3: "Jones"})
+    assert stems == {1: "Smith_Ann_1", 2: "Smith_Ann_2", 3: "Jones"}
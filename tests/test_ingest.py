@@ -0,0 +1,33 @@
+import pandas as pd
+
+from leosched.buildings import BuildingRegistry
+from leosched.ingest import from_buffer, to_buffer
+from leosched.schedule import normalize
+
+REGISTRY = BuildingRegistry.from_json({"MH": ["Mason Hall", "Central Campus"]})
+
+
+def _term():
+    raw = pd.DataFrame({
+        "Subject": ["MATH", "MATH", None],
+        "Catalog Nbr": ["115", "116", "0101"],
+        "Class Instr ID": ["12", "", "34"],
+        "Facility ID": ["MH 1401", "MH 1200", None],
+        "Meeting Time Start": ["10:00 AM", "TBA", "8:30 AM"],
+        "Meeting Time End": ["11:00 AM", "TBA", "9:30 AM"],
+        "Meeting Start Dt": ["08/25/2025", "10/14/2025", None],
+        "Meeting End Dt": ["12/09/2025", "12/09/2025", None],
+        "Mon": ["Y", "N", "Y"],
+        "Jobcode Descr": ["LEO Lecturer I", None, "Professor"],
+    })
+    return normalize(raw, "A2", REGISTRY)
+
+
+def test_arrow_round_trip_keeps_the_schema():
+    df = _term()
+    back = from_buffer(to_buffer(df))
+    pd.testing.assert_frame_equal(back, df)
+    assert back["Subject"].cat.categories.dtype == "string"
+    assert back["Meeting Start Dt"].cat.categories.dtype == "datetime64[s]"
+    assert back["Meeting Start Dt"].cat.ordered
+
@@ -0,0 +1,49 @@
+import threading
+
+import pytest
+
+from leosched.snapshot import REPO_ROOT
+
+testing = pytest.importorskip("streamlit.testing.v1")
+from streamlit.runtime.media_file_manager import MediaFileManager  # noqa: E402
+
+
+def _in_worker(fn):
+    """Call ``fn`` on a plain thread, as Streamlit does for deferred downloads."""
+    out = {}
+
+    def run():
+        try:
+            out["value"] = fn()
+        except Exception as exc:
+            out["error"] = exc
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    thread.join()
+    if "error" in out:
+        raise out["error"]
+    return out["value"]
+
+
+def test_calendar_download_is_generated_outside_the_script_run(monkeypatch):
+    deferred = {}
+    add_deferred = MediaFileManager.add_deferred
+
+    def record(self, data_callable, mimetype, coordinates, file_name=None, **kwargs):
+        deferred[file_name] = data_callable
+        return add_deferred(self, data_callable, mimetype, coordinates, file_name=file_name, **kwargs)
+
+    monkeypatch.setattr(MediaFileManager, "add_deferred", record)
+    at = testing.AppTest.from_file(str(REPO_ROOT / "LEOScheduleExplorer.py"), default_timeout=180).run()
+    at.switch_page("explorer/instructor_week.py").run()
+    at.text_input[0].set_value("AbdulNour").run()
+    [button] = [b for b in at.download_button if b.label == "Add to calendar (.ics)"]
+    button.click().run()
+    assert not at.exception
+
+    [name] = [n for n in deferred if n.endswith(".ics")]
+    assert name.startswith("FA24_")
+    ics = _in_worker(deferred[name])
+    assert ics.startswith("BEGIN:VCALENDAR") and "BEGIN:VEVENT" in ics
+    assert "UID:FA24-" in ics
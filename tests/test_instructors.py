@@ -0,0 +1,28 @@
+import numpy as np
+import pandas as pd
+
+from leosched.instructors import InstructorIndex
+from leosched.terms import TERMS, load_term
+
+
+def test_one_instructor_per_um_id_across_campuses():
+    index = InstructorIndex(load_term(TERMS["W25"]).schedule)
+    [goldstein] = index.find("81748327")
+    assert goldstein.campuses == ("A2", "Dearborn")
+    assert [i.um_id for i in index.find("Goldstein, Louis")] == [81748327]
+    assert [i.um_id for i in index.find("Louis Goldstein")] == [81748327]
+
+
+def test_rows_without_an_id_group_by_normalized_name():
+    df = pd.DataFrame({
+        "Class Instr Name": ["Davis,Amy", "Davis, Amy", "Davis, Amy", "Lee,Ann", None],
+        "Class Instr ID": np.array([-1, -1, 42, -1, -1], dtype=np.int32),
+        "Campus": ["A2", "Flint", "A2", "A2", "A2"],
+    })
+    index = InstructorIndex(df)
+    by_id = {(i.name, i.um_id): (i.campuses, i.positions.tolist()) for i in index.instructors}
+    assert by_id == {
+        ("Davis, Amy", -1): (("A2", "Flint"), [0, 1]),
+        ("Davis, Amy", 42): (("A2",), [2]),
+        ("Lee,Ann", -1): (("A2",), [3]),
+    }
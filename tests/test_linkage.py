@@ -0,0 +1,32 @@
+import pandas as pd
+
+from leosched.linkage import link_names
+
+
+def _links(left, right):
+    out = link_names(pd.Series(left), pd.Series(right, index=[f"r{i}" for i in range(len(right))]))
+    return out["match"].to_dict()
+
+
+def test_exact_names_link_across_layouts():
+    assert _links(["Korsyn, Kevin", "Mary Smith"], ["Smith, Mary", "Korsyn, Kevin E"]) == {
+        "Korsyn, Kevin": "r1", "Mary Smith": "r0",
+    }
+
+
+def test_initial_only_links_when_one_candidate_fits():
+    links = link_names(pd.Series(["Smith, J"]), pd.Series(["Smith, John", "Smyth, Ann"]))
+    assert links["match"].tolist() == [0]
+    assert links["score"].tolist() == [0.96]
+
+
+def test_ambiguous_ties_are_not_linked():
+    assert _links(["Smith, J"], ["Smith, John", "Smith, Jane"]) == {}
+
+
+def test_repeated_rows_of_one_name_link_to_the_first():
+    assert _links(["Smith, John"], ["Jones, Al", "Smith, John", "Smith, John"]) == {"Smith, John": "r1"}
+
+
+def test_below_threshold_is_left_out():
+    assert _links(["Smith, John"], ["Smithers, Wayland"]) == {}
@@ -0,0 +1,58 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from leosched.live import Timeline
+
+MON, TUE = 1, 2
+
+
+def _frame():
+    rows = [  # start, end, days, first, last
+        (600, 660, MON, "2025-08-25", "2025-12-09"),
+        (660, 720, MON, "2025-08-25", "2025-12-09"),  # back to back with the first
+        (630, 630, MON, "2025-08-25", "2025-12-09"),  # zero length: never in session
+        (-1, -1, MON, "2025-08-25", "2025-12-09"),  # untimed
+        (600, 660, TUE, "2025-08-25", "2025-12-09"),
+        (600, 900, MON, "2025-10-20", "2025-12-09"),  # second half of the term only
+    ]
+    start, end, days, first, last = zip(*rows)
+    return pd.DataFrame({
+        "Start Min": np.array(start, dtype=np.int16),
+        "End Min": np.array(end, dtype=np.int16),
+        "Days": np.array(days, dtype=np.uint8),
+        "Meeting Start Dt": pd.to_datetime(list(first)),
+        "Meeting End Dt": pd.to_datetime(list(last)),
+    })
+
+
+def test_start_is_inclusive_and_end_exclusive():
+    cursor = Timeline(_frame()).cursor("2025-09-08")  # a Monday in the first half
+    seen = {}
+    for minute in [599, 600, 659, 660, 719, 720]:
+        cursor.advance(minute)
+        seen[minute] = cursor.positions().tolist()
+    assert seen == {599: [], 600: [0], 659: [0], 660: [1], 719: [1], 720: []}
+    assert cursor.next_change is None
+
+
+def test_events_are_applied_once_and_in_steps():
+    cursor = Timeline(_frame()).cursor("2025-10-27")
+    assert cursor.next_change == 600
+    assert cursor.advance(0) == 0
+    assert cursor.advance(610) == 2 and cursor.positions().tolist() == [0, 5]
+    assert cursor.next_change == 660
+    assert cursor.advance(610) == 0
+    assert cursor.advance(1000) == 4 and cursor.positions().tolist() == []  # started and ended in one step
+    with pytest.raises(ValueError):
+        cursor.advance(999)
+
+
+def test_cursor_only_sees_its_weekday_and_date_range():
+    timeline = Timeline(_frame())
+    tuesday = timeline.cursor("2025-09-09")
+    tuesday.advance(630)
+    assert tuesday.positions().tolist() == [4]
+    after = timeline.cursor("2025-12-15")
+    after.advance(630)
+    assert after.positions().tolist() == [] and after.next_change is None
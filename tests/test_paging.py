@@ -0,0 +1,30 @@
+import numpy as np
+import pandas as pd
+
+from leosched.paging import SortOrders
+
+
+def _frame():
+    return pd.DataFrame({
+        "Subject": pd.Series(["MATH", "MATH", "MATH", None, "MATH"], dtype="category"),
+        "Catalog Nbr": pd.Series(["100", "99", "312C", "105", None], dtype="category"),
+        "Class Section": pd.Series(["001"] * 5, dtype="category"),
+        "Start Min": np.array([600, -1, 480, 540, 720], dtype=np.int16),
+        "BldgPrediction": pd.Series(["MH", "MH", None, "AH", "AH"], dtype="category"),
+        "RoomPrediction": pd.Series(["1", "2", "3", "4", "5"], dtype="category"),
+    })
+
+
+def test_catalog_numbers_sort_numerically():
+    orders = SortOrders(_frame())
+    rows = np.arange(5)
+    assert orders.order(rows, "Subject").tolist() == [1, 0, 2, 4, 3]
+    assert orders.order(rows, "Subject", descending=True).tolist() == [2, 0, 1, 4, 3]
+
+
+def test_descending_keeps_missing_last():
+    orders = SortOrders(_frame())
+    rows = np.arange(5)
+    assert orders.order(rows, "Time").tolist() == [2, 3, 0, 4, 1]
+    assert orders.order(rows, "Time", descending=True).tolist() == [4, 0, 3, 2, 1]
+    assert orders.order(rows, "Building", descending=True).tolist()[-1] == 2
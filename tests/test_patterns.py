@@ -0,0 +1,16 @@
+from leosched.patterns import UNKNOWN, PatternCube
+from leosched.terms import TERMS, load_term
+
+
+def test_unplaced_meetings_keep_their_counts():
+    schedule = load_term(TERMS["W25"]).schedule
+    cube = PatternCube(schedule)
+    assert schedule["BldgPrediction"].isna().any()
+    assert cube.grid("Building").to_numpy().sum() == len(schedule)
+    assert cube.grid("Campus").loc[UNKNOWN].sum() == schedule["CampusPrediction"].isna().sum()
+
+
+def test_prime_time_filters_by_building():
+    cube = PatternCube(load_term(TERMS["W25"]).schedule)
+    top = cube.prime_time(10, "Central Campus", "MH")
+    assert len(top) and set(top["Building"]) == {"MH"}
@@ -0,0 +1,58 @@
+import pandas as pd
+
+from leosched.prune import NEVER_SHOWN, NO_ROOM, classify, describe, prune
+
+
+def _meeting(instr="1234", days="", start="10:00 AM", end="11:30 AM", facility="MH 1000", on="Y"):
+    row = {"Class Instr ID": instr, "Meeting Time Start": start, "Meeting Time End": end, "Facility ID": facility}
+    row.update({day: on if day in days.split() else None for day in ["Mon", "Tues", "Wed", "Thurs", "Fri", "Sat", "Sun"]})
+    return row
+
+
+ROWS = {
+    "kept": _meeting(days="Mon Wed"),
+    "flint": _meeting(days="Tues", on="X"),
+    "no instructor": _meeting(instr=" ", days="Mon"),
+    "placeholder": _meeting(start="1:00 AM", end="1:00 AM", facility=None),
+    "blank time": _meeting(start=None, end=None),
+    "no meeting days": _meeting(),
+    "no facility": _meeting(days="Fri", facility="  "),
+    "remote": _meeting(days="Fri", facility="remote"),
+    "arranged": _meeting(days="Fri", facility="ARR"),
+}
+
+
+def _frame():
+    return pd.DataFrame(list(ROWS.values()), index=list(ROWS))
+
+
+def test_each_row_gets_its_first_matching_category():
+    reason = classify(_frame())
+    assert reason.index[reason.isna()].tolist() == ["kept", "flint"]
+    assert reason.dropna().to_dict() == {
+        "no instructor": "no instructor",
+        "placeholder": "placeholder",
+        "blank time": "placeholder",
+        "no meeting days": "no meeting days",
+        "no facility": "no facility",
+        "remote": "remote",
+        "arranged": "arranged",
+    }
+
+
+def test_prune_splits_and_counts_only_the_dropped_categories():
+    kept, quarantined, counts = prune(_frame())
+    assert kept.index.tolist() == ["kept", "flint", "no facility", "remote", "arranged"]
+    assert quarantined["Prune Reason"].tolist() == ["no instructor", "placeholder", "placeholder", "no meeting days"]
+    assert counts == {"no instructor": 1, "placeholder": 2, "no meeting days": 1}
+    assert describe(counts) == "no instructor 1, placeholder 2, no meeting days 1"
+
+    kept, _, counts = prune(_frame(), drop=NEVER_SHOWN + NO_ROOM)
+    assert kept.index.tolist() == ["kept", "flint"]
+    assert counts["remote"] == 1
+
+
+def test_missing_instructor_column_is_not_a_reason():
+    df = _frame().drop(columns="Class Instr ID")
+    assert pd.isna(classify(df)["no instructor"])
+    assert describe(prune(df.loc[["kept"]])[2]) == "none"
@@ -0,0 +1,55 @@
+import numpy as np
+import pandas as pd
+
+from leosched.roster import appointments, id_mask, lecturer_ids, semi_join, to_ids
+
+
+def _roster():
+    return pd.DataFrame({
+        "UM ID": ["300", "100", "", "abc", "200", "100", None, "400"],
+        "Job Title": ["LEO Lecturer II", " leo lecturer i", "LEO Lecturer I", "LEO Lecturer I",
+                      "Professor", "LEO Adjunct Lecturer", "LEO Lecturer III", None],
+        "FTE": [1.0, 0.5, 1.0, 1.0, 1.0, 0.25, 1.0, 1.0],
+        "Dept": ["Math", "Physics", "Math", "Math", "EECS", "Astro", "Math", "Math"],
+        "Appointment Start Date": ["09/01/2020", "09/01/2023", None, None, None, "01/01/2024", None, None],
+        "Appointment End Date": [None, None, None, None, None, "12/31/2024", None, None],
+    })
+
+
+def test_to_ids_marks_blank_and_non_numeric_values():
+    assert to_ids(pd.Series(["12", " 7", "", None, "x1", "3.0"])).tolist() == [12, 7, -1, -1, -1, 3]
+
+
+def test_lecturer_ids_skip_missing_ids_and_other_titles():
+    roster = _roster()
+    assert lecturer_ids(roster).tolist() == [100, 300]
+    assert lecturer_ids(roster, prefix=None).tolist() == [100, 200, 300, 400]
+    assert lecturer_ids(roster.iloc[:0]).dtype == np.int64
+
+
+def test_semi_join_never_matches_missing_ids():
+    schedule = pd.DataFrame({"Class Instr ID": ["100", None, "", "999", "300", "050", "-1"]})
+    ids = lecturer_ids(_roster())
+    assert semi_join(schedule, "Class Instr ID", ids)["Class Instr ID"].tolist() == ["100", "300"]
+    assert id_mask(schedule["Class Instr ID"], np.array([], dtype=np.int64)).tolist() == [False] * 7
+    assert id_mask(pd.Series(["1000"]), np.array([100])).tolist() == [False]  # past the last id
+
+
+def test_appointments_sum_the_active_ones_for_the_term():
+    roster = _roster()
+    roster["UM ID"] = to_ids(roster["UM ID"])
+    fall = (pd.Timestamp("2025-08-25"), pd.Timestamp("2025-12-12"))
+    people = appointments(roster, np.array([100, 300]), fall)
+    assert people.loc[100, "FTE"] == np.float32(0.5)  # the expired adjunct row drops out
+    assert people.loc[100, "Appointments"] == 1
+
+    winter = (pd.Timestamp("2024-01-08"), pd.Timestamp("2024-04-23"))
+    people = appointments(roster, np.array([100, 300]), winter)
+    assert people.loc[100, "FTE"] == np.float32(0.75)
+    assert people.loc[100, "Appointments"] == 2
+    assert people.loc[100, "Dept"] == "Physics"  # from the largest appointment
+
+    # a roster newer than the term keeps everything rather than dropping the lecturer
+    old = (pd.Timestamp("2019-01-01"), pd.Timestamp("2019-04-30"))
+    people = appointments(roster, np.array([100, 300]), old)
+    assert sorted(people.index) == [100, 300] and people.loc[100, "Appointments"] == 2
@@ -0,0 +1,10 @@
+from leosched.schedule import SCHEMA, normalize
+from leosched.snapshot import load_snapshot
+from leosched.terms import TERMS
+
+
+def test_extra_export_columns_are_kept():
+    raw = load_snapshot(TERMS["SS25"].sources["Flint"])
+    df = normalize(raw, "Flint")
+    assert [c for c in df.columns if c not in SCHEMA] == ["Jobcode Descr"]
+    assert df["Jobcode Descr"].notna().any()
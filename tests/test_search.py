@@ -0,0 +1,55 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from leosched.search import SearchIndex, day_positions, facet_positions, intersect
+
+MON, TUE, WED = 1, 2, 4
+
+
+def _frame():
+    return pd.DataFrame({
+        "Crse Descr": ["Counterpoint I", "Calculus I", "Counterpoint II", "Data Structures", None, "Calculus II"],
+        "Subject": ["MUSTHTRE", "MATH", "MUSTHTRE", "EECS", "EECS", "MATH"],
+        "Catalog Nbr": ["231", "115", "232", "280", "280", "116"],
+        "Campus": ["A2", "A2", "A2", "A2", "A2", None],
+        "Days": np.array([MON | WED, TUE, WED, MON, 0, TUE], dtype=np.uint8),
+    })
+
+
+def test_search_matches_exact_prefix_and_one_typo():
+    index = SearchIndex(_frame())
+    assert index.search("calculus").tolist() == [1, 5]
+    assert index.search("counterp").tolist() == [0, 2]  # typeahead
+    assert index.search("countrpoint").tolist() == [0, 2]  # one letter missing
+    assert index.search("calculuss").tolist() == [1, 5]  # one letter too many
+    assert index.search("calcalus").tolist() == [1, 5]  # one letter wrong
+    assert index.search("cal ii").tolist() == [5]  # tokens are AND-ed
+    assert index.search("ii zzzz").tolist() == []
+
+
+def test_course_codes_match_joined_or_split():
+    index = SearchIndex(_frame())
+    assert index.search("eecs280").tolist() == [3, 4]
+    assert index.search("EECS 280").tolist() == [3, 4]
+    assert index.search("").tolist() == list(range(6))
+    assert index.search("ab").tolist() == []  # too short for a typo match
+
+
+def test_suggest_ranks_completions_by_frequency():
+    index = SearchIndex(_frame())
+    assert index.suggest("data c")[:2] == ["calculus", "counterpoint"]
+    assert index.suggest("   ") == []
+
+
+def test_facets_and_days_intersect_with_hits():
+    df = _frame()
+    campus = facet_positions(df, "Campus")
+    assert campus.keys() == {"A2"} and campus["A2"].tolist() == [0, 1, 2, 3, 4]
+    days = day_positions(df)
+    assert days["Monday"].tolist() == [0, 3] and days["Wednesday"].tolist() == [0, 2]
+    hits = SearchIndex(df).search("counterpoint")
+    assert intersect(hits, days["Wednesday"], None, campus["A2"]).tolist() == [0, 2]
+    assert intersect(hits, days["Monday"]).tolist() == [0]
+    with pytest.raises(ValueError):
+        intersect(None, None)
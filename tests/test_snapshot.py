@@ -0,0 +1,73 @@
+import datetime as dt
+import json
+import os
+
+import pytest
+
+from leosched import snapshot
+
+
+def _no_parse(*args, **kwargs):
+    raise AssertionError("source was re-parsed")
+
+
+@pytest.fixture
+def csv(tmp_path, monkeypatch):
+    monkeypatch.setattr(snapshot, "SNAPSHOT_DIR", tmp_path / "snapshots")
+    path = tmp_path / "Fall 2025.csv"
+    path.write_text("Subject,Catalog Nbr,Units\nMATH,0115,4\nEECS,280,\n", encoding="utf-8-sig")
+    return path
+
+
+def test_round_trip_keeps_strings(csv):
+    df = snapshot.load_snapshot(csv)
+    assert df["Catalog Nbr"].tolist() == ["0115", "280"]  # leading zero kept
+    assert df["Units"].isna().tolist() == [False, True]
+
+    snap = snapshot.snapshot_path(csv)
+    assert snap.exists() and snap.name.startswith("Fall_2025-")
+    meta = json.loads(snap.with_suffix(".json").read_text())
+    assert meta["rows"] == 2 and meta["sha256"] == snapshot.file_digest(csv)
+
+
+def test_touched_source_is_reused_after_a_hash_check(csv, monkeypatch):
+    first = snapshot.load_snapshot(csv)
+    monkeypatch.setattr(snapshot, "read_source", _no_parse)
+
+    assert snapshot.load_snapshot(csv).equals(first)  # same mtime: no hash either
+
+    stat = csv.stat()
+    os.utime(csv, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert snapshot.load_snapshot(csv).equals(first)
+    meta = json.loads(snapshot.snapshot_path(csv).with_suffix(".json").read_text())
+    assert meta["mtime_ns"] == stat.st_mtime_ns + 10**9  # manifest caught up
+
+
+def test_changed_source_is_parsed_again(csv):
+    snapshot.load_snapshot(csv)
+    csv.write_text("Subject,Catalog Nbr,Units\nSTATS,250,4\n", encoding="utf-8")
+    assert snapshot.load_snapshot(csv)["Subject"].tolist() == ["STATS"]
+
+
+def test_workbook_skips_title_rows_and_spells_cells_like_the_csv(tmp_path, monkeypatch):
+    openpyxl = pytest.importorskip("openpyxl")
+    monkeypatch.setattr(snapshot, "SNAPSHOT_DIR", tmp_path / "snapshots")
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.append(["Union report"])
+    ws.append([])
+    ws.append(["Subject", "Start", "Meeting Start Dt", "Units"])
+    ws.append(["MATH", dt.time(13, 5), dt.datetime(2025, 8, 25), 4.0])
+    ws.append([None, None, None, None])
+    ws.append(["EECS", dt.time(0, 30), dt.date(2025, 9, 2), 3.5])
+    path = tmp_path / "report.xlsx"
+    wb.save(path)
+
+    df = snapshot.load_snapshot(path)
+    assert df.columns.tolist() == ["Subject", "Start", "Meeting Start Dt", "Units"]
+    assert df.to_dict("list") == {
+        "Subject": ["MATH", "EECS"],
+        "Start": ["1:05 PM", "12:30 AM"],
+        "Meeting Start Dt": ["08/25/2025", "09/02/2025"],
+        "Units": ["4", "3.5"],
+    }
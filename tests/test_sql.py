@@ -0,0 +1,59 @@
+import pandas as pd
+import pytest
+
+from leosched.terms import TERMS, load_term
+
+duckdb = pytest.importorskip("duckdb")
+from leosched import sql  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def con():
+    return sql.connect(read_only=True)
+
+
+def test_snapshots_are_written_outside_the_checkout(con, snapshot_dir):
+    assert sql.TERM_DIR.parent == snapshot_dir
+    assert (snapshot_dir / "terms" / "manifest.json").exists()
+
+
+def test_term_column_is_the_registrar_code(con):
+    got = sql.select(con, 'SELECT term_key, "Term", count(*) AS n FROM schedule GROUP BY ALL')
+    for key, term in TERMS.items():
+        schedule = load_term(term).schedule
+        expected = schedule["Term"].astype("string").value_counts(dropna=False)
+        rows = got[got["term_key"] == key]
+        actual = pd.Series(rows["n"].to_numpy(), index=rows["Term"].astype("string"))
+        assert actual.sort_index().to_dict() == expected.sort_index().to_dict(), key
+
+
+def test_partition_filter_prunes_by_term_key(con):
+    n = sql.select(con, "SELECT count(*) AS n FROM schedule WHERE term_key = 'W25'")["n"][0]
+    assert n == len(load_term(TERMS["W25"]).schedule)
+
+
+@pytest.mark.parametrize("statement", [
+    "COPY (SELECT 1) TO 'x.csv'",
+    "DROP VIEW schedule",
+    "CREATE TABLE t AS SELECT 1",
+    "SET enable_external_access = true",
+    "EXPLAIN ANALYZE SELECT 1",
+    "SELECT 1; DROP VIEW roster",
+])
+def test_read_only_runs_nothing_but_select(con, statement):
+    with pytest.raises(ValueError):
+        sql.select(con, statement)
+    assert sql.select(con, "SELECT count(*) AS n FROM roster")["n"][0] > 0
+
+
+def test_read_only_cannot_read_files_outside_the_snapshots(con):
+    with pytest.raises(duckdb.PermissionException):
+        sql.select(con, "SELECT * FROM read_csv('/etc/hostname')")
+    with pytest.raises(duckdb.Error):
+        con.execute("SET enable_external_access = true")
+
+
+def test_version_changes_only_when_snapshots_are_rewritten():
+    before = sql.snapshot_version()
+    assert sql.ensure_snapshots() == []
+    assert sql.snapshot_version() == before
@@ -0,0 +1,37 @@
+import pandas as pd
+import pytest
+
+from leosched.snapshot import REPO_ROOT
+from leosched.stream import read_history, stream_source
+from leosched.terms import TERMS, load_term
+
+SOURCE = REPO_ROOT / "LEOAug24Schedule.csv"
+
+
+@pytest.fixture(scope="module")
+def streamed(tmp_path_factory):
+    outdir = tmp_path_factory.mktemp("history") / "LEOAug24Schedule-A2"
+    meta = stream_source(SOURCE, "A2", outdir, chunksize=5000)
+    return outdir, meta
+
+
+def test_chunks_match_the_in_memory_load(streamed):
+    outdir, meta = streamed
+    assert meta["chunks"] > 1
+    history = read_history(outdir)
+    schedule = load_term(TERMS["FA24"]).schedule
+    # without the columns only other campuses' exports carry (Flint's Jobcode Descr)
+    a2 = schedule[schedule["Campus"] == "A2"].reset_index(drop=True).dropna(axis=1, how="all")
+    pd.testing.assert_frame_equal(history[a2.columns].astype(str), a2.astype(str))
+
+
+def test_term_column_survives_partitioning(streamed):
+    outdir, _ = streamed
+    history = read_history(outdir, terms=["2510"], columns=["Term", "term_key"])
+    assert history["Term"].astype(str).unique().tolist() == ["2510"]
+    assert history["term_key"].astype(str).unique().tolist() == ["2510"]
+
+
+def test_unchanged_source_is_skipped(streamed):
+    outdir, meta = streamed
+    assert stream_source(SOURCE, "A2", outdir, chunksize=5000) == meta
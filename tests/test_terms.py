@@ -0,0 +1,114 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from leosched.terms import TERMS, LoadedTerm, TermCache
+
+
+def _term(key):
+    return SimpleNamespace(key=key, nbytes=1, refresh_roster=lambda: False)
+
+
+def test_cold_load_does_not_block_hits():
+    release = threading.Event()
+    calls = []
+
+    def loader(term):
+        calls.append(term.key)
+        if term.key == "W25":
+            assert release.wait(5)
+        return _term(term.key)
+
+    cache = TermCache(loader=loader)
+    fa24 = cache.get("FA24")
+    results = {}
+    first = threading.Thread(target=lambda: results.setdefault("a", cache.get("W25")))
+    second = threading.Thread(target=lambda: results.setdefault("b", cache.get("W25")))
+    first.start()
+    while "W25" not in calls:
+        pass
+    second.start()
+
+    assert cache.get("FA24") is fa24  # answered while W25 is still loading
+    release.set()
+    first.join(5)
+    second.join(5)
+    assert results["a"] is results["b"]
+    assert calls == ["FA24", "W25"]
+    assert cache.stats()["loaded"] == ["FA24", "W25"]
+
+
+def test_failed_load_is_retried():
+    attempts = []
+
+    def loader(term):
+        attempts.append(term.key)
+        if len(attempts) == 1:
+            raise OSError("export missing")
+        return _term(term.key)
+
+    cache = TermCache(loader=loader, terms=TERMS)
+    with pytest.raises(OSError):
+        cache.get("W25")
+    assert cache.get("W25").key == "W25"
+    assert attempts == ["W25", "W25"]
+
+
+def _loaded(term):
+    frame = pd.DataFrame({"x": np.zeros(10, dtype=np.int8)})
+    return LoadedTerm(term, frame, frame, np.array([], dtype=np.int32), raw_bytes=0)
+
+
+def test_roster_refresh_does_not_block_hits_on_other_terms():
+    refreshing, release = threading.Event(), threading.Event()
+
+    def refresh():
+        refreshing.set()
+        assert release.wait(5)
+        return True
+
+    slow = SimpleNamespace(key="W25", nbytes=1, refresh_roster=refresh)
+    cache = TermCache(loader=lambda term: slow if term.key == "W25" else _term(term.key))
+    fa24 = cache.get("FA24")
+    cache._loaded["W25"] = slow
+    thread = threading.Thread(target=cache.get, args=("W25",))
+    thread.start()
+    assert refreshing.wait(5)
+    got = []
+    hit = threading.Thread(target=lambda: got.append(cache.get("FA24")))
+    hit.start()
+    hit.join(1)
+    assert got == [fa24]  # answered while W25 re-reads its roster
+    release.set()
+    thread.join(5)
+
+
+def test_extras_are_built_once_under_concurrent_requests():
+    loaded = _loaded(TERMS["W25"])
+    builds = []
+
+    def build():
+        builds.append(1)
+        time.sleep(0.05)
+        return np.zeros(4)
+
+    threads = [threading.Thread(target=loaded.cached, args=("index", build)) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(5)
+    assert len(builds) == 1
+
+
+def test_building_an_extra_rechecks_the_budget():
+    cache = TermCache(budget=10_000, loader=_loaded)
+    cache.get("FA24")
+    w25 = cache.get("W25")
+    assert cache.stats()["loaded"] == ["FA24", "W25"]
+    w25.cached("sort_orders", lambda: np.zeros(10_000, dtype=np.int8))
+    assert cache.stats()["loaded"] == ["W25"]
+    assert cache.evictions == 1
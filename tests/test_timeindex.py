@@ -0,0 +1,22 @@
+import numpy as np
+import pytest
+
+from leosched.schedule import DAY_BITS
+from leosched.terms import TERMS, load_term
+from leosched.timeindex import TimeIndex
+
+
+@pytest.fixture(scope="module")
+def schedule():
+    return load_term(TERMS["W25"]).schedule
+
+
+@pytest.mark.parametrize("window", [(0, 1), (480, 481), (600, 780), (1200, 1440), (0, 1440)])
+def test_overlapping_matches_a_scan(schedule, window):
+    index = TimeIndex(schedule)
+    start, end = schedule["Start Min"].to_numpy(), schedule["End Min"].to_numpy()
+    days = schedule["Days"].to_numpy()
+    lo, hi = window
+    for day, bit in DAY_BITS.items():
+        expected = np.flatnonzero((days & bit != 0) & (start >= 0) & (end >= 0) & (start < hi) & (end > lo))
+        np.testing.assert_array_equal(index.overlapping(day, lo, hi), expected)
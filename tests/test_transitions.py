@@ -0,0 +1,42 @@
+import numpy as np
+import pandas as pd
+
+from leosched.transitions import transitions
+
+SUMMER_I = ("2025-05-05", "2025-06-20")
+SUMMER_II = ("2025-06-25", "2025-08-15")
+
+
+def _meetings(*meetings):
+    """One Monday meeting per (start, end, building, dates) tuple, all taught by UM ID 7."""
+    start, end, bldg, dates = zip(*meetings)
+    return pd.DataFrame({
+        "Class Instr Name": "Doe,Jane",
+        "Class Instr ID": np.int32(7),
+        "Subject": pd.Categorical(["MATH"] * len(meetings)),
+        "Catalog Nbr": pd.Categorical([str(100 + i) for i in range(len(meetings))]),
+        "Days": np.uint8(1),
+        "Start Min": np.array(start, dtype=np.int16),
+        "End Min": np.array(end, dtype=np.int16),
+        "BldgPrediction": pd.Categorical(bldg),
+        "CampusPrediction": pd.Categorical(["Central Campus"] * len(meetings)),
+        "Meeting Start Dt": pd.to_datetime([d[0] for d in dates]),
+        "Meeting End Dt": pd.to_datetime([d[1] for d in dates]),
+    })
+
+
+def test_a_summer_ii_section_does_not_hide_the_summer_i_pair():
+    df = _meetings((540, 600, "MH", SUMMER_I), (570, 630, "USB", SUMMER_II), (605, 660, "CHEM", SUMMER_I))
+    out = transitions(df)
+    assert out[["From Bldg", "To Bldg", "Gap Min"]].values.tolist() == [["MH", "CHEM", 5]]
+
+
+def test_a_contained_meeting_does_not_hide_the_next_one():
+    df = _meetings((540, 720, "MH", SUMMER_I), (570, 600, "MH", SUMMER_I), (725, 780, "USB", SUMMER_I))
+    out = transitions(df)
+    assert out[["From Bldg", "To Bldg", "Ends", "Starts", "Gap Min"]].values.tolist() == [["MH", "USB", 720, 725, 5]]
+
+
+def test_sessions_that_never_overlap_are_not_paired():
+    df = _meetings((540, 600, "MH", SUMMER_I), (600, 660, "USB", SUMMER_II))
+    assert transitions(df, include_ok=True).empty
@@ -0,0 +1,66 @@
+import numpy as np
+import pandas as pd
+
+from leosched.buildings import BuildingRegistry
+from leosched.schedule import normalize
+from leosched.workload import contact_minutes, outliers, reconcile
+
+REGISTRY = BuildingRegistry.from_json({"MH": ["Mason Hall", "Central Campus"]})
+
+
+def _meeting(instr, subject="MATH", nbr="115", room="MH 1401", start="10:00 AM", end="11:00 AM",
+             days=("Mon", "Wed"), first="08/25/2025", last="12/05/2025"):
+    row = {"Subject": subject, "Catalog Nbr": nbr, "Class Instr ID": instr, "Facility ID": room,
+           "Meeting Time Start": start, "Meeting Time End": end, "Meeting Start Dt": first, "Meeting End Dt": last}
+    return row | {day: "Y" if day in days else "N" for day in ["Mon", "Tues", "Wed", "Thurs", "Fri"]}
+
+
+def _term():
+    rows = [
+        _meeting("1"),
+        _meeting("1", subject="STATS", nbr="115"),  # cross-listed: the same physical meeting
+        _meeting("1", room="MH 1200", start="1:00 PM", end="2:30 PM", days=("Fri",),
+                 first="08/25/2025", last="10/14/2025"),  # first half of the term only
+        _meeting("2", days=("Tues",)),
+        _meeting("3", days=("Mon",)),
+        _meeting("", days=("Mon",)),
+        _meeting("4", start="TBA", end="TBA"),
+    ]
+    return normalize(pd.DataFrame(rows), "A2", REGISTRY)
+
+
+def _roster():
+    return pd.DataFrame({
+        "UM ID": np.array([1, 1, 2, 3, 5], dtype=np.int32),
+        "Employee Last Name": ["Ng", "Ng", "Ortiz", "Park", "Quinn"],
+        "Employee First Name": ["Ann", "Ann", "Bo", "Cy", "Di"],
+        "Job Title": ["LEO Lecturer II", "LEO Lecturer I", "LEO Lecturer I", "LEO Lecturer I", "LEO Lecturer I"],
+        "Department Name": ["Math", "Statistics", "Math", "Math", "Math"],
+        "FTE": [0.5, 0.25, 1.0, 0.0, 1.0],
+        "Appointment Start Date": ["09/01/2020", "09/01/2025", None, None, None],
+        "Appointment End Date": [None, None, None, None, "04/30/2025"],
+    })
+
+
+def test_contact_minutes_count_cross_listings_once_and_weight_half_terms():
+    minutes = contact_minutes(_term())
+    assert minutes.index.tolist() == [1, 2, 3]  # no ID and untimed rows left out
+    one = minutes.loc[1]
+    assert (one["Meetings"], one["Cross-listed"]) == (2, 1)
+    assert one["Peak Weekly Min"] == 2 * 60 + 90
+    # the Friday meeting runs 51 of the term's 103 days
+    assert one["Avg Weekly Min"] == round(2 * 60 + 90 * 51 / 103)
+    assert minutes.loc[2, "Peak Weekly Min"] == minutes.loc[2, "Avg Weekly Min"] == 60
+
+
+def test_reconcile_sums_fte_and_flags_lecturers():
+    out = reconcile(_term(), _roster(), np.array([1, 2, 3, 5])).set_index("UM ID")
+    assert out.loc[1, "FTE"] == np.float32(0.75) and out.loc[1, "Appointments"] == 2
+    assert out.loc[1, "Department Name"] == "Math"  # from the larger appointment
+    assert out.loc[2, "Min per FTE"] == 60.0
+    assert out["Status"].to_dict() == {1: "ok", 2: "ok", 3: "no FTE", 5: "no meetings"}
+    assert out.loc[5, "Peak Weekly Min"] == 0 and np.isnan(out.loc[5, "Z"])
+
+    flagged = outliers(out.reset_index())
+    assert flagged["UM ID"].tolist() == [3]
+    assert sorted(outliers(out.reset_index(), unscheduled=True)["UM ID"]) == [3, 5]